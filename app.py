@@ -25,14 +25,16 @@ import plotly.graph_objects as go
 from streamlit_lottie import st_lottie
 import requests
 from dashboard.dashboard import DashboardManager
+from dashboard.exports import xlsx_file
 from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
 from config.job_roles import JOB_ROLES
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data,
-    init_database, save_ai_analysis_data,
+    init_database, queue_resume_data, queue_resume_with_analysis, queue_ai_analysis_data,
     get_ai_analysis_stats, reset_ai_analysis_stats, get_detailed_ai_analysis_stats,
     create_user, authenticate_user, get_user_profile, update_user_profile
 )
+from config.connection_pool import read_connection
+from config.auth import SESSION_TTL_SECONDS, create_session, revoke_session, rotate_session
 from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
 from utils.resume_analyzer import ResumeAnalyzer
@@ -50,6 +52,23 @@ st.set_page_config(
     layout="wide"
 )
 
+# Cookie carrying the signed session token (config/auth.py). It is kept
+# out of the URL so it cannot leak through history, Referer or shared links
+SESSION_COOKIE = 'workbridge_session'
+
+
+def set_session_cookie(token, max_age=SESSION_TTL_SECONDS):
+    """Store token in the session cookie from the browser; max_age 0 deletes it"""
+    import streamlit.components.v1 as components
+
+    components.html(f"""
+        <script>
+        const secure = window.parent.location.protocol === 'https:' ? '; Secure' : '';
+        window.parent.document.cookie =
+            '{SESSION_COOKIE}={token}; Max-Age={max_age}; Path=/; SameSite=Strict' + secure;
+        </script>
+    """, height=0)
+
 
 class ResumeApp:
     def __init__(self):
@@ -91,6 +110,23 @@ class ResumeApp:
         # Initialize database
         init_database()
 
+        # Resume a signed-in session after a refresh, swapping in a fresh token
+        token = st.context.cookies.get(SESSION_COOKIE)
+        if not st.session_state.authenticated and token:
+            user, token = rotate_session(token)
+            if user:
+                st.session_state.authenticated = True
+                st.session_state.user = user
+                st.session_state.session_token = token
+                st.session_state.session_cookie = (token, SESSION_TTL_SECONDS)
+            else:
+                st.session_state.session_cookie = ('', 0)
+
+        # Cookie changes are written on the run after login/logout, since
+        # those rerun straight away
+        if 'session_cookie' in st.session_state:
+            set_session_cookie(*st.session_state.pop('session_cookie'))
+
         # Load premium CSS and fonts
         st.markdown("""
             <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800;900&family=JetBrains+Mono:wght@300;400;500;600&display=swap" rel="stylesheet">
@@ -535,6 +571,10 @@ class ResumeApp:
                             if result["success"]:
                                 st.session_state.authenticated = True
                                 st.session_state.user = result["user"]
+                                # Lets a refresh resume without hashing again
+                                token = create_session(result["user"]["id"])
+                                st.session_state.session_token = token
+                                st.session_state.session_cookie = (token, SESSION_TTL_SECONDS)
                                 st.success(f"Welcome back, {result['user']['full_name'] or result['user']['username']}!")
                                 st.rerun()
                             else:
@@ -593,37 +633,14 @@ class ResumeApp:
             return None
 
     def export_to_excel(self):
-        """Export resume data to Excel"""
-        conn = get_database_connection()
-
-        # Get resume data with analysis
-        query = """
-            SELECT
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-
+        """Export resume data to Excel, as a rewound file object"""
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-
-            return output.getvalue()
+            # Rows stream from the cursor into the workbook; see dashboard.exports
+            with read_connection() as conn:
+                return xlsx_file(conn)
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
@@ -1107,9 +1124,9 @@ class ResumeApp:
                     resume_buffer = self.builder.generate_resume(resume_data)
                     if resume_buffer:
                         try:
-                            # Save resume data to database
+                            # Queue resume data for the background database writer
                             user_id = st.session_state.user['id'] if st.session_state.authenticated else None
-                            save_resume_data(resume_data, user_id)
+                            queue_resume_data(resume_data, user_id)
 
                             # Offer the resume for download
                             st.success("Resume generated successfully!")
@@ -2458,6 +2475,17 @@ class ResumeApp:
                         text = ""
                         try:
                             if uploaded_file.type == "application/pdf":
+                                # Turn other documents away before anything is saved; the
+                                # extraction is cached, so the analysis below reuses it
+                                try:
+                                    doc_type = self.analyzer.detect_pdf_type(uploaded_file)
+                                except Exception:
+                                    # Unreadable text layer; the extraction below reports it
+                                    doc_type = 'unknown'
+                                if doc_type not in ('resume', 'unknown'):
+                                    st.error(f"⚠️ This appears to be a {doc_type} document, not a resume!")
+                                    st.warning("Please upload a proper resume for ATS analysis.")
+                                    return
                                 try:
                                     text = self.analyzer.extract_text_from_pdf(uploaded_file)
                                 except Exception as pdf_error:
@@ -2524,11 +2552,10 @@ class ResumeApp:
                         # Save to database
                         try:
                             user_id = st.session_state.user['id'] if st.session_state.authenticated else None
-                            resume_id = save_resume_data(resume_data, user_id)
 
-                            # Save analysis data
+                            # Resume and analysis are written in one transaction by
+                            # the background database writer
                             analysis_data = {
-                                'resume_id': resume_id,
                                 'ats_score': analysis['ats_score'],
                                 'keyword_match_score': analysis['keyword_match']['score'],
                                 'format_score': analysis['format_score'],
@@ -2536,8 +2563,13 @@ class ResumeApp:
                                 'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
                                 'recommendations': ','.join(analysis['suggestions'])
                             }
-                            save_analysis_data(resume_id, analysis_data)
-                            st.success("Resume data saved successfully!")
+                            saved = queue_resume_with_analysis(resume_data, analysis_data, user_id)
+                            if saved.done():
+                                # Sync durability: the write has committed (or raises here)
+                                saved.result()
+                                st.success("Resume data saved successfully!")
+                            else:
+                                st.info("Resume data queued for saving.")
                         except Exception as e:
                             st.error(f"Error saving to database: {str(e)}")
                             print(f"Database error: {e}")
@@ -3038,41 +3070,11 @@ class ResumeApp:
 
                             st.plotly_chart(fig, use_container_width=True)
 
-                            # Add a timeline chart for analysis over time (mock
-                            # data for now)
+                            # Analyses per day over the last week
                             st.markdown("### Analysis Trend")
-                            st.info(
-                                "This is a conceptual visualization. To implement actual time-based analysis, additional data collection would be needed.")
-
-                            # Create mock data for timeline
-                            import datetime
-                            import numpy as np
-
-                            today = datetime.datetime.now()
-                            dates = [
-    (today -
-    datetime.timedelta(
-        days=i)).strftime('%Y-%m-%d') for i in range(7)]
-                            dates.reverse()
-
-                            # Generate some random data that sums to
-                            # total_analyses
-                            total = ai_stats["total_analyses"]
-                            if total > 7:
-                                values = np.random.dirichlet(
-                                    np.ones(7)) * total
-                                values = [round(v) for v in values]
-                                # Adjust to make sure sum equals total
-                                diff = total - sum(values)
-                                values[-1] += diff
-                            else:
-                                values = [0] * 7
-                                for i in range(total):
-                                    values[-(i % 7) - 1] += 1
-
                             trend_data = pd.DataFrame({
-                                'Date': dates,
-                                'Analyses': values
+                                'Date': [day["date"] for day in ai_stats["daily_trend"]],
+                                'Analyses': [day["count"] for day in ai_stats["daily_trend"]]
                             })
 
                             fig = px.line(
@@ -3247,6 +3249,13 @@ class ResumeApp:
                             </div>
                             """, unsafe_allow_html=True)
 
+                            # Percentiles from the same score statistics
+                            score_stats = ai_stats["score_stats"]
+                            col1, col2, col3 = st.columns(3)
+                            col1.metric("Median Score", score_stats["p50"])
+                            col2.metric("90th Percentile", score_stats["p90"])
+                            col3.metric("99th Percentile", score_stats["p99"])
+
                         # Display recent analyses if available
                         if ai_stats["recent_analyses"]:
                             st.markdown("""
@@ -3524,8 +3533,8 @@ class ResumeApp:
                                     resume_score = analysis_result.get(
                                         "resume_score", 0)
                                     
-                                    # Save to database
-                                    save_ai_analysis_data(
+                                    # Queue for the background database writer
+                                    queue_ai_analysis_data(
                                         None,  # No user_id needed
                                         {
                                             "model_used": selected_model,
@@ -4031,6 +4040,8 @@ class ResumeApp:
         col1, col2, col3 = st.columns([2, 1, 2])
         with col2:
             if st.button("Logout", use_container_width=True, type="secondary"):
+                revoke_session(st.session_state.pop('session_token', None))
+                st.session_state.session_cookie = ('', 0)
                 st.session_state.authenticated = False
                 st.session_state.user = None
                 st.rerun()
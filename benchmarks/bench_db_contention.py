@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for the resume database.
+
+Runs N writer threads inserting resumes and M reader threads running
+dashboard-style aggregate queries against a scratch database, and reports
+throughput for two strategies:
+
+  legacy  - a fresh sqlite3 connection per call, default rollback journal
+  pooled  - config.connection_pool: per-thread connections, WAL, tuned pragmas
+
+Usage:
+    python -m benchmarks.bench_db_contention --writers 4 --readers 4 --seconds 5
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from config.connection_pool import ConnectionManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resume_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    target_role TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS resume_analysis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_id INTEGER,
+    ats_score REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+INSERT_RESUME = "INSERT INTO resume_data (name, target_role) VALUES (?, ?)"
+INSERT_ANALYSIS = "INSERT INTO resume_analysis (resume_id, ats_score) VALUES (?, ?)"
+READ_QUERY = """
+    SELECT COUNT(DISTINCT rd.id), AVG(ra.ats_score)
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    WHERE rd.created_at >= date('now', '-7 days')
+"""
+
+
+def legacy_write(db_path, i):
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        cursor = conn.execute(INSERT_RESUME, (f"user{i}", "Engineer"))
+        conn.execute(INSERT_ANALYSIS, (cursor.lastrowid, i % 100))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def legacy_read(db_path):
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        conn.execute(READ_QUERY).fetchone()
+    finally:
+        conn.close()
+
+
+def make_pooled(db_path):
+    manager = ConnectionManager(db_path)
+
+    def write(_, i):
+        with manager.write() as conn:
+            cursor = conn.execute(INSERT_RESUME, (f"user{i}", "Engineer"))
+            conn.execute(INSERT_ANALYSIS, (cursor.lastrowid, i % 100))
+
+    def read(_):
+        with manager.read() as conn:
+            conn.execute(READ_QUERY).fetchone()
+
+    return manager, write, read
+
+
+def run(db_path, write, read, writers, readers, seconds):
+    stop = threading.Event()
+    counts = {'write': [0] * writers, 'read': [0] * readers, 'errors': 0}
+    lock = threading.Lock()
+
+    def writer_loop(slot):
+        i = 0
+        while not stop.is_set():
+            try:
+                write(db_path, i)
+                counts['write'][slot] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts['errors'] += 1
+            i += 1
+
+    def reader_loop(slot):
+        while not stop.is_set():
+            try:
+                read(db_path)
+                counts['read'][slot] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts['errors'] += 1
+
+    threads = [threading.Thread(target=writer_loop, args=(n,)) for n in range(writers)]
+    threads += [threading.Thread(target=reader_loop, args=(n,)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        'writes_per_sec': sum(counts['write']) / seconds,
+        'reads_per_sec': sum(counts['read']) / seconds,
+        'errors': counts['errors']
+    }
+
+
+def fresh_db(directory, name, wal):
+    path = os.path.join(directory, name)
+    conn = sqlite3.connect(path)
+    if wal:
+        conn.execute('PRAGMA journal_mode=WAL')
+    conn.executescript(SCHEMA)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_db = fresh_db(directory, 'legacy.db', wal=False)
+        legacy = run(legacy_db, legacy_write, legacy_read, args.writers, args.readers, args.seconds)
+
+        pooled_db = fresh_db(directory, 'pooled.db', wal=True)
+        manager, write, read = make_pooled(pooled_db)
+        pooled = run(pooled_db, write, read, args.writers, args.readers, args.seconds)
+        manager.close_all()
+
+    print(f"writers={args.writers} readers={args.readers} duration={args.seconds}s")
+    print(f"{'strategy':<10}{'writes/s':>12}{'reads/s':>12}{'errors':>8}")
+    for name, result in (('legacy', legacy), ('pooled', pooled)):
+        print(f"{name:<10}{result['writes_per_sec']:>12.1f}{result['reads_per_sec']:>12.1f}{result['errors']:>8}")
+
+
+if __name__ == '__main__':
+    main()
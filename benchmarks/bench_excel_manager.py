@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+ExcelManager save and lookup cost as the store grows.
+
+  legacy   - the previous store: pd.read_excel, concat one row, rewrite
+             the whole workbook (run up to --legacy-rows only; it is O(n)
+             per save)
+  journal  - utils/excel_manager.py (append-only JSON Lines journal with
+             a per-user offset index)
+
+Save latency is sampled over --sample saves at each size in --rows, and
+get_user_resumes() is timed for one user once the store is full.
+
+Usage:
+    python -m benchmarks.bench_excel_manager --rows 1000,10000,100000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from utils.excel_manager import ExcelManager
+
+CONTENT = 'Experienced engineer. ' * 20
+ANALYSIS = {'ats_score': 72, 'missing_skills': ['Docker', 'Kubernetes']}
+
+
+def legacy_save(path, user_id):
+    try:
+        df = pd.read_excel(path)
+    except FileNotFoundError:
+        df = pd.DataFrame()
+    new_data = {
+        'user_id': user_id, 'job_role': 'Engineer', 'content': CONTENT,
+        'analysis_data': str(ANALYSIS), 'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
+    df.to_excel(path, index=False)
+
+
+def sample(save, count, start):
+    begin = time.perf_counter()
+    for i in range(count):
+        save(start + i)
+    return (time.perf_counter() - begin) / count * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='1000,10000,100000')
+    parser.add_argument('--legacy-rows', type=int, default=1000)
+    parser.add_argument('--sample', type=int, default=50)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='workbridge-bench-')
+    manager = ExcelManager(os.path.join(directory, 'journal'), os.path.join(directory, 'resume_data.xlsx'))
+    legacy_path = os.path.join(directory, 'legacy.xlsx')
+
+    def journal_save(i):
+        manager.save_resume_data(i % 500, 'Engineer', CONTENT, ANALYSIS)
+
+    print(f"{'rows':>8}{'legacy ms/save':>16}{'journal ms/save':>17}")
+    saved = legacy_saved = 0
+    for target in (int(size) for size in args.rows.split(',')):
+        while saved < target - args.sample:
+            journal_save(saved)
+            saved += 1
+        journal_ms = sample(journal_save, args.sample, saved)
+        saved += args.sample
+
+        legacy_ms = '-'
+        if target <= args.legacy_rows:
+            while legacy_saved < target - args.sample:
+                legacy_save(legacy_path, legacy_saved % 500)
+                legacy_saved += 1
+            legacy_ms = f"{sample(lambda i: legacy_save(legacy_path, i % 500), args.sample, legacy_saved):.2f}"
+            legacy_saved += args.sample
+        print(f"{target:>8}{legacy_ms:>16}{journal_ms:>17.3f}")
+
+    fresh = ExcelManager(manager.journal_dir, manager.excel_file)
+    start = time.perf_counter()
+    rows = len(fresh.get_user_resumes(7))
+    first_lookup = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    fresh.get_user_resumes(7)
+    lookup = (time.perf_counter() - start) * 1000
+    print(f"get_user_resumes: {rows} rows, {first_lookup:.1f} ms (loads index), then {lookup:.1f} ms")
+
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
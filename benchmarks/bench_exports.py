@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Memory and latency of the admin dashboard exports.
+
+  legacy  - pd.read_sql_query of the full join, then DataFrame.to_csv /
+            to_json / ExcelWriter with per-column width measurement
+  stream  - dashboard/exports.py (chunked cursor, incremental CSV and
+            JSON Lines, xlsxwriter constant_memory)
+
+The scratch database is grown to each size in --rows and every export is
+run with tracemalloc enabled. Reported: peak traced memory, total time, and
+for the streaming CSV/JSONL exporters the time until the first chunk.
+
+Usage:
+    python -m benchmarks.bench_exports --rows 2000,10000,40000
+"""
+
+import argparse
+import io
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+import pandas as pd  # noqa: E402
+
+from benchmarks.bench_ingest import make_record  # noqa: E402
+from config.connection_pool import get_connection_manager  # noqa: E402
+from config.database import get_database_connection, init_database, save_many  # noqa: E402
+from dashboard.exports import (  # noqa: E402
+    EXPORT_QUERY, JSON_EXPORT_QUERY, iter_csv, iter_jsonl, write_xlsx
+)
+
+
+def legacy_csv(conn):
+    return pd.read_sql_query(EXPORT_QUERY, conn).to_csv(index=False).encode('utf-8')
+
+
+def legacy_json(conn):
+    return pd.read_sql_query(JSON_EXPORT_QUERY, conn).to_json(orient='records', date_format='iso')
+
+
+def legacy_excel(conn):
+    df = pd.read_sql_query(EXPORT_QUERY, conn)
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='Resume Data', index=False)
+        worksheet = writer.sheets['Resume Data']
+        for i, col in enumerate(df.columns):
+            width = max(df[col].astype(str).apply(len).max(), len(str(col))) + 2
+            worksheet.set_column(i, i, min(width, 50))
+    return output.getvalue()
+
+
+def drain(chunks):
+    # Consume like a streaming response would: only one chunk alive at a time
+    first = None
+    start = time.perf_counter()
+    for _ in chunks:
+        if first is None:
+            first = time.perf_counter() - start
+    return first
+
+
+def stream_excel(conn):
+    with tempfile.TemporaryFile() as output:
+        write_xlsx(conn, output)
+
+
+EXPORTS = {
+    ('legacy', 'csv'): legacy_csv,
+    ('legacy', 'json'): legacy_json,
+    ('legacy', 'xlsx'): legacy_excel,
+    ('stream', 'csv'): lambda conn: drain(iter_csv(conn)),
+    ('stream', 'jsonl'): lambda conn: drain(iter_jsonl(conn)),
+    ('stream', 'xlsx'): stream_excel
+}
+
+
+def measure(export, conn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = export(conn)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    first = result if isinstance(result, float) else None
+    return peak / 2**20, elapsed, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='2000,10000,40000')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    init_database()
+    conn = get_database_connection()
+    loaded = 0
+
+    print(f"{'rows':>8} {'engine':<8}{'format':<8}{'peak MiB':>10}{'seconds':>10}{'first ms':>10}")
+    for target in (int(size) for size in args.rows.split(',')):
+        while loaded < target:
+            batch = min(1000, target - loaded)
+            save_many([make_record(rng, loaded + i) for i in range(batch)])
+            loaded += batch
+        for (engine, fmt), export in EXPORTS.items():
+            peak, elapsed, first = measure(export, conn)
+            first_ms = f"{first * 1000:.1f}" if first is not None else '-'
+            print(f"{target:>8} {engine:<8}{fmt:<8}{peak:>10.1f}{elapsed:>10.2f}{first_ms:>10}")
+
+    conn.close()
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Text extraction throughput for AIResumeAnalyzer on a synthetic corpus.
+
+Builds --files documents in memory (PDFs of 1-3 pages, plus DOCX files in
+a --docx-share of the corpus) and extracts every one with:
+
+  tempfile  - the old path: copy the upload into a NamedTemporaryFile on
+              disk, open it by name, unlink it afterwards
+  memory    - AIResumeAnalyzer's extractors, which read a BytesIO
+
+The extraction cache is bypassed so every file is really extracted.
+Reports files/s and the bytes this process wrote to storage
+(/proc/self/io, Linux only) for each mode.
+
+Usage:
+    python -m benchmarks.bench_extraction --files 1000
+"""
+
+import argparse
+import io
+import os
+import random
+import tempfile
+import time
+
+import docx
+import pdfplumber
+from reportlab.pdfgen import canvas
+
+from utils.ai_resume_analyzer import AIResumeAnalyzer
+
+LINES = [
+    "Experience: Senior Python Developer at Acme, 2019-2024",
+    "Built data pipelines in Python, SQL and Airflow",
+    "Education: B.Sc. Computer Science",
+    "Skills: Python, SQL, Docker, Kubernetes, AWS, React",
+    "Projects: Resume analyzer with Streamlit and SQLite",
+]
+
+
+def make_pdf(rng, pages):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        for i in range(30):
+            pdf.drawString(72, 760 - 22 * i, f"{rng.choice(LINES)} ({page}.{i})")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def make_docx(rng):
+    document = docx.Document()
+    for _ in range(40):
+        document.add_paragraph(rng.choice(LINES))
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def tempfile_pdf(data):
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
+        temp_file.write(data)
+        temp_path = temp_file.name
+    try:
+        text = ""
+        with pdfplumber.open(temp_path) as pdf:
+            for page in pdf.pages:
+                text += (page.extract_text() or "") + "\n"
+        return text.strip()
+    finally:
+        os.unlink(temp_path)
+
+
+def tempfile_docx(data):
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
+        temp_file.write(data)
+        temp_path = temp_file.name
+    try:
+        return "".join(para.text + "\n" for para in docx.Document(temp_path).paragraphs)
+    finally:
+        os.unlink(temp_path)
+
+
+def written_bytes():
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('write_bytes:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def run(corpus, extract_pdf, extract_docx):
+    before = written_bytes()
+    start = time.perf_counter()
+    for kind, data in corpus:
+        text = extract_pdf(data) if kind == 'pdf' else extract_docx(data)
+        assert text, "extraction returned no text"
+    elapsed = time.perf_counter() - start
+    after = written_bytes()
+    return elapsed, (after - before) if before is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=1000)
+    parser.add_argument('--docx-share', type=float, default=0.25)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    corpus = [
+        ('docx', make_docx(rng)) if rng.random() < args.docx_share else ('pdf', make_pdf(rng, rng.randint(1, 3)))
+        for _ in range(args.files)
+    ]
+    size = sum(len(data) for _, data in corpus)
+    print(f"files={args.files} pdf={sum(kind == 'pdf' for kind, _ in corpus)} corpus={size / 1e6:.1f} MB")
+
+    analyzer = AIResumeAnalyzer()
+    print(f"{'mode':<10}{'seconds':>10}{'files/s':>10}{'written':>12}")
+    for mode, extract_pdf, extract_docx in (
+        ('tempfile', tempfile_pdf, tempfile_docx),
+        ('memory', analyzer._extract_pdf_text, analyzer._extract_docx_text),
+    ):
+        elapsed, written = run(corpus, extract_pdf, extract_docx)
+        written = f"{written / 1e6:.1f} MB" if written is not None else 'n/a'
+        print(f"{mode:<10}{elapsed:>10.1f}{args.files / elapsed:>10.1f}{written:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Ingest throughput for the resume save paths in config/database.py.
+
+Compares, on a scratch database:
+
+  separate  - save_resume_data() then save_analysis_data() (two commits)
+  combined  - save_resume_with_analysis() (one commit per upload)
+  bulk      - save_many() in batches of --batch-size (one commit per batch)
+
+Usage:
+    python -m benchmarks.bench_ingest --rows 5000 --batch-size 1000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from config.connection_pool import get_connection_manager  # noqa: E402
+from config.database import (  # noqa: E402
+    init_database, save_analysis_data, save_many, save_resume_data,
+    save_resume_with_analysis
+)
+
+SKILLS = ['Python', 'Java', 'SQL', 'AWS', 'Docker', 'React', 'Agile', 'Leadership', 'Git', 'Kubernetes']
+
+
+def make_record(rng, i):
+    resume = {
+        'personal_info': {
+            'full_name': f'Candidate {i}',
+            'email': f'candidate{i}@example.com',
+            'phone': '555-0100'
+        },
+        'summary': 'Engineer with experience building data products.',
+        'target_role': 'Software Engineer',
+        'target_category': 'Software Development and Engineering',
+        'experience': [{'company': 'Acme', 'position': 'Engineer'}],
+        'skills': rng.sample(SKILLS, 5)
+    }
+    analysis = {
+        'ats_score': rng.uniform(30, 95),
+        'keyword_match_score': rng.uniform(20, 90),
+        'format_score': rng.uniform(50, 100),
+        'section_score': rng.uniform(50, 100),
+        'missing_skills': 'Docker,Kubernetes',
+        'recommendations': 'Add metrics to experience'
+    }
+    return resume, analysis
+
+
+def bench_separate(records, batch_size):
+    for resume, analysis in records:
+        resume_id = save_resume_data(resume)
+        save_analysis_data(resume_id, analysis)
+
+
+def bench_combined(records, batch_size):
+    for resume, analysis in records:
+        save_resume_with_analysis(resume, analysis)
+
+
+def bench_bulk(records, batch_size):
+    for start in range(0, len(records), batch_size):
+        save_many(records[start:start + batch_size])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    records = [make_record(rng, i) for i in range(args.rows)]
+    init_database()
+
+    print(f"rows={args.rows} batch_size={args.batch_size}")
+    print(f"{'path':<10}{'seconds':>10}{'rows/s':>12}")
+    for name, bench in (('separate', bench_separate), ('combined', bench_combined), ('bulk', bench_bulk)):
+        start = time.perf_counter()
+        bench(records, args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10}{elapsed:>10.2f}{args.rows / elapsed:>12.0f}")
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
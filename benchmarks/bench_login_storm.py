@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Login storm: logins/sec and page latency while many users log in at once.
+
+--login-threads threads call authenticate_user() (100,000-iteration
+PBKDF2) in a loop while --page-threads threads simulate other sessions'
+reruns: resume_session() with a signed token plus a dashboard query.
+This runs once with hashing on the calling thread (WORKBRIDGE_HASH_WORKERS=0,
+the old behaviour) and once with the bounded hashing pool in config/auth.py.
+
+Usage:
+    python -m benchmarks.bench_login_storm --login-threads 32 --seconds 10
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+os.environ['WORKBRIDGE_SESSION_SECRET_FILE'] = os.path.join(DIRECTORY, 'session_secret')
+
+import config.auth as auth  # noqa: E402
+from config.auth import create_session, resume_session  # noqa: E402
+from config.connection_pool import get_connection_manager  # noqa: E402
+from config.database import authenticate_user, create_user, get_resume_stats, init_database  # noqa: E402
+
+PASSWORD = 'correct horse battery'
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def storm(users, tokens, login_threads, page_threads, seconds):
+    stop = threading.Event()
+    logins, busy, latencies = [0], [0], []
+    lock = threading.Lock()
+
+    def login(i):
+        username = users[i % len(users)]
+        while not stop.is_set():
+            result = authenticate_user(username, PASSWORD)
+            with lock:
+                if result['success']:
+                    logins[0] += 1
+                else:
+                    busy[0] += 1
+                    time.sleep(0.05)
+
+    def page(i):
+        # A rerun arrives every 10 ms; latency runs from its arrival, so
+        # time spent waiting to be scheduled counts too
+        token = tokens[i % len(tokens)]
+        arrival = time.perf_counter()
+        while not stop.is_set():
+            resume_session(token)
+            get_resume_stats()
+            latencies.append((time.perf_counter() - arrival) * 1000)
+            arrival = max(arrival + 0.01, time.perf_counter())
+            time.sleep(max(0, arrival - time.perf_counter()))
+
+    threads = [threading.Thread(target=login, args=(i,)) for i in range(login_threads)]
+    threads += [threading.Thread(target=page, args=(i,)) for i in range(page_threads)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    ordered = sorted(latencies)
+    return (logins[0] / seconds, busy[0], statistics.median(ordered),
+            ordered[int(len(ordered) * 0.99)], len(ordered))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--login-threads', type=int, default=32)
+    parser.add_argument('--page-threads', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    init_database()
+    users = [f'user{i}' for i in range(args.users)]
+    for username in users:
+        create_user(username, f'{username}@example.com', PASSWORD)
+    tokens = [create_session(authenticate_user(username, PASSWORD)['user']['id']) for username in users]
+
+    print(f"authenticate_user: {timed(lambda: authenticate_user(users[0], PASSWORD), 10):.2f} ms")
+    print(f"resume_session:    {timed(lambda: resume_session(tokens[0]), 1000):.3f} ms")
+    print(f"hash workers={auth.HASH_WORKERS} cpus={os.cpu_count()} login threads={args.login_threads} "
+          f"page threads={args.page_threads}")
+    print(f"{'mode':<10}{'logins/s':>10}{'busy':>8}{'page p50':>10}{'page p99':>10}{'pages':>8}")
+    for mode, workers in (('inline', 0), ('pool', auth.HASH_WORKERS)):
+        auth.HASH_WORKERS = workers
+        rate, busy, p50, p99, pages = storm(users, tokens, args.login_threads, args.page_threads, args.seconds)
+        print(f"{mode:<10}{rate:>10.1f}{busy:>8}{p50:>9.1f}ms{p99:>8.1f}ms{pages:>8}")
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Writer latency while the retention job runs (config/maintenance.py).
+
+Seeds a scratch database with --rows resumes spread evenly over the last
+two years, then runs run_maintenance() with a one-year horizon while a
+writer thread keeps saving resumes. Reports rows archived, live and
+archive sizes before and after, whether the daily_metrics rollup still
+adds up, and the writer's save latency with and without maintenance.
+
+Usage:
+    python -m benchmarks.bench_maintenance --rows 50000 --slice-ms 50
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from config.connection_pool import DB_PATH, get_connection_manager, read_connection, write_connection  # noqa: E402
+from config.database import init_database, save_many, save_resume_with_analysis  # noqa: E402
+from config.maintenance import get_archive_stats, run_maintenance  # noqa: E402
+from config.migrations import rebuild_daily_metrics  # noqa: E402
+from benchmarks.bench_ingest import make_record  # noqa: E402
+
+ARCHIVE_PATH = os.path.join(DIRECTORY, 'resume_archive.db')
+HISTORY_DAYS = 730
+
+
+def live_stats():
+    with read_connection() as conn:
+        page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+        size = conn.execute('PRAGMA page_count').fetchone()[0] * page_size
+        resumes = conn.execute('SELECT COUNT(*) FROM resume_data').fetchone()[0]
+        rollup = conn.execute('SELECT SUM(resume_count) FROM daily_metrics').fetchone()[0]
+    return size, resumes, rollup
+
+
+def writer(stop, latencies, rng):
+    i = 0
+    while not stop.is_set():
+        resume, analysis = make_record(rng, 10 ** 9 + i)
+        start = time.perf_counter()
+        save_resume_with_analysis(resume, analysis)
+        latencies.append((time.perf_counter() - start) * 1000)
+        i += 1
+        time.sleep(0.005)
+
+
+def run_writer(seconds_or_event, rng):
+    """Collect writer latencies for a fixed time or until the event is set"""
+    latencies, stop = [], threading.Event()
+    thread = threading.Thread(target=writer, args=(stop, latencies, rng))
+    thread.start()
+    if isinstance(seconds_or_event, threading.Event):
+        seconds_or_event.wait()
+    else:
+        time.sleep(seconds_or_event)
+    stop.set()
+    thread.join()
+    return latencies
+
+
+def describe(latencies):
+    ordered = sorted(latencies)
+    return (f"n={len(ordered)} p50={statistics.median(ordered):.1f}ms "
+            f"p99={ordered[int(len(ordered) * 0.99)]:.1f}ms max={ordered[-1]:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--slice-ms', type=float, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    init_database()
+    for start in range(0, args.rows, 5000):
+        save_many([make_record(rng, i) for i in range(start, min(start + 5000, args.rows))])
+    with write_connection() as conn:
+        # Spread the history evenly over HISTORY_DAYS and recompute the rollup
+        conn.execute(f"UPDATE resume_data SET created_at = datetime('now', '-' || (id % {HISTORY_DAYS}) || ' days')")
+        conn.execute('''UPDATE resume_analysis SET created_at =
+            (SELECT created_at FROM resume_data WHERE id = resume_analysis.resume_id)''')
+        rebuild_daily_metrics(conn.cursor())
+
+    size, resumes, rollup = live_stats()
+    print(f"before: live={size / 1e6:.1f} MB resumes={resumes} rollup total={rollup}")
+    print(f"writer, idle:        {describe(run_writer(2, rng))}")
+
+    done, summary = threading.Event(), {}
+
+    def maintenance():
+        start = time.perf_counter()
+        try:
+            summary.update(run_maintenance(days=365, archive_path=ARCHIVE_PATH, slice_ms=args.slice_ms))
+        finally:
+            summary['seconds'] = time.perf_counter() - start
+            done.set()
+
+    threading.Thread(target=maintenance).start()
+    busy = run_writer(done, rng)
+    print(f"writer, maintenance: {describe(busy)}")
+
+    size, resumes_after, rollup_after = live_stats()
+    archive = get_archive_stats(ARCHIVE_PATH)
+    written = resumes_after + archive['resumes'] - resumes
+    print(f"maintenance: {summary['seconds']:.1f}s archived={summary['archived']} "
+          f"pages released={summary['pages_released']}")
+    print(f"after:  live={size / 1e6:.1f} MB resumes={resumes_after} "
+          f"archive={archive['size_bytes'] / 1e6:.1f} MB ({archive['resumes']} resumes)")
+    print(f"rollup total {rollup_after} == {rollup} + {written} new: {rollup_after == rollup + written}")
+
+    get_connection_manager(DB_PATH).close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Before/after timings for the index migration (config/migrations.py, v2).
+
+Builds a scratch database at schema version 1, fills it with --rows
+resumes (each with one analysis and one AI analysis), times the dashboard's
+hot queries, applies the remaining migrations and times them again.
+
+Usage:
+    python -m benchmarks.bench_migrations --rows 100000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from config.connection_pool import get_connection_manager, read_connection, write_connection  # noqa: E402
+from config.database import init_database  # noqa: E402
+
+HOT_QUERIES = {
+    'metrics_this_week': ("""
+        SELECT COUNT(DISTINCT rd.id), AVG(ra.ats_score), AVG(ra.keyword_match_score)
+        FROM resume_data rd
+        LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+        WHERE rd.created_at >= date('now', '-7 days')
+    """, ()),
+    'submissions_today': ("""
+        SELECT COUNT(*) FROM resume_data WHERE created_at >= date('now')
+    """, ()),
+    'analysis_for_resume': ("""
+        SELECT ats_score FROM resume_analysis WHERE resume_id = ?
+    """, (12345,)),
+    'ai_daily_trend': ("""
+        SELECT DATE(created_at), COUNT(*) FROM ai_analysis
+        WHERE created_at >= date('now', '-7 days')
+        GROUP BY DATE(created_at)
+    """, ()),
+    'ai_role_lookup': ("""
+        SELECT COUNT(*) FROM ai_analysis WHERE job_role = ?
+    """, ('Data Scientist',)),
+    'recent_ai_analyses': ("""
+        SELECT model_used, resume_score FROM ai_analysis ORDER BY created_at DESC LIMIT 5
+    """, ()),
+}
+
+ROLES = ['Software Engineer', 'Data Scientist', 'Product Manager', 'DevOps Engineer', 'UI Designer']
+MODELS = ['Google Gemini', 'Anthropic Claude', 'OpenRouter']
+
+
+def populate(rows):
+    rng = random.Random(42)
+    now = time.time()
+
+    def timestamp():
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(now - rng.uniform(0, 365 * 86400)))
+
+    with write_connection() as conn:
+        conn.executemany(
+            'INSERT INTO resume_data (id, name, email, phone, target_role, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+            ((i, f'user{i}', f'user{i}@example.com', '000', rng.choice(ROLES), timestamp())
+             for i in range(1, rows + 1))
+        )
+        conn.executemany(
+            'INSERT INTO resume_analysis (resume_id, ats_score, keyword_match_score, created_at) VALUES (?, ?, ?, ?)',
+            ((i, rng.uniform(0, 100), rng.uniform(0, 100), timestamp()) for i in range(1, rows + 1))
+        )
+        conn.executemany(
+            'INSERT INTO ai_analysis (resume_id, model_used, resume_score, job_role, created_at) VALUES (?, ?, ?, ?, ?)',
+            ((i, rng.choice(MODELS), rng.randint(0, 100), rng.choice(ROLES), timestamp()) for i in range(1, rows + 1))
+        )
+
+
+def time_queries(repeat):
+    results = {}
+    with read_connection() as conn:
+        for name, (sql, params) in HOT_QUERIES.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(sql, params).fetchall()
+            results[name] = (time.perf_counter() - start) / repeat * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    init_database(target_version=1)
+    populate(args.rows)
+    before = time_queries(args.repeat)
+
+    start = time.perf_counter()
+    init_database()
+    migrate_ms = (time.perf_counter() - start) * 1000
+    after = time_queries(args.repeat)
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+    print(f"rows={args.rows} repeat={args.repeat} migration={migrate_ms:.0f} ms")
+    print(f"{'query':<24}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in HOT_QUERIES:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<24}{before[name]:>12.2f}{after[name]:>12.2f}{speedup:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
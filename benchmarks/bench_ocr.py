@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Wall-clock time of OCR on an image-only PDF, sequential vs. parallel.
+
+Renders --pages pages of text into images with PIL and saves them as a
+PDF with no text layer, then OCRs it with utils.ocr.ocr_pdf() using one
+worker and with each pool size in --workers. The first parallel run also
+pays for starting the pool, so every mode is run once before it is timed.
+Needs tesseract and poppler on PATH.
+
+Usage:
+    python -m benchmarks.bench_ocr --pages 8 --workers 2 4
+"""
+
+import argparse
+import io
+import time
+
+from PIL import Image, ImageDraw
+
+from utils.ocr import OCR_WORKERS, ocr_pdf
+
+LINES = [
+    "Experience: Senior Python Developer at Acme, 2019-2024",
+    "Built data pipelines in Python, SQL and Airflow",
+    "Education: B.Sc. Computer Science",
+    "Skills: Python, SQL, Docker, Kubernetes, AWS, React",
+]
+
+
+def make_image_pdf(pages):
+    images = []
+    for page in range(pages):
+        image = Image.new('L', (1700, 2200), 255)
+        draw = ImageDraw.Draw(image)
+        for i in range(40):
+            draw.text((100, 100 + 50 * i), f"{LINES[i % len(LINES)]} ({page}.{i})", fill=0)
+        images.append(image)
+    buffer = io.BytesIO()
+    images[0].save(buffer, format='PDF', save_all=True, append_images=images[1:], resolution=200)
+    return buffer.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=8)
+    parser.add_argument('--workers', type=int, nargs='+', default=[OCR_WORKERS])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pdf_bytes = make_image_pdf(args.pages)
+    print(f"pages={args.pages} pdf={len(pdf_bytes) / 1e6:.1f} MB")
+    print(f"{'workers':<10}{'seconds':>10}{'pages/s':>10}{'speedup':>10}")
+    baseline = None
+    for workers in [1] + [w for w in args.workers if w > 1]:
+        ocr_pdf(pdf_bytes, max_pages=args.pages, workers=workers)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            text = ocr_pdf(pdf_bytes, max_pages=args.pages, workers=workers)
+            assert text, "OCR returned no text"
+        elapsed = (time.perf_counter() - start) / args.repeat
+        baseline = baseline or elapsed
+        print(f"{workers:<10}{elapsed:>10.2f}{args.pages / elapsed:>10.1f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
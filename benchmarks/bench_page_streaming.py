@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Cost of an oversized PDF upload with and without extraction budgets.
+
+Builds one --pages page PDF and times:
+
+  unbounded  - extract_pdf_text() with every budget disabled
+  budgeted   - extract_pdf_text() with the default page, character and
+               time budgets
+  detect     - detect_document_type() over iter_pdf_pages(), which stops
+               reading once it has enough text
+  full+detect - full extraction followed by detect_document_type(), what
+               callers had to do before
+
+Usage:
+    python -m benchmarks.bench_page_streaming --pages 300
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.bench_extraction import make_pdf
+from utils.pdf_router import extract_pdf_text, iter_pdf_pages
+from utils.resume_analyzer import ResumeAnalyzer
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=300)
+    args = parser.parse_args()
+
+    data = make_pdf(random.Random(7), args.pages)
+    analyzer = ResumeAnalyzer()
+    print(f"pages={args.pages} pdf={len(data) / 1e6:.1f} MB")
+    print(f"{'mode':<14}{'seconds':>10}{'chars':>10}")
+    for mode, fn in (
+        ('unbounded', lambda: extract_pdf_text(data, record=False, max_pages=0, max_chars=0, seconds=0)[0]),
+        ('budgeted', lambda: extract_pdf_text(data, record=False)[0]),
+        ('detect', lambda: analyzer.detect_document_type(iter_pdf_pages(data))),
+        ('full+detect', lambda: analyzer.detect_document_type(
+            extract_pdf_text(data, record=False, max_pages=0, max_chars=0, seconds=0)[0])),
+    ):
+        seconds, result = timed(fn)
+        print(f"{mode:<14}{seconds:>10.2f}{len(result) if mode in ('unbounded', 'budgeted') else result:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Incremental (id-watermark) Parquet refresh versus a full re-export.
+
+A scratch database is seeded with --rows resumes (and analyses) and
+exported once with config/parquet_export.py. --new more resumes are then
+added and the snapshot is brought up to date two ways:
+
+  watermark - export_parquet on the existing directory, which only reads
+              rows above each table's highest exported id
+  full      - export_parquet into an empty directory, re-reading and
+              re-writing every row
+
+A refresh with nothing new is timed too, since that is the common case
+when the export is run on a schedule. Rows written include the
+daily_metrics rollup, which every refresh rewrites whole.
+
+Usage:
+    python -m benchmarks.bench_parquet_export --rows 100000 --new 1000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from benchmarks.bench_ingest import make_record  # noqa: E402
+from config.connection_pool import get_connection_manager  # noqa: E402
+from config.database import init_database, save_many  # noqa: E402
+from config.parquet_export import export_parquet  # noqa: E402
+
+
+def seed(rng, start, count):
+    for first in range(start, start + count, 5000):
+        save_many([make_record(rng, i) for i in range(first, min(first + 5000, start + count))])
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--new', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    init_database()
+    seed(rng, 0, args.rows)
+
+    incremental = os.path.join(DIRECTORY, 'incremental')
+    initial_seconds, _ = timed(lambda: export_parquet(incremental))
+    noop_seconds, noop = timed(lambda: export_parquet(incremental))
+
+    seed(rng, args.rows, args.new)
+    watermark_seconds, watermark = timed(lambda: export_parquet(incremental))
+    full_seconds, full = timed(lambda: export_parquet(os.path.join(DIRECTORY, 'full')))
+
+    print(f"rows={args.rows} new={args.new} initial export={initial_seconds:.2f}s")
+    print(f"{'refresh':<12}{'seconds':>10}{'rows written':>14}")
+    for name, seconds, written in (('no-op', noop_seconds, noop),
+                                   ('watermark', watermark_seconds, watermark),
+                                   ('full', full_seconds, full)):
+        print(f"{name:<12}{seconds:>10.3f}{sum(written.values()):>14}")
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
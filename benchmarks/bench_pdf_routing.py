@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+PDF extraction time with the old fixed chain vs. the probe-driven router.
+
+Builds --files PDFs in memory: text PDFs of 1-3 pages, plus image-only
+PDFs (no text layer) in an --image-share of the corpus. Each is extracted
+with:
+
+  chain   - the old AIResumeAnalyzer order: pdfplumber, then pypdf if
+            that found nothing, then OCR
+  router  - utils.pdf_router.extract_pdf_text()
+
+OCR is replaced by a stub that returns a fixed string, so the numbers
+show what each strategy spends before it gets to OCR. Reports files/s
+and how many documents each router extractor handled.
+
+Usage:
+    python -m benchmarks.bench_pdf_routing --files 500
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+from benchmarks.bench_extraction import make_pdf
+from benchmarks.bench_ocr import make_image_pdf
+from utils.extraction import join_pages
+from utils.pdf_router import extract_pdf_text, pdfplumber_pages
+
+OCR_TEXT = "text recognised by OCR " * 10
+
+
+def fake_ocr(pdf_bytes):
+    return OCR_TEXT
+
+
+def chain(pdf_bytes):
+    import io
+
+    import pypdf
+
+    text = join_pages(pdfplumber_pages(pdf_bytes))
+    if text:
+        return text
+    reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+    text = "\n".join(page.extract_text() or "" for page in reader.pages).strip()
+    return text or fake_ocr(pdf_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=500)
+    parser.add_argument('--image-share', type=float, default=0.2)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    corpus = [
+        make_image_pdf(1) if rng.random() < args.image_share else make_pdf(rng, rng.randint(1, 3))
+        for _ in range(args.files)
+    ]
+    print(f"files={args.files} corpus={sum(map(len, corpus)) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    for data in corpus:
+        assert chain(data)
+    chain_seconds = time.perf_counter() - start
+
+    routes = Counter()
+    probe_seconds = 0.0
+    start = time.perf_counter()
+    for data in corpus:
+        text, route = extract_pdf_text(data, ocr=fake_ocr, record=False)
+        assert text
+        routes[route['extractor']] += 1
+        probe_seconds += route['probe']['seconds']
+    router_seconds = time.perf_counter() - start
+
+    print(f"{'mode':<10}{'seconds':>10}{'files/s':>10}")
+    print(f"{'chain':<10}{chain_seconds:>10.1f}{args.files / chain_seconds:>10.1f}")
+    print(f"{'router':<10}{router_seconds:>10.1f}{args.files / router_seconds:>10.1f}")
+    print(f"probe total {probe_seconds:.2f}s; routed to " + ", ".join(f"{k}={v}" for k, v in routes.items()))
+
+
+if __name__ == '__main__':
+    main()
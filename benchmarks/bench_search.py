@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Full-text resume search latency (config/search.py).
+
+Seeds a scratch database with --rows synthetic resumes through save_many
+(so the FTS5 triggers do the indexing), then times search_resumes() for
+selective, phrase, prefix and common queries and compares them with the
+LIKE scan admins would otherwise need.
+
+Usage:
+    python -m benchmarks.bench_search --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from config.connection_pool import get_connection_manager, read_connection  # noqa: E402
+from config.database import init_database, save_many  # noqa: E402
+from config.search import search_resumes  # noqa: E402
+
+CITIES = ['Bangalore', 'Pune', 'Hyderabad', 'Chennai', 'Mumbai', 'Delhi', 'Kolkata', 'Noida']
+SKILLS = ['Python', 'Java', 'SQL', 'AWS', 'Docker', 'React', 'Kubernetes', 'Terraform',
+          'Spark', 'Go', 'Rust', 'Figma', 'Tableau', 'Excel', 'Node.js', 'TypeScript']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne', 'Wonka']
+VERBS = ['Built', 'Designed', 'Migrated', 'Scaled', 'Automated', 'Led', 'Maintained']
+NOUNS = ['pipelines', 'dashboards', 'services', 'clusters', 'APIs', 'models', 'platforms']
+
+QUERIES = {
+    'rare': '123457',
+    'selective': 'kubernetes terraform bangalore',
+    'phrase': '"scaled clusters"',
+    'prefix': 'type*',
+    'common': 'python',
+}
+
+
+def make_resume(rng, i):
+    skills = rng.sample(SKILLS, 5)
+    return {
+        'personal_info': {'full_name': f'Candidate {i}', 'email': f'c{i}@example.com'},
+        'summary': f"Engineer based in {rng.choice(CITIES)} working with {skills[0]} and {skills[1]}.",
+        'experience': [
+            {'company': rng.choice(COMPANIES), 'position': 'Engineer',
+             'description': f"{rng.choice(VERBS)} {rng.choice(NOUNS)} using {rng.choice(skills)}"}
+            for _ in range(2)
+        ],
+        'projects': [{'name': f'Project {i}', 'description': f"{rng.choice(VERBS)} {rng.choice(NOUNS)}"}],
+        'skills': skills,
+        'target_role': 'Software Engineer',
+        'target_category': 'Software Development and Engineering'
+    }
+
+
+def timed(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def like_scan(terms):
+    # Newest 20 resumes mentioning every term; no ranking
+    condition = ' AND '.join(['(name LIKE ? OR summary LIKE ? OR experience LIKE ? OR skills LIKE ?)'] * len(terms))
+    with read_connection() as conn:
+        return conn.execute(
+            f'SELECT id FROM resume_data WHERE {condition} ORDER BY id DESC LIMIT 20',
+            [f'%{term}%' for term in terms for _ in range(4)]
+        ).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    init_database()
+    start = time.perf_counter()
+    for offset in range(0, args.rows, 10000):
+        save_many([make_resume(rng, i) for i in range(offset, min(offset + 10000, args.rows))])
+    print(f"rows={args.rows} ingest with FTS triggers: {time.perf_counter() - start:.1f}s")
+
+    print(f"{'query':<12}{'ms':>10}{'hits':>8}  text")
+    for name, text in QUERIES.items():
+        ms, results = timed(lambda: search_resumes(text), args.repeat)
+        print(f"{name:<12}{ms:>10.2f}{len(results):>8}  {text}")
+    for name in ('rare', 'selective'):
+        ms, rows = timed(lambda: like_scan(QUERIES[name].split()), max(1, args.repeat // 10))
+        print(f"{'LIKE ' + name:<12}{ms:>10.2f}{len(rows):>8}  {QUERIES[name]} (unranked)")
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
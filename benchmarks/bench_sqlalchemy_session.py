@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Per-call overhead of the SQLAlchemy layer in utils/database.py.
+
+  legacy  - the previous get_database_connection(): create_engine,
+            metadata.create_all and a new sessionmaker on every call
+  cached  - the cached engine and scoped_session used now
+
+Each strategy saves --calls AI analyses and reads the statistics back.
+
+Usage:
+    python -m benchmarks.bench_sqlalchemy_session --calls 500
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+from sqlalchemy import create_engine, func  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from config.connection_pool import DB_PATH  # noqa: E402
+from utils.database import (  # noqa: E402
+    AIAnalysis, Base, dispose_engines, get_ai_analysis_statistics,
+    save_ai_analysis_data
+)
+
+ANALYSIS = {'model_used': 'Google Gemini', 'resume_score': 72, 'job_role': 'Data Scientist'}
+
+
+def legacy_session():
+    engine = create_engine(f'sqlite:///{DB_PATH}')
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    return Session()
+
+
+def legacy_save(resume_id):
+    session = legacy_session()
+    try:
+        session.add(AIAnalysis(resume_id=resume_id, **ANALYSIS))
+        session.commit()
+    finally:
+        session.close()
+
+
+def legacy_stats():
+    session = legacy_session()
+    try:
+        session.query(func.count(AIAnalysis.id)).scalar()
+        session.query(func.avg(AIAnalysis.resume_score)).scalar()
+        session.query(AIAnalysis.model_used, func.count(AIAnalysis.id)).group_by(AIAnalysis.model_used).all()
+        session.query(AIAnalysis.job_role, func.count(AIAnalysis.id)).group_by(AIAnalysis.job_role).all()
+    finally:
+        session.close()
+
+
+def measure(fn, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        fn(i)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=500)
+    args = parser.parse_args()
+
+    results = {
+        'legacy': (
+            measure(legacy_save, args.calls),
+            measure(lambda i: legacy_stats(), args.calls)
+        ),
+        'cached': (
+            measure(lambda i: save_ai_analysis_data(i, ANALYSIS), args.calls),
+            measure(lambda i: get_ai_analysis_statistics(), args.calls)
+        )
+    }
+
+    dispose_engines()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+    print(f"calls={args.calls} (microseconds per call)")
+    print(f"{'strategy':<10}{'save':>12}{'stats':>12}")
+    for name, (save_us, stats_us) in results.items():
+        print(f"{name:<10}{save_us:>12.0f}{stats_us:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Analyze-page latency and insert throughput with and without the
+write-behind queue (config/write_queue.py).
+
+--sessions threads each serve --requests simulated analyze requests. A
+request does --work-ms of simulated analysis and then persists the resume
+and its analysis with one of:
+
+  direct  - save_resume_with_analysis() on the request thread
+  sync    - the write queue in sync durability mode (waits for commit)
+  async   - the write queue in async mode (returns once queued)
+
+Latency is measured per request; inserts/sec includes the final flush.
+
+Usage:
+    python -m benchmarks.bench_write_queue --sessions 8 --requests 200
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+DIRECTORY = tempfile.mkdtemp(prefix='workbridge-bench-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(DIRECTORY, 'resume_data.db')
+
+import config.write_queue as write_queue_module  # noqa: E402
+from config.connection_pool import get_connection_manager  # noqa: E402
+from config.database import (  # noqa: E402
+    init_database, queue_resume_with_analysis, save_resume_with_analysis
+)
+from config.write_queue import WriteBehindQueue  # noqa: E402
+
+RESUME = {
+    'personal_info': {'full_name': 'Candidate', 'email': 'candidate@example.com', 'phone': '555-0100'},
+    'target_role': 'Data Scientist',
+    'target_category': 'Data Science and Analytics',
+    'skills': ['Python', 'SQL', 'Pandas', 'Statistics', 'AWS']
+}
+ANALYSIS = {'ats_score': 78, 'keyword_match_score': 64, 'format_score': 80, 'section_score': 90}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(save, sessions, requests, work_ms, flush):
+    latencies = []
+    lock = threading.Lock()
+
+    def session():
+        local = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            time.sleep(work_ms / 1000)
+            save()
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    flush()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'inserts_per_sec': len(latencies) / elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--work-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    init_database()
+    results = {}
+
+    results['direct'] = run(
+        lambda: save_resume_with_analysis(RESUME, ANALYSIS),
+        args.sessions, args.requests, args.work_ms, lambda: None
+    )
+    for mode in ('sync', 'async'):
+        # Swap in a queue with the requested durability for this run
+        write_queue = write_queue_module._write_queue = WriteBehindQueue(durability=mode)
+        results[mode] = run(
+            lambda: queue_resume_with_analysis(RESUME, ANALYSIS),
+            args.sessions, args.requests, args.work_ms, write_queue.flush
+        )
+        write_queue.close()
+
+    get_connection_manager().close_all()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+
+    print(f"sessions={args.sessions} requests/session={args.requests} work={args.work_ms} ms")
+    print(f"{'mode':<8}{'p50 ms':>10}{'p95 ms':>10}{'inserts/s':>12}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['inserts_per_sec']:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
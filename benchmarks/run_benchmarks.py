@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Time every query function in config/database.py and dashboard/dashboard.py.
+
+Fills a scratch database with benchmarks/synthetic_data.py at --scale (or
+uses --db as is), then calls each get_* function of config.database and
+each get_* method of DashboardManager --repeat times after one warm-up
+call. Functions are discovered by name, so new queries are picked up
+without touching this script; ARGS supplies arguments for the ones that
+need them.
+
+The JSON report records the commit, SQLite version, table sizes and the
+min/median/p95/max milliseconds of each function. Pass an earlier report
+with --compare to print the change in median for every function.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scale 100k --output bench.json
+    python -m benchmarks.run_benchmarks --scale 100k --compare bench.json
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# Positional arguments for query functions that need them
+ARGS = {
+    'config.database.get_user_profile': (1,),
+}
+# Not queries: connection factories
+SKIP = {'config.database.get_database_connection'}
+TABLES = ('users', 'resume_data', 'resume_analysis', 'ai_analysis', 'resume_skills', 'daily_metrics')
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def query_functions():
+    """(name, callable) for every query function to time"""
+    import config.database as database
+    from dashboard.dashboard import DashboardManager
+
+    functions = [
+        (f"config.database.{name}", fn)
+        for name, fn in inspect.getmembers(database, inspect.isfunction)
+        if name.startswith('get_') and fn.__module__ == database.__name__
+    ]
+    dashboard = DashboardManager()
+    functions += [
+        (f"dashboard.DashboardManager.{name}", getattr(dashboard, name))
+        for name, _ in inspect.getmembers(DashboardManager, inspect.isfunction)
+        if name.startswith('get_')
+    ]
+    return [(name, fn) for name, fn in functions if name not in SKIP]
+
+
+def time_function(fn, args, repeat):
+    fn(*args)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        'runs': repeat,
+        'min_ms': round(timings[0], 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(timings[min(repeat - 1, int(repeat * 0.95))], 3),
+        'max_ms': round(timings[-1], 3),
+    }
+
+
+def table_sizes():
+    from config.connection_pool import read_connection
+
+    sizes = {}
+    with read_connection() as conn:
+        for table in TABLES:
+            try:
+                sizes[table] = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            except sqlite3.Error:
+                sizes[table] = None
+    return sizes
+
+
+def compare(report, baseline):
+    """Print the change in median for each function against baseline"""
+    print(f"\ncompared with {baseline.get('commit')} ({baseline.get('generated_at')})")
+    print(f"{'function':<60}{'before':>10}{'after':>10}{'change':>9}")
+    for name, result in report['results'].items():
+        before = baseline.get('results', {}).get(name)
+        if not before:
+            print(f"{name:<60}{'-':>10}{result['median_ms']:>10.2f}{'new':>9}")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100 if before['median_ms'] else 0
+        print(f"{name:<60}{before['median_ms']:>10.2f}{result['median_ms']:>10.2f}{change:>+8.0f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', default='10k', help="10k, 100k, 1m or a row count")
+    parser.add_argument('--db', help="benchmark an existing database instead of generating one")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--output', help="write the JSON report here (default: stdout)")
+    parser.add_argument('--compare', help="earlier JSON report to compare medians against")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    directory = None
+    if args.db:
+        db_path = args.db
+    else:
+        directory = tempfile.mkdtemp(prefix='workbridge-bench-')
+        db_path = os.path.join(directory, 'resume_data.db')
+    # Must be set before config is imported
+    os.environ['WORKBRIDGE_DB_PATH'] = db_path
+
+    from benchmarks.synthetic_data import generate, parse_scale
+    from config.connection_pool import get_connection_manager, get_read_only_pool
+
+    generate_seconds = None
+    if directory:
+        start = time.perf_counter()
+        generate(parse_scale(args.scale), args.seed)
+        generate_seconds = round(time.perf_counter() - start, 1)
+        print(f"generated {args.scale} in {generate_seconds}s", file=sys.stderr)
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'scale': None if args.db else args.scale,
+        'generate_seconds': generate_seconds,
+        'tables': table_sizes(),
+        'repeat': args.repeat,
+        'results': {},
+    }
+    for name, fn in query_functions():
+        report['results'][name] = time_function(fn, ARGS.get(name, ()), args.repeat)
+        print(f"{name:<60}{report['results'][name]['median_ms']:>10.2f} ms", file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+    get_read_only_pool(db_path).close_all()
+    get_connection_manager(db_path).close_all()
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
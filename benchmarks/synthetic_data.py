@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Synthetic data for exercising the dashboards at scale.
+
+Fills a database with --scale resumes (10k, 100k or 1m, or any row count)
+and proportional users, resume analyses, AI analyses and feedback:
+
+  resume_data      one per resume, roles and skills drawn from
+                   config/job_roles.py, spread over --days of history
+                   with more traffic on weekdays and working hours
+  resume_analysis  one per resume, scores roughly normal around 60
+  ai_analysis      about one per three resumes
+  users            one per 20 resumes, owning about half the resumes
+  feedback         one per 200 resumes, in the feedback database
+
+Resumes go through save_many(), so skills, the search index and the
+daily_metrics rollup are filled the same way the app fills them; the
+rollup is rebuilt once the timestamps have been spread out. Every user
+shares one password hash (SYNTHETIC_PASSWORD) because hashing a million
+passwords would dominate the run.
+
+Usage:
+    python -m benchmarks.synthetic_data --scale 100k --db /tmp/resume_data.db
+"""
+
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BATCH_SIZE = 5000
+HISTORY_DAYS = 365
+SYNTHETIC_PASSWORD = 'synthetic-password'
+
+FIRST_NAMES = ['Aarav', 'Priya', 'James', 'Maria', 'Wei', 'Fatima', 'Lucas', 'Emma', 'Kofi', 'Yuki',
+               'Diego', 'Olga', 'Noah', 'Aisha', 'Liam', 'Sofia', 'Arjun', 'Chen', 'Amara', 'Mateo']
+LAST_NAMES = ['Sharma', 'Smith', 'Garcia', 'Wang', 'Khan', 'Silva', 'Johnson', 'Tanaka', 'Mensah',
+              'Petrova', 'Brown', 'Patel', 'Kim', 'Nguyen', 'Rossi', 'Okafor', 'Müller', 'Singh']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark Industries', 'Wayne Enterprises',
+             'Tyrell', 'Cyberdyne', 'Soylent']
+SOFT_SKILLS = ['Communication', 'Leadership', 'Teamwork', 'Problem-solving', 'Time management']
+AI_MODELS = ['Google Gemini', 'Anthropic Claude', 'OpenRouter']
+# Relative traffic per weekday (Monday first) and hour of day (UTC)
+WEEKDAY_WEIGHTS = [1.0, 1.0, 0.95, 0.9, 0.8, 0.35, 0.3]
+HOUR_WEIGHTS = [0.2] * 7 + [0.6, 1.0, 1.2, 1.3, 1.2, 1.0, 1.1, 1.2, 1.1, 1.0, 0.8, 0.6, 0.5, 0.4, 0.3, 0.3, 0.2]
+
+
+def parse_scale(value):
+    """Row count for '10k', '100k', '1m' or a plain number"""
+    value = str(value).lower()
+    return SCALES[value] if value in SCALES else int(value)
+
+
+def _roles():
+    from config.job_roles import JOB_ROLES
+
+    return [
+        (category, role, info.get('required_skills', []))
+        for category, roles in JOB_ROLES.items()
+        for role, info in roles.items()
+    ]
+
+
+def _timestamps(rng, count, days, now):
+    """count UTC timestamp strings over the last days, oldest first"""
+    day_offsets = list(range(days))
+    day_weights = [WEEKDAY_WEIGHTS[(now - timedelta(days=d)).weekday()] for d in day_offsets]
+    days_ago = rng.choices(day_offsets, day_weights, k=count)
+    hours = rng.choices(range(24), HOUR_WEIGHTS, k=count)
+    stamps = sorted(
+        now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        - timedelta(days=ago) + timedelta(seconds=rng.randrange(3600))
+        for ago, hour in zip(days_ago, hours)
+    )
+    return [min(stamp, now).strftime('%Y-%m-%d %H:%M:%S') for stamp in stamps]
+
+
+def _score(rng, mean=60, spread=15):
+    return max(0.0, min(100.0, rng.gauss(mean, spread)))
+
+
+def make_resume(rng, i, roles):
+    category, role, role_skills = rng.choice(roles)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(' ', '.')
+    skills = rng.sample(role_skills, min(len(role_skills), rng.randint(3, 8)))
+    skills += rng.sample(SOFT_SKILLS, rng.randint(0, 2))
+    years = rng.randint(0, 15)
+    resume = {
+        'personal_info': {
+            'full_name': name,
+            'email': f"{handle}{i}@example.com",
+            'phone': f"555-{rng.randrange(10000):04d}",
+            'linkedin': f"https://linkedin.com/in/{handle}{i}",
+            'github': f"https://github.com/{handle.replace('.', '')}{i}" if rng.random() < 0.6 else '',
+        },
+        'summary': f"{role} with {years} years of experience in {', '.join(skills[:3])}.",
+        'target_role': role,
+        'target_category': category,
+        'education': [{'degree': rng.choice(['B.Sc.', 'B.Tech', 'M.Sc.', 'MBA']), 'year': 2024 - years}],
+        'experience': [
+            {'company': rng.choice(COMPANIES), 'position': role, 'years': rng.randint(1, 5)}
+            for _ in range(min(3, 1 + years // 4))
+        ],
+        'projects': [{'name': f"{skills[0]} project", 'description': f"Built with {', '.join(skills[:2])}"}],
+        'skills': skills,
+    }
+    ats = _score(rng)
+    analysis = {
+        'ats_score': ats,
+        'keyword_match_score': _score(rng, ats * 0.8, 12),
+        'format_score': _score(rng, 75, 10),
+        'section_score': _score(rng, 70, 12),
+        'missing_skills': ','.join(rng.sample(role_skills, min(2, len(role_skills)))),
+        'recommendations': 'Quantify achievements in the experience section',
+    }
+    return resume, analysis
+
+
+def generate_users(rng, count, now):
+    """Insert count users sharing one password hash; returns their ids"""
+    from config.connection_pool import write_connection
+    from config.database import hash_password
+
+    password_hash = hash_password(SYNTHETIC_PASSWORD)
+    created = _timestamps(rng, count, HISTORY_DAYS, now)
+    with write_connection() as conn:
+        first_id = conn.execute('SELECT COALESCE(MAX(id), 0) FROM users').fetchone()[0] + 1
+        conn.executemany('''
+            INSERT INTO users (id, username, email, password_hash, full_name, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (
+            (first_id + i, f"synthetic{first_id + i}", f"synthetic{first_id + i}@example.com",
+             password_hash, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", created[i])
+            for i in range(count)
+        ))
+    return list(range(first_id, first_id + count))
+
+
+def generate_resumes(rng, count, user_ids, now, days=HISTORY_DAYS, batch_size=BATCH_SIZE):
+    """Insert count resumes with analyses and about count/3 AI analyses"""
+    from config.connection_pool import write_connection
+    from config.database import save_many
+    from config.migrations import rebuild_daily_metrics
+
+    roles = _roles()
+    created = _timestamps(rng, count, days, now)
+    for start in range(0, count, batch_size):
+        stop = min(start + batch_size, count)
+        records = [make_resume(rng, i, roles) for i in range(start, stop)]
+        with write_connection() as conn:
+            # save_many joins this transaction, so each batch is one commit
+            resume_ids = save_many(records)
+            stamps = created[start:stop]
+            owners = [rng.choice(user_ids) if user_ids and rng.random() < 0.5 else None for _ in resume_ids]
+            conn.executemany('UPDATE resume_data SET created_at = ?, user_id = ? WHERE id = ?',
+                             zip(stamps, owners, resume_ids))
+            conn.executemany('UPDATE resume_analysis SET created_at = ? WHERE resume_id = ?',
+                             zip(stamps, resume_ids))
+            conn.executemany('''
+                INSERT INTO ai_analysis (resume_id, model_used, resume_score, job_role, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                (resume_id, rng.choice(AI_MODELS), round(_score(rng, 65, 15)),
+                 resume['target_role'], stamp)
+                for resume_id, (resume, _), stamp in zip(resume_ids, records, stamps)
+                if rng.random() < 1 / 3
+            ))
+
+    with write_connection() as conn:
+        rebuild_daily_metrics(conn.cursor())
+
+
+def generate_feedback(rng, count, now, db_path):
+    """Insert count feedback responses into the feedback database"""
+    from feedback.feedback import FeedbackManager
+
+    manager = FeedbackManager(db_path)
+    created = _timestamps(rng, count, HISTORY_DAYS, now)
+    with manager.connections.write() as conn:
+        conn.executemany('''
+            INSERT INTO feedback (
+                rating, usability_score, feature_satisfaction, missing_features,
+                improvement_suggestions, user_experience, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            (rng.choices(range(1, 6), [1, 1, 3, 8, 10])[0], rng.randint(2, 5), rng.randint(2, 5),
+             rng.choice(['', 'Cover letter builder', 'LinkedIn import', 'Dark mode']),
+             rng.choice(['', 'Faster PDF parsing', 'More templates']),
+             rng.choice(['Smooth', 'Helpful analysis', 'A bit slow on large files']), stamp)
+            for stamp in created
+        ))
+
+
+def generate(rows, seed=7, feedback_db=None, days=HISTORY_DAYS, batch_size=BATCH_SIZE):
+    """Fill the configured database (WORKBRIDGE_DB_PATH) with rows resumes.
+
+    Returns the row count written to each table.
+    """
+    from config.database import init_database
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    init_database()
+    user_ids = generate_users(rng, max(1, rows // 20), now)
+    generate_resumes(rng, rows, user_ids, now, days, batch_size)
+    counts = {'users': len(user_ids), 'resume_data': rows}
+    if feedback_db:
+        counts['feedback'] = max(1, rows // 200)
+        generate_feedback(rng, counts['feedback'], now, feedback_db)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', default='10k', help="10k, 100k, 1m or a row count")
+    parser.add_argument('--db', required=True, help="database file to fill (created if missing)")
+    parser.add_argument('--feedback-db', help="feedback database to fill as well")
+    parser.add_argument('--days', type=int, default=HISTORY_DAYS)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    # Must be set before config is imported
+    os.environ['WORKBRIDGE_DB_PATH'] = args.db
+    from config.connection_pool import get_connection_manager
+
+    start = time.perf_counter()
+    counts = generate(parse_scale(args.scale), args.seed, args.feedback_db, args.days)
+    get_connection_manager(args.db).close_all()
+    print(f"generated {counts} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
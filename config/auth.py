@@ -0,0 +1,218 @@
+"""
+Login sessions and password hashing off the Streamlit script thread.
+
+A successful login creates a row in auth_sessions and hands the browser a
+signed token ("<id>.<expires>.<signature>"), which the app keeps in a
+cookie rather than the URL. A page load resumes the session with
+rotate_session(): the expiry and HMAC signature are checked in memory,
+one primary-key lookup joined to users returns the account, and the token
+is replaced by a fresh one, so a copied token stops working once the
+browser has used it. Only a hash of the id is stored, so the table alone
+cannot be used to forge or replay tokens.
+
+PBKDF2 runs in a small shared thread pool (hashlib releases the GIL while
+hashing). At most HASH_WORKERS hashes run at once and at most
+MAX_PENDING_HASHES wait, so a burst of logins queues instead of taking
+every core from the sessions that are rendering pages.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config.connection_pool import read_connection, write_connection
+
+SESSION_TTL_SECONDS = int(os.environ.get('WORKBRIDGE_SESSION_TTL', str(7 * 24 * 3600)))
+SESSION_SECRET_FILE = os.environ.get('WORKBRIDGE_SESSION_SECRET_FILE', '.session_secret')
+
+# 0 hashes on the calling thread (no pool)
+HASH_WORKERS = int(os.environ.get('WORKBRIDGE_HASH_WORKERS', str(max(1, (os.cpu_count() or 2) // 2))))
+MAX_PENDING_HASHES = max(1, HASH_WORKERS) * 16
+
+CREATE_SESSIONS_TABLE = '''
+CREATE TABLE IF NOT EXISTS auth_sessions (
+    token_hash TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    expires_at INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID
+'''
+
+
+class HashPoolBusy(RuntimeError):
+    """Raised when MAX_PENDING_HASHES hashes are already queued"""
+
+
+_hash_pool = None
+_hash_slots = threading.BoundedSemaphore(MAX_PENDING_HASHES)
+_pool_lock = threading.Lock()
+
+
+def _get_hash_pool():
+    global _hash_pool
+    with _pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix='password-hash')
+        return _hash_pool
+
+
+def run_password_hash(fn, *args):
+    """Run fn(*args) in the password hashing pool and return its result.
+
+    Raises HashPoolBusy instead of queueing when the pool is saturated.
+    """
+    if HASH_WORKERS <= 0:
+        return fn(*args)
+    if not _hash_slots.acquire(blocking=False):
+        raise HashPoolBusy("Too many logins in progress")
+    try:
+        return _get_hash_pool().submit(fn, *args).result()
+    finally:
+        _hash_slots.release()
+
+
+_secret = None
+
+
+def _read_secret():
+    with open(SESSION_SECRET_FILE) as f:
+        secret = f.read().strip()
+    if not secret:
+        raise RuntimeError(f"Session secret file {SESSION_SECRET_FILE} is empty")
+    return secret.encode('utf-8')
+
+
+def _create_secret_file():
+    """Create SESSION_SECRET_FILE with a new key unless it already exists.
+
+    The key is written to a temporary file first and then hard-linked into
+    place, which fails if the file exists; so the file never appears empty
+    and concurrent first starts agree on whichever key was linked first.
+    """
+    directory = os.path.dirname(os.path.abspath(SESSION_SECRET_FILE))
+    fd, temp_path = tempfile.mkstemp(prefix='.session_secret-', dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(secrets.token_hex(32))
+            f.flush()
+            os.fsync(f.fileno())
+        os.link(temp_path, SESSION_SECRET_FILE)
+    except FileExistsError:
+        pass
+    finally:
+        os.unlink(temp_path)
+
+
+def _session_secret():
+    """HMAC key for session tokens: WORKBRIDGE_SESSION_SECRET, else a key file"""
+    global _secret
+    if _secret is None:
+        configured = os.environ.get('WORKBRIDGE_SESSION_SECRET')
+        if configured:
+            _secret = configured.encode('utf-8')
+        else:
+            if not os.path.exists(SESSION_SECRET_FILE):
+                _create_secret_file()
+            _secret = _read_secret()
+    return _secret
+
+
+def _signature(session_id, expires_at):
+    digest = hmac.new(_session_secret(), f"{session_id}.{expires_at}".encode('utf-8'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+
+def _token_hash(session_id):
+    return hashlib.sha256(session_id.encode('utf-8')).hexdigest()
+
+
+def _new_session(conn, user_id, ttl):
+    session_id = secrets.token_urlsafe(24)
+    expires_at = int(time.time()) + ttl
+    conn.execute(
+        'INSERT INTO auth_sessions (token_hash, user_id, expires_at) VALUES (?, ?, ?)',
+        (_token_hash(session_id), user_id, expires_at)
+    )
+    return f"{session_id}.{expires_at}.{_signature(session_id, expires_at)}"
+
+
+def create_session(user_id, ttl=SESSION_TTL_SECONDS):
+    """Start a session for user_id; returns the token to give the browser"""
+    with write_connection() as conn:
+        return _new_session(conn, user_id, ttl)
+
+
+def _parse_token(token):
+    """Return the session id of a well-formed, unexpired, correctly signed token"""
+    try:
+        session_id, expires_at, signature = (token or '').split('.')
+        expires_at = int(expires_at)
+    except ValueError:
+        return None
+    if expires_at <= time.time():
+        return None
+    if not hmac.compare_digest(signature, _signature(session_id, expires_at)):
+        return None
+    return session_id
+
+
+def resume_session(token):
+    """User dict for a valid session token, or None"""
+    session_id = _parse_token(token)
+    if session_id is None:
+        return None
+    try:
+        with read_connection() as conn:
+            user = conn.execute('''
+            SELECT u.id, u.username, u.email, u.full_name
+            FROM auth_sessions s
+            JOIN users u ON u.id = s.user_id
+            WHERE s.token_hash = ? AND s.expires_at > ? AND u.is_active
+            ''', (_token_hash(session_id), int(time.time()))).fetchone()
+    except Exception as e:
+        print(f"Error resuming session: {str(e)}")
+        return None
+    if not user:
+        return None
+    return {"id": user[0], "username": user[1], "email": user[2], "full_name": user[3]}
+
+
+def rotate_session(token, ttl=SESSION_TTL_SECONDS):
+    """Resume a session and replace its token; returns (user dict, new token) or (None, None)"""
+    user = resume_session(token)
+    if user is None:
+        return None, None
+    try:
+        with write_connection() as conn:
+            # Only one caller can delete the old row, so a replayed token cannot also rotate
+            deleted = conn.execute(
+                'DELETE FROM auth_sessions WHERE token_hash = ?', (_token_hash(_parse_token(token)),)
+            ).rowcount
+            if not deleted:
+                return None, None
+            return user, _new_session(conn, user['id'], ttl)
+    except Exception as e:
+        print(f"Error rotating session: {str(e)}")
+        return None, None
+
+
+def revoke_session(token):
+    """End the session a token belongs to (logout)"""
+    session_id = (token or '').split('.')[0]
+    try:
+        with write_connection() as conn:
+            conn.execute('DELETE FROM auth_sessions WHERE token_hash = ?', (_token_hash(session_id),))
+    except Exception as e:
+        print(f"Error revoking session: {str(e)}")
+
+
+def purge_expired_sessions():
+    """Delete expired sessions; returns the number removed"""
+    with write_connection() as conn:
+        return conn.execute('DELETE FROM auth_sessions WHERE expires_at <= ?', (int(time.time()),)).rowcount
@@ -0,0 +1,228 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.parse import quote
+
+# Overridable so benchmarks and scripts can point at a scratch database
+DB_PATH = os.environ.get('WORKBRIDGE_DB_PATH', 'resume_data.db')
+
+# Connection tuning applied to every pooled connection
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KB = 16000
+SYNCHRONOUS = 'NORMAL'
+
+# Shared read-only connections (ReadOnlyPool) per database file
+READ_POOL_SIZE = int(os.environ.get('WORKBRIDGE_READ_POOL_SIZE', '4'))
+
+
+def read_only_uri(path):
+    """SQLite URI opening path read-only; the path is quoted so ?, # and % are safe"""
+    return f"file:{quote(os.path.abspath(path))}?mode=ro"
+
+
+def configure_connection(conn, read_only=False):
+    """Apply the standard pragmas to a sqlite connection"""
+    # Only takes effect when the file is new, and must precede journal_mode;
+    # existing files are converted by config.maintenance.enable_incremental_vacuum
+    conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+    conn.execute(f'PRAGMA synchronous={SYNCHRONOUS}')
+    conn.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KB}')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    if read_only:
+        conn.execute('PRAGMA query_only=1')
+    return conn
+
+
+class ConnectionManager:
+    """Process-wide pool of per-thread sqlite connections.
+
+    Every thread gets one reader and one writer connection to the database,
+    created lazily and reused for the lifetime of the thread. Connections
+    that belong to threads which have exited are closed the next time a
+    connection is created, so short-lived script threads do not leak them.
+    """
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}
+
+    def _connect(self, read_only):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        return configure_connection(conn, read_only=read_only)
+
+    def _get(self, role):
+        conn = getattr(self._local, role, None)
+        if conn is not None:
+            return conn
+
+        conn = self._connect(read_only=(role == 'reader'))
+        thread = threading.current_thread()
+        with self._lock:
+            self._prune()
+            self._connections[(thread.ident, role)] = (thread, conn)
+        setattr(self._local, role, conn)
+        return conn
+
+    def _prune(self):
+        """Close connections owned by threads that are no longer alive"""
+        for key, (thread, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                conn.close()
+                del self._connections[key]
+
+    @contextmanager
+    def read(self):
+        """Yield this thread's reader connection (autocommit, query only)"""
+        yield self._get('reader')
+
+    @contextmanager
+    def write(self):
+        """Yield this thread's writer connection inside one transaction.
+
+        The transaction is opened with BEGIN IMMEDIATE so the write lock is
+        taken up front, committed when the block exits normally and rolled
+        back if it raises.
+        """
+        conn = self._get('writer')
+        if conn.in_transaction:
+            # Nested write block: join the enclosing transaction
+            yield conn
+            return
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+    def open_connections(self):
+        """Number of connections currently held by the pool"""
+        with self._lock:
+            return len(self._connections)
+
+    def close_all(self):
+        """Close every pooled connection, e.g. on shutdown or in benchmarks"""
+        with self._lock:
+            for thread, conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class ReadOnlyPool:
+    """Small process-wide pool of read-only connections shared by all threads.
+
+    Connections are opened with a file:...?mode=ro URI, so they can never
+    take a write lock, and are created lazily up to size. A connection is
+    checked out for the duration of a with block and returned afterwards;
+    when all of them are in use, callers wait for one to come back. The
+    pool owns the connections until close_all().
+    """
+
+    def __init__(self, db_path=DB_PATH, size=READ_POOL_SIZE):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            read_only_uri(self.db_path),
+            uri=True,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        conn.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KB}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._connections) < self.size:
+                conn = self._connect()
+                self._connections.append(conn)
+                return conn
+        try:
+            return self._idle.get(timeout=BUSY_TIMEOUT_MS / 1000)
+        except queue.Empty:
+            raise sqlite3.OperationalError("No read-only connection available") from None
+
+    @contextmanager
+    def connection(self):
+        """Check out a read-only connection for the duration of the block"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def open_connections(self):
+        """Number of connections currently held by the pool"""
+        with self._lock:
+            return len(self._connections)
+
+    def close_all(self):
+        """Close every connection; only call once nothing is checked out"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._idle = queue.LifoQueue()
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+_read_only_pools = {}
+
+
+def get_connection_manager(db_path=DB_PATH):
+    """Return the shared ConnectionManager for a database file"""
+    with _managers_lock:
+        manager = _managers.get(db_path)
+        if manager is None:
+            manager = ConnectionManager(db_path)
+            _managers[db_path] = manager
+        return manager
+
+
+def read_connection(db_path=DB_PATH):
+    """Context manager yielding a pooled read connection"""
+    return get_connection_manager(db_path).read()
+
+
+def write_connection(db_path=DB_PATH):
+    """Context manager yielding a pooled connection inside a write transaction"""
+    return get_connection_manager(db_path).write()
+
+
+def get_read_only_pool(db_path=DB_PATH):
+    """Return the shared ReadOnlyPool for a database file"""
+    with _managers_lock:
+        pool = _read_only_pools.get(db_path)
+        if pool is None:
+            pool = ReadOnlyPool(db_path)
+            _read_only_pools[db_path] = pool
+        return pool
@@ -0,0 +1,75 @@
+"""
+JSON storage for the structured resume_data columns.
+
+education, experience, projects and skills are stored as compact JSON so
+SQLite's JSON1 functions (and the generated columns added by migration 6)
+can read them. Rows written before that were stored as Python str()
+reprs; migration 6 converts them, and `python -m config.json_fields` runs
+the same conversion on demand.
+"""
+
+import ast
+import json
+
+JSON_COLUMNS = ('education', 'experience', 'projects', 'skills')
+
+CONVERT_BATCH_SIZE = 1000
+
+
+def to_json(value):
+    """Serialize a resume field as compact JSON"""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def parse_field(value, default=None):
+    """Parse a stored field, accepting both JSON and legacy str() reprs"""
+    if value is None or value == '':
+        return default
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+
+
+def convert_legacy_rows(cursor, batch_size=CONVERT_BATCH_SIZE):
+    """Rewrite non-JSON structured columns as JSON; returns rows converted"""
+    invalid = ' OR '.join(
+        f"({column} IS NOT NULL AND NOT json_valid({column}))" for column in JSON_COLUMNS
+    )
+    converted = 0
+    last_id = 0
+    while True:
+        cursor.execute(f'''
+        SELECT id, {', '.join(JSON_COLUMNS)} FROM resume_data
+        WHERE id > ? AND ({invalid})
+        ORDER BY id
+        LIMIT ?
+        ''', (last_id, batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            return converted
+        cursor.executemany(f'''
+        UPDATE resume_data SET {', '.join(f'{column} = ?' for column in JSON_COLUMNS)}
+        WHERE id = ?
+        ''', [
+            tuple(to_json(parse_field(value, default=[])) for value in row[1:]) + (row[0],)
+            for row in rows
+        ])
+        converted += len(rows)
+        last_id = rows[-1][0]
+
+
+if __name__ == '__main__':
+    from config.database import init_database
+    from config.connection_pool import write_connection
+
+    init_database()
+    with write_connection() as conn:
+        count = convert_legacy_rows(conn.cursor())
+    print(f"Converted {count} resume_data rows to JSON")
@@ -0,0 +1,416 @@
+"""
+Retention, archival and compaction for resume_data.db.
+
+run_maintenance() moves resumes older than the retention horizon (with
+their analyses and skills) and old ai_analysis rows into a separate
+archive database, then returns the freed pages to the filesystem with
+incremental_vacuum and refreshes the planner statistics with ANALYZE.
+The full-text index keeps the text of deleted rows until its segments
+are merged, which merge_search_index() (--merge-search) does.
+
+Archived rows are stored one per resume as zlib-compressed JSON, so the
+archive stays small and any resume can still be read back with
+load_archived_resume(). daily_metrics is maintained by insert triggers
+only, so deleting live rows leaves the dashboard rollups untouched.
+
+Every write to the live database is a short transaction sized to fit in
+a time slice (default 50 ms): batch sizes adapt to how long the previous
+batch held the write lock, and the job sleeps between batches so queued
+writers get in.
+
+    python -m config.maintenance --days 365 --slice-ms 50
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from config.auth import purge_expired_sessions
+from config.connection_pool import (
+    BUSY_TIMEOUT_MS, DB_PATH, configure_connection, read_connection, read_only_uri, write_connection
+)
+
+RETENTION_DAYS = int(os.environ.get('WORKBRIDGE_RETENTION_DAYS', '365'))
+ARCHIVE_PATH = os.environ.get('WORKBRIDGE_ARCHIVE_PATH', 'resume_archive.db')
+
+# Longest a single maintenance transaction should hold the write lock
+SLICE_MS = 50
+MIN_BATCH_SIZE = 10
+MAX_BATCH_SIZE = 2000
+INITIAL_BATCH_SIZE = 200
+INITIAL_MERGE_PAGES = 16
+# Merge cost also depends on how many deleted entries a step skips, so it
+# varies more than its page count suggests (single 64-page steps have taken
+# several hundred ms); merging is therefore opt-in
+MAX_MERGE_PAGES = 64
+# FTS5 'merge' with a negative page count corrupts the index when other
+# connections write concurrently on SQLite 3.40; 3.51 is the oldest release
+# verified not to
+SEARCH_MERGE_MIN_SQLITE = (3, 51, 0)
+INITIAL_VACUUM_PAGES = 64
+MAX_VACUUM_PAGES = 256
+# Rows sampled per index by ANALYZE (PRAGMA analysis_limit)
+ANALYSIS_LIMIT = 1000
+
+ARCHIVE_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS archived_resumes (
+        id INTEGER PRIMARY KEY,
+        created_at TIMESTAMP,
+        target_role TEXT,
+        target_category TEXT,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        payload BLOB NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_archived_resumes_created_at ON archived_resumes (created_at)',
+    '''
+    CREATE TABLE IF NOT EXISTS archived_ai_analysis (
+        id INTEGER PRIMARY KEY,
+        resume_id INTEGER,
+        created_at TIMESTAMP,
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        payload BLOB NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_archived_ai_analysis_created_at ON archived_ai_analysis (created_at)',
+]
+
+
+def retention_cutoff(days=RETENTION_DAYS):
+    """created_at value below which rows are archived (UTC, like CURRENT_TIMESTAMP)"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def compress(record):
+    return zlib.compress(json.dumps(record, default=str).encode('utf-8'))
+
+
+def decompress(payload):
+    return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+
+def open_archive(path=ARCHIVE_PATH):
+    """Connect to the archive database, creating its tables if needed"""
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000)
+    for statement in ARCHIVE_SCHEMA:
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def _dicts(cursor, query, params=()):
+    cursor.execute(query, params)
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _next_batch_size(batch_size, seconds, slice_seconds, maximum=MAX_BATCH_SIZE):
+    """Scale the batch so the next write takes about half the slice.
+
+    Aiming below the slice leaves headroom for timing noise; growth is
+    capped at 2x per batch so one fast batch cannot cause a long one.
+    """
+    target = batch_size * (slice_seconds / 2) / max(seconds, 1e-6)
+    return int(max(MIN_BATCH_SIZE, min(maximum, batch_size * 2, target)))
+
+
+def _archive_resume_batch(archive, cutoff, after_id, batch_size):
+    """Archive one batch of old resumes; returns (rows, last id, write seconds)"""
+    with read_connection() as conn:
+        cursor = conn.cursor()
+        resumes = _dicts(cursor, '''
+            SELECT * FROM resume_data
+            WHERE id > ? AND created_at < ?
+            ORDER BY id LIMIT ?
+        ''', (after_id, cutoff, batch_size))
+        if not resumes:
+            return 0, after_id, 0.0
+        ids = json.dumps([resume['id'] for resume in resumes])
+        analyses = _dicts(cursor, '''
+            SELECT * FROM resume_analysis
+            WHERE resume_id IN (SELECT value FROM json_each(?)) ORDER BY id
+        ''', (ids,))
+        skills = _dicts(cursor, '''
+            SELECT * FROM resume_skills
+            WHERE resume_id IN (SELECT value FROM json_each(?)) ORDER BY id
+        ''', (ids,))
+
+    by_resume = {resume['id']: {'resume': resume, 'analyses': [], 'skills': []} for resume in resumes}
+    for analysis in analyses:
+        by_resume[analysis['resume_id']]['analyses'].append(analysis)
+    for skill in skills:
+        by_resume[skill['resume_id']]['skills'].append(skill)
+
+    # The archive is committed before anything is deleted, and re-archiving
+    # replaces, so an interrupted run loses nothing and can simply be rerun
+    archive.executemany('''
+        INSERT OR REPLACE INTO archived_resumes (id, created_at, target_role, target_category, payload)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [
+        (resume_id, record['resume']['created_at'], record['resume']['target_role'],
+         record['resume']['target_category'], compress(record))
+        for resume_id, record in by_resume.items()
+    ])
+    archive.commit()
+
+    start = time.perf_counter()
+    with write_connection() as conn:
+        # Under the write lock, pick the resumes whose every analysis and
+        # skill row is in the archived payload; one that gained a row in the
+        # meantime stays live, children included, until the next run
+        deleted = json.dumps([row[0] for row in conn.execute('''
+            SELECT id FROM resume_data
+            WHERE id IN (SELECT value FROM json_each(:resumes))
+              AND NOT EXISTS (
+                  SELECT 1 FROM resume_analysis WHERE resume_id = resume_data.id
+                    AND id NOT IN (SELECT value FROM json_each(:analyses)))
+              AND NOT EXISTS (
+                  SELECT 1 FROM resume_skills WHERE resume_id = resume_data.id
+                    AND id NOT IN (SELECT value FROM json_each(:skills)))
+        ''', {
+            'resumes': ids,
+            'analyses': json.dumps([analysis['id'] for analysis in analyses]),
+            'skills': json.dumps([skill['id'] for skill in skills]),
+        })])
+        conn.execute('DELETE FROM resume_skills WHERE resume_id IN (SELECT value FROM json_each(?))', (deleted,))
+        conn.execute('DELETE FROM resume_analysis WHERE resume_id IN (SELECT value FROM json_each(?))', (deleted,))
+        conn.execute('DELETE FROM resume_data WHERE id IN (SELECT value FROM json_each(?))', (deleted,))
+    return len(resumes), resumes[-1]['id'], time.perf_counter() - start
+
+
+def _archive_ai_analysis_batch(archive, cutoff, after_id, batch_size):
+    """Archive one batch of old ai_analysis rows; returns (rows, last id, write seconds)"""
+    with read_connection() as conn:
+        rows = _dicts(conn.cursor(), '''
+            SELECT * FROM ai_analysis
+            WHERE id > ? AND created_at < ?
+            ORDER BY id LIMIT ?
+        ''', (after_id, cutoff, batch_size))
+    if not rows:
+        return 0, after_id, 0.0
+
+    archive.executemany('''
+        INSERT OR REPLACE INTO archived_ai_analysis (id, resume_id, created_at, payload)
+        VALUES (?, ?, ?, ?)
+    ''', [(row['id'], row['resume_id'], row['created_at'], compress(row)) for row in rows])
+    archive.commit()
+
+    start = time.perf_counter()
+    with write_connection() as conn:
+        conn.execute('DELETE FROM ai_analysis WHERE id IN (SELECT value FROM json_each(?))',
+                     (json.dumps([row['id'] for row in rows]),))
+    return len(rows), rows[-1]['id'], time.perf_counter() - start
+
+
+def _run_batches(batch, archive, cutoff, slice_seconds):
+    """Call batch() until it runs dry, keeping each write inside the slice"""
+    total, after_id, batch_size = 0, 0, INITIAL_BATCH_SIZE
+    while True:
+        count, after_id, seconds = batch(archive, cutoff, after_id, batch_size)
+        if not count:
+            return total
+        total += count
+        batch_size = _next_batch_size(batch_size, seconds, slice_seconds)
+        # Give writers waiting on the lock at least as long as we held it
+        time.sleep(max(seconds, slice_seconds / 10))
+
+
+def archive_old_rows(days=RETENTION_DAYS, archive_path=ARCHIVE_PATH, slice_ms=SLICE_MS):
+    """Move rows older than days into the archive; returns {table: rows archived}"""
+    cutoff = retention_cutoff(days)
+    slice_seconds = slice_ms / 1000
+    archive = open_archive(archive_path)
+    try:
+        return {
+            'resume_data': _run_batches(_archive_resume_batch, archive, cutoff, slice_seconds),
+            'ai_analysis': _run_batches(_archive_ai_analysis_batch, archive, cutoff, slice_seconds),
+        }
+    finally:
+        archive.close()
+
+
+def merge_search_index(slice_ms=SLICE_MS):
+    """Merge resume_search segments in time-sliced steps; returns pages merged.
+
+    FTS5 only marks deleted rows in its segments, so the index keeps the
+    text of archived resumes until its segments are merged. Returns None
+    when the SQLite library is too old to merge safely.
+    """
+    if sqlite3.sqlite_version_info < SEARCH_MERGE_MIN_SQLITE:
+        return None
+    slice_seconds = slice_ms / 1000
+    with read_connection() as conn:
+        # Each %_data row is one leaf page; merging everything rewrites each
+        # once. The budget stops the job chasing segments written meanwhile
+        budget = 2 * conn.execute('SELECT COUNT(*) FROM resume_search_data').fetchone()[0]
+    merged, pages = 0, INITIAL_MERGE_PAGES
+    while merged < budget:
+        start = time.perf_counter()
+        with write_connection() as conn:
+            before = conn.total_changes
+            # A negative page count makes every segment eligible for merging
+            conn.execute(f"INSERT INTO resume_search (resume_search, rank) VALUES ('merge', {-pages})")
+            # Fewer than two changes means there was nothing left to merge
+            done = conn.total_changes - before < 2
+        if done:
+            break
+        merged += pages
+        seconds = time.perf_counter() - start
+        pages = _next_batch_size(pages, seconds, slice_seconds, MAX_MERGE_PAGES)
+        time.sleep(max(seconds, slice_seconds / 10))
+    return merged
+
+
+def _pragma(conn, name):
+    return conn.execute(f'PRAGMA {name}').fetchone()[0]
+
+
+def enable_incremental_vacuum(db_path=DB_PATH):
+    """Switch an existing database to auto_vacuum=INCREMENTAL.
+
+    Databases created before connections set auto_vacuum need one full
+    VACUUM for the setting to take effect. That rewrites the whole file
+    and blocks writers while it runs, so it is only done on request.
+    """
+    conn = configure_connection(sqlite3.connect(db_path, isolation_level=None))
+    try:
+        conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        conn.execute('VACUUM')
+        return _pragma(conn, 'auto_vacuum') == 2
+    finally:
+        conn.close()
+
+
+def incremental_vacuum(db_path=DB_PATH, slice_ms=SLICE_MS):
+    """Release free pages in time-sliced steps; returns pages released.
+
+    Returns None when the database is not in incremental auto_vacuum mode.
+    """
+    slice_seconds = slice_ms / 1000
+    conn = configure_connection(sqlite3.connect(db_path, isolation_level=None))
+    try:
+        if _pragma(conn, 'auto_vacuum') != 2:
+            return None
+        released, pages = 0, INITIAL_VACUUM_PAGES
+        while True:
+            free = _pragma(conn, 'freelist_count')
+            if not free:
+                return released
+            start = time.perf_counter()
+            # executescript steps the pragma to completion (execute() frees
+            # one page per step); each call is its own short write transaction
+            conn.executescript(f'PRAGMA incremental_vacuum({min(pages, free)})')
+            seconds = time.perf_counter() - start
+            released += free - _pragma(conn, 'freelist_count')
+            pages = _next_batch_size(pages, seconds, slice_seconds, MAX_VACUUM_PAGES)
+            time.sleep(max(seconds, slice_seconds / 10))
+    finally:
+        conn.close()
+
+
+def analyze(analysis_limit=ANALYSIS_LIMIT):
+    """Refresh planner statistics, sampling at most analysis_limit rows per index"""
+    with write_connection() as conn:
+        conn.execute(f'PRAGMA analysis_limit={int(analysis_limit)}')
+        try:
+            conn.execute('ANALYZE')
+        finally:
+            # The connection is the shared writer; later ANALYZEs are unlimited
+            conn.execute('PRAGMA analysis_limit=0')
+
+
+def _open_archive_read_only(archive_path):
+    return sqlite3.connect(read_only_uri(archive_path), uri=True, isolation_level=None)
+
+
+def get_archive_stats(archive_path=ARCHIVE_PATH):
+    """Size and row counts of the archive database"""
+    stats = {'size_bytes': 0, 'resumes': 0, 'ai_analyses': 0}
+    if not os.path.exists(archive_path):
+        return stats
+    try:
+        stats['size_bytes'] = os.path.getsize(archive_path)
+        conn = _open_archive_read_only(archive_path)
+        try:
+            # One read transaction, so both counts come from the same snapshot
+            conn.execute('BEGIN')
+            stats['resumes'] = conn.execute('SELECT COUNT(*) FROM archived_resumes').fetchone()[0]
+            stats['ai_analyses'] = conn.execute('SELECT COUNT(*) FROM archived_ai_analysis').fetchone()[0]
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"Error reading archive stats: {str(e)}")
+    return stats
+
+
+def load_archived_resume(resume_id, archive_path=ARCHIVE_PATH):
+    """Archived resume with its analyses and skills, or None"""
+    if not os.path.exists(archive_path):
+        return None
+    conn = _open_archive_read_only(archive_path)
+    try:
+        row = conn.execute('SELECT payload FROM archived_resumes WHERE id = ?', (resume_id,)).fetchone()
+        return decompress(row[0]) if row else None
+    finally:
+        conn.close()
+
+
+def run_maintenance(days=RETENTION_DAYS, archive_path=ARCHIVE_PATH, slice_ms=SLICE_MS,
+                    archive=True, vacuum=True, merge_search=False):
+    """Archive, vacuum and analyze; returns a summary dict"""
+    summary = {}
+    if archive:
+        summary['archived'] = archive_old_rows(days, archive_path, slice_ms)
+    if merge_search:
+        summary['search_pages_merged'] = merge_search_index(slice_ms)
+    summary['expired_sessions'] = purge_expired_sessions()
+    if vacuum:
+        summary['pages_released'] = incremental_vacuum(slice_ms=slice_ms)
+    analyze()
+    summary['archive'] = get_archive_stats(archive_path)
+    return summary
+
+
+if __name__ == '__main__':
+    from config.database import init_database
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', type=int, default=RETENTION_DAYS, help='retention horizon in days')
+    parser.add_argument('--archive-path', default=ARCHIVE_PATH)
+    parser.add_argument('--slice-ms', type=float, default=SLICE_MS,
+                        help='longest a single write transaction may hold the lock')
+    parser.add_argument('--skip-archive', action='store_true')
+    parser.add_argument('--skip-vacuum', action='store_true')
+    parser.add_argument('--merge-search', action='store_true',
+                        help='also merge the full-text index; steps can overrun the slice')
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='one-time full VACUUM converting an existing database (blocks writers)')
+    args = parser.parse_args()
+
+    init_database()
+    if args.enable_incremental_vacuum:
+        print(f"auto_vacuum=INCREMENTAL: {enable_incremental_vacuum()}")
+    summary = run_maintenance(args.days, args.archive_path, args.slice_ms,
+                              archive=not args.skip_archive, vacuum=not args.skip_vacuum,
+                              merge_search=args.merge_search)
+    for table, count in summary.get('archived', {}).items():
+        print(f"{table}: archived {count} rows older than {args.days} days")
+    print(f"auth_sessions: removed {summary['expired_sessions']} expired sessions")
+    if args.merge_search:
+        merged = summary['search_pages_merged']
+        print(f"resume_search: SQLite {sqlite3.sqlite_version} is too old to merge while writers are active; "
+              "rebuild with `python -m config.search` during a quiet period"
+              if merged is None else f"resume_search: merged {merged} pages")
+    if not args.skip_vacuum:
+        released = summary['pages_released']
+        print("incremental_vacuum: database is not in incremental mode (see --enable-incremental-vacuum)"
+              if released is None else f"incremental_vacuum: released {released} pages")
+    archive = summary['archive']
+    print(f"archive {args.archive_path}: {archive['resumes']} resumes, "
+          f"{archive['ai_analyses']} AI analyses, {archive['size_bytes']} bytes")
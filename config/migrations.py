@@ -0,0 +1,230 @@
+"""
+Numbered schema migrations for resume_data.db.
+
+Each migration is a (version, description, steps) tuple. A step is either a
+SQL string or a callable that receives a cursor. Steps must be idempotent
+(IF NOT EXISTS, INSERT OR IGNORE, ...) so a half-applied database can be
+migrated again safely. Applied versions are recorded in schema_version.
+"""
+
+from config.auth import CREATE_SESSIONS_TABLE
+from config.json_fields import convert_legacy_rows
+from config.search import CREATE_SEARCH_TABLE, rebuild_search_index, search_triggers
+from config.skills import backfill_resume_skills
+
+
+# Rollup keys derived from a resume_data row
+DAILY_METRICS_DAY = "COALESCE(date({row}.created_at), date('now'))"
+DAILY_METRICS_CATEGORY = "COALESCE(NULLIF({row}.target_category, ''), 'Other')"
+
+
+def rebuild_daily_metrics(cursor):
+    """Recompute daily_metrics from resume_data and resume_analysis"""
+    cursor.execute('DELETE FROM daily_metrics')
+    cursor.execute(f'''
+    INSERT INTO daily_metrics (
+        day, category, resume_count, ats_sum, ats_count,
+        keyword_sum, keyword_count, high_scoring
+    )
+    SELECT
+        {DAILY_METRICS_DAY.format(row='rd')},
+        {DAILY_METRICS_CATEGORY.format(row='rd')},
+        COUNT(DISTINCT rd.id),
+        COALESCE(SUM(ra.ats_score), 0),
+        COUNT(ra.ats_score),
+        COALESCE(SUM(ra.keyword_match_score), 0),
+        COUNT(ra.keyword_match_score),
+        COUNT(CASE WHEN ra.ats_score >= 70 THEN 1 END)
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    GROUP BY 1, 2
+    ''')
+
+
+def add_column(table, column, declaration):
+    """Build an idempotent ALTER TABLE ... ADD COLUMN step"""
+    def step(cursor):
+        # table_xinfo also lists generated columns, which table_info hides
+        cursor.execute(f'PRAGMA table_xinfo({table})')
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {declaration}')
+    return step
+
+
+MIGRATIONS = [
+    (1, 'Create ai_analysis table', [
+        '''
+        CREATE TABLE IF NOT EXISTS ai_analysis (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            resume_id INTEGER,
+            model_used TEXT,
+            resume_score INTEGER,
+            job_role TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+        )
+        ''',
+    ]),
+    (2, 'Indexes for dashboard hot query paths', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_created_at ON resume_analysis (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_ai_analysis_created_at ON ai_analysis (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_ai_analysis_job_role ON ai_analysis (job_role)',
+        'CREATE INDEX IF NOT EXISTS idx_ai_analysis_model_used ON ai_analysis (model_used)',
+        # users.username and users.email are UNIQUE, so sqlite already keeps
+        # an automatic index on each; no explicit index is needed for logins.
+        'ANALYZE',
+    ]),
+    (3, 'Canonical skill column and indexes on resume_skills', [
+        add_column('resume_skills', 'skill_canonical', 'TEXT'),
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_category ON resume_skills (skill_category)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_canonical ON resume_skills (skill_canonical, skill_name)',
+        backfill_resume_skills,
+    ]),
+    (4, 'Add resume_data.user_id to databases created before it existed', [
+        add_column('resume_data', 'user_id', 'INTEGER REFERENCES users (id)'),
+    ]),
+    (5, 'Daily metrics rollup maintained by insert triggers', [
+        '''
+        CREATE TABLE IF NOT EXISTS daily_metrics (
+            day TEXT NOT NULL,
+            category TEXT NOT NULL,
+            resume_count INTEGER NOT NULL DEFAULT 0,
+            ats_sum REAL NOT NULL DEFAULT 0,
+            ats_count INTEGER NOT NULL DEFAULT 0,
+            keyword_sum REAL NOT NULL DEFAULT 0,
+            keyword_count INTEGER NOT NULL DEFAULT 0,
+            high_scoring INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, category)
+        ) WITHOUT ROWID
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_resume_data_daily_metrics
+        AFTER INSERT ON resume_data
+        BEGIN
+            INSERT INTO daily_metrics (day, category, resume_count)
+            VALUES ({DAILY_METRICS_DAY.format(row='NEW')}, {DAILY_METRICS_CATEGORY.format(row='NEW')}, 1)
+            ON CONFLICT (day, category) DO UPDATE SET
+                resume_count = resume_count + 1;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_resume_analysis_daily_metrics
+        AFTER INSERT ON resume_analysis
+        BEGIN
+            INSERT INTO daily_metrics (
+                day, category, ats_sum, ats_count,
+                keyword_sum, keyword_count, high_scoring
+            )
+            SELECT
+                {DAILY_METRICS_DAY.format(row='rd')},
+                {DAILY_METRICS_CATEGORY.format(row='rd')},
+                COALESCE(NEW.ats_score, 0),
+                NEW.ats_score IS NOT NULL,
+                COALESCE(NEW.keyword_match_score, 0),
+                NEW.keyword_match_score IS NOT NULL,
+                COALESCE(NEW.ats_score >= 70, 0)
+            FROM resume_data rd
+            WHERE rd.id = NEW.resume_id
+            ON CONFLICT (day, category) DO UPDATE SET
+                ats_sum = ats_sum + excluded.ats_sum,
+                ats_count = ats_count + excluded.ats_count,
+                keyword_sum = keyword_sum + excluded.keyword_sum,
+                keyword_count = keyword_count + excluded.keyword_count,
+                high_scoring = high_scoring + excluded.high_scoring;
+        END
+        ''',
+        rebuild_daily_metrics,
+    ]),
+    (6, 'JSON resume fields with generated, indexed columns', [
+        convert_legacy_rows,
+        add_column('resume_data', 'skill_count', '''INTEGER GENERATED ALWAYS AS (
+            CASE WHEN json_valid(skills) THEN
+                CASE json_type(skills)
+                    WHEN 'array' THEN json_array_length(skills)
+                    WHEN 'object' THEN
+                        COALESCE(json_array_length(skills, '$.technical'), 0) +
+                        COALESCE(json_array_length(skills, '$.soft'), 0) +
+                        COALESCE(json_array_length(skills, '$.languages'), 0) +
+                        COALESCE(json_array_length(skills, '$.tools'), 0)
+                    ELSE 0
+                END
+            END
+        ) VIRTUAL'''),
+        add_column('resume_data', 'experience_count', '''INTEGER GENERATED ALWAYS AS (
+            CASE WHEN json_valid(experience) AND json_type(experience) = 'array'
+                THEN json_array_length(experience)
+            END
+        ) VIRTUAL'''),
+        add_column('resume_data', 'first_role', '''TEXT GENERATED ALWAYS AS (
+            CASE WHEN json_valid(experience) AND json_type(experience) = 'array' THEN
+                CASE json_type(experience, '$[0]')
+                    WHEN 'object' THEN json_extract(experience, '$[0].position')
+                    WHEN 'text' THEN json_extract(experience, '$[0]')
+                END
+            END
+        ) VIRTUAL'''),
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_skill_count ON resume_data (skill_count)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_first_role ON resume_data (first_role)',
+    ]),
+    (7, 'Indexes for the keyset-paginated resume browser', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_role_created ON resume_data (target_role, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_category_created ON resume_data (target_category, created_at)',
+        'ANALYZE',
+    ]),
+    (8, 'FTS5 full-text search over resume_data', [
+        CREATE_SEARCH_TABLE,
+        *search_triggers(),
+        rebuild_search_index,
+    ]),
+    (9, 'Signed login sessions', [
+        CREATE_SESSIONS_TABLE,
+        'CREATE INDEX IF NOT EXISTS idx_auth_sessions_expires_at ON auth_sessions (expires_at)',
+        'CREATE INDEX IF NOT EXISTS idx_auth_sessions_user_id ON auth_sessions (user_id)',
+    ]),
+]
+
+
+def ensure_schema_version_table(cursor):
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+
+def get_schema_version(cursor):
+    """Return the highest applied migration version (0 if none)"""
+    ensure_schema_version_table(cursor)
+    cursor.execute('SELECT MAX(version) FROM schema_version')
+    return cursor.fetchone()[0] or 0
+
+
+def apply_migrations(cursor, target=None):
+    """Apply pending migrations up to target (default: latest).
+
+    Must be called inside a write transaction so concurrent processes
+    serialize on the migration. Returns the list of versions applied.
+    """
+    current = get_schema_version(cursor)
+    applied = []
+
+    for version, description, steps in MIGRATIONS:
+        if version <= current or (target is not None and version > target):
+            continue
+        for step in steps:
+            if callable(step):
+                step(cursor)
+            else:
+                cursor.execute(step)
+        cursor.execute(
+            'INSERT OR IGNORE INTO schema_version (version, description) VALUES (?, ?)',
+            (version, description)
+        )
+        applied.append(version)
+
+    return applied
@@ -0,0 +1,121 @@
+"""
+Score statistics for the analytics panels.
+
+score_statistics() fetches the score and role columns of one table in a
+single query and computes everything the score charts show from that one
+result in NumPy: row and scored counts, mean, percentiles, a histogram
+over configurable bins and the same figures per role. The charts all read
+from the one structure it returns instead of issuing their own COUNT and
+AVG queries.
+"""
+
+import numpy as np
+
+from config.connection_pool import read_connection
+
+# Histogram bin edges; bins are (low, high] except the first, which also
+# includes low, so integer scores give the ranges 0-20, 21-40, ... 81-100
+DEFAULT_BINS = (0, 20, 40, 60, 80, 100)
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+# Score and role column of each source
+SCORE_SOURCES = {
+    'ai_analysis': 'SELECT resume_score, job_role FROM ai_analysis',
+    'resume_analysis': '''
+        SELECT a.ats_score, r.target_role
+        FROM resume_analysis a
+        LEFT JOIN resume_data r ON r.id = a.resume_id
+    ''',
+}
+
+
+def bin_labels(bins=DEFAULT_BINS):
+    """Range labels for histogram bins, e.g. '0-20', '21-40'"""
+    labels = []
+    for i, (low, high) in enumerate(zip(bins, bins[1:])):
+        if i and float(low).is_integer() and float(high).is_integer():
+            low = int(low) + 1
+        labels.append(f"{low:g}-{high:g}")
+    return labels
+
+
+def _summary(scores, percentiles):
+    """Mean and percentiles of a float array (zeros when empty)"""
+    if not len(scores):
+        return {'mean': 0, **{f"p{p:g}": 0 for p in percentiles}}
+    values = np.percentile(scores, percentiles)
+    summary = {'mean': round(float(scores.mean()), 1)}
+    summary.update({f"p{p:g}": round(float(v), 1) for p, v in zip(percentiles, values)})
+    return summary
+
+
+def empty_statistics(bins=DEFAULT_BINS, percentiles=DEFAULT_PERCENTILES):
+    return {
+        'count': 0,
+        'scored': 0,
+        **_summary(np.empty(0), percentiles),
+        'histogram': [{'range': label, 'count': 0} for label in bin_labels(bins)],
+        'by_role': [],
+    }
+
+
+def score_statistics(source='ai_analysis', bins=DEFAULT_BINS, percentiles=DEFAULT_PERCENTILES, conn=None):
+    """Histogram, mean, percentiles and per-role figures for a score column.
+
+    Returns a dict with 'count' (rows), 'scored' (rows with a score), 'mean',
+    one 'p<N>' entry per percentile, 'histogram' as [{'range', 'count'}] and
+    'by_role' as [{'role', 'count', 'scored', 'mean', 'p<N>'...}] ordered by
+    count. Scores outside the outer bin edges are left out of the histogram.
+    """
+    if source not in SCORE_SOURCES:
+        raise ValueError(f"Unknown score source: {source}")
+
+    try:
+        if conn is None:
+            with read_connection() as conn:
+                rows = conn.execute(SCORE_SOURCES[source]).fetchall()
+        else:
+            rows = conn.execute(SCORE_SOURCES[source]).fetchall()
+    except Exception as e:
+        print(f"Error getting {source} score statistics: {str(e)}")
+        return empty_statistics(bins, percentiles)
+    if not rows:
+        return empty_statistics(bins, percentiles)
+
+    # Role codes in order of first appearance; NaN marks a missing score
+    role_codes = {}
+    codes = np.fromiter((role_codes.setdefault(role, len(role_codes)) for _, role in rows),
+                        dtype=np.int64, count=len(rows))
+    scores = np.fromiter((np.nan if score is None else score for score, _ in rows),
+                         dtype=np.float64, count=len(rows))
+    has_score = ~np.isnan(scores)
+    scored, scored_codes = scores[has_score], codes[has_score]
+
+    edges = np.asarray(bins, dtype=np.float64)
+    in_range = scored[(scored >= edges[0]) & (scored <= edges[-1])]
+    positions = np.searchsorted(edges[1:-1], in_range, side='left')
+    counts = np.bincount(positions, minlength=len(edges) - 1)
+
+    stats = {'count': len(rows), 'scored': len(scored), **_summary(scored, percentiles)}
+    stats['histogram'] = [
+        {'range': label, 'count': int(count)} for label, count in zip(bin_labels(bins), counts)
+    ]
+
+    # Sort scored rows by role once and split into one slice per role
+    order = np.argsort(scored_codes, kind='stable')
+    role_scores = scored[order]
+    boundaries = np.searchsorted(scored_codes[order], np.arange(len(role_codes) + 1))
+    role_rows = np.bincount(codes, minlength=len(role_codes))
+
+    by_role = []
+    for role, code in role_codes.items():
+        values = role_scores[boundaries[code]:boundaries[code + 1]]
+        by_role.append({
+            'role': role,
+            'count': int(role_rows[code]),
+            'scored': len(values),
+            **_summary(values, percentiles),
+        })
+    by_role.sort(key=lambda entry: entry['count'], reverse=True)
+    stats['by_role'] = by_role
+    return stats
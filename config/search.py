@@ -0,0 +1,158 @@
+"""
+Full-text search over stored resumes.
+
+resume_search is an FTS5 table keyed by resume_data.id, holding the name,
+summary, experience, projects and skills of each resume. The JSON fields
+are flattened to their text values so keys like "company" are not
+indexed. Triggers added by migration 8 keep it in sync with resume_data.
+
+search_resumes() ranks every match with weighted BM25 through FTS5's
+rank column, so ORDER BY rank LIMIT/OFFSET is served by FTS5 itself, and
+builds highlighted snippets for the returned page only.
+"""
+
+import re
+
+from config.connection_pool import read_connection, write_connection
+
+SEARCH_COLUMNS = ('name', 'summary', 'experience', 'projects', 'skills')
+JSON_SEARCH_COLUMNS = ('experience', 'projects', 'skills')
+# BM25 weights, in SEARCH_COLUMNS order
+SEARCH_WEIGHTS = (10.0, 2.0, 1.0, 1.0, 4.0)
+
+# Snippet highlight markers; callers swap them for markup after escaping
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+SNIPPET_TOKENS = 16
+# Ranking function for FTS5's rank column
+RANK_FUNCTION = f"bm25({', '.join(map(str, SEARCH_WEIGHTS))})"
+
+CREATE_SEARCH_TABLE = f'''
+CREATE VIRTUAL TABLE IF NOT EXISTS resume_search USING fts5(
+    {', '.join(SEARCH_COLUMNS)},
+    tokenize = 'porter unicode61 remove_diacritics 2',
+    prefix = '2 3 4'
+)
+'''
+
+
+def search_text(row, column):
+    """SQL expression for the indexed text of row.column"""
+    reference = f'{row}.{column}'
+    if column not in JSON_SEARCH_COLUMNS:
+        return reference
+    return f'''CASE WHEN json_valid({reference})
+        THEN (SELECT group_concat(value, ' ') FROM json_tree({reference}) WHERE type = 'text')
+        ELSE {reference} END'''
+
+
+def search_triggers():
+    """Statements creating the resume_data -> resume_search sync triggers"""
+    columns = ', '.join(SEARCH_COLUMNS)
+    new_values = ', '.join(search_text('NEW', column) for column in SEARCH_COLUMNS)
+    changed = ' OR '.join(f'NEW.{column} IS NOT OLD.{column}' for column in SEARCH_COLUMNS)
+    return [
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_resume_search_insert
+        AFTER INSERT ON resume_data
+        BEGIN
+            INSERT INTO resume_search (rowid, {columns}) VALUES (NEW.id, {new_values});
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS trg_resume_search_update
+        AFTER UPDATE ON resume_data
+        WHEN {changed}
+        BEGIN
+            DELETE FROM resume_search WHERE rowid = OLD.id;
+            INSERT INTO resume_search (rowid, {columns}) VALUES (NEW.id, {new_values});
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_resume_search_delete
+        AFTER DELETE ON resume_data
+        BEGIN
+            DELETE FROM resume_search WHERE rowid = OLD.id;
+        END
+        ''',
+    ]
+
+
+def rebuild_search_index(cursor):
+    """Repopulate resume_search from resume_data"""
+    columns = ', '.join(SEARCH_COLUMNS)
+    values = ', '.join(search_text('rd', column) for column in SEARCH_COLUMNS)
+    cursor.execute('DELETE FROM resume_search')
+    cursor.execute(f'INSERT INTO resume_search (rowid, {columns}) SELECT rd.id, {values} FROM resume_data rd')
+    cursor.execute("INSERT INTO resume_search (resume_search) VALUES ('optimize')")
+
+
+_TOKEN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def build_match_query(text):
+    """Turn free text into an FTS5 query that matches every term.
+
+    "Quoted phrases" stay phrases and a trailing * on a word makes it a
+    prefix search. Everything else is quoted, so FTS5 operators and
+    punctuation in user input cannot cause syntax errors.
+    """
+    terms = []
+    for phrase, word in _TOKEN.findall(text or ''):
+        token = phrase if phrase else word
+        prefix = not phrase and token.endswith('*') and len(token) > 1
+        token = token.rstrip('*') if prefix else token
+        token = token.replace('"', '""').strip()
+        if token:
+            terms.append(f'"{token}"' + ('*' if prefix else ''))
+    return ' '.join(terms)
+
+
+def search_resumes(text, limit=20, offset=0):
+    """Search stored resumes, best matches first.
+
+    Every matching resume is ranked. Returns a list of dicts with id,
+    name, target_role, target_category, created_at, score (BM25, lower is
+    better) and snippet (marked with HIGHLIGHT_START/HIGHLIGHT_END).
+    """
+    match = build_match_query(text)
+    if not match:
+        return []
+    try:
+        with read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+            WITH ranked AS (
+                SELECT rowid AS id, rank AS score
+                FROM resume_search
+                WHERE resume_search MATCH :match AND rank MATCH :rank
+                ORDER BY rank
+                LIMIT :limit OFFSET :offset
+            )
+            SELECT
+                rd.id, rd.name, rd.target_role, rd.target_category, rd.created_at,
+                ranked.score,
+                (SELECT snippet(resume_search, -1, :start, :end, '…', :tokens)
+                 FROM resume_search
+                 WHERE resume_search MATCH :match AND resume_search.rowid = ranked.id) AS snippet
+            FROM ranked
+            JOIN resume_data rd ON rd.id = ranked.id
+            ORDER BY ranked.score
+            ''', {
+                'match': match, 'rank': RANK_FUNCTION, 'limit': limit, 'offset': offset,
+                'start': HIGHLIGHT_START, 'end': HIGHLIGHT_END, 'tokens': SNIPPET_TOKENS
+            })
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"Error searching resumes: {str(e)}")
+        return []
+
+
+if __name__ == '__main__':
+    from config.database import init_database
+
+    init_database()
+    with write_connection() as conn:
+        rebuild_search_index(conn.cursor())
+    print("Rebuilt resume_search")
@@ -0,0 +1,137 @@
+"""
+Skill normalization for the resume_skills table.
+
+save_resume_data() writes one resume_skills row per distinct skill so the
+dashboards can aggregate with indexed GROUP BY queries instead of parsing
+the serialized resume_data.skills column on every render.
+
+Migration 3 backfills resumes saved before resume_skills was populated.
+`python -m config.skills` runs the same backfill on demand, e.g. after rows
+were imported without going through save_resume_data().
+"""
+
+import re
+
+from config.json_fields import parse_field
+
+# Ordered (category, keywords) pairs; the first category with a keyword
+# contained in the canonical skill wins.
+SKILL_CATEGORIES = [
+    ('Programming', ['python', 'java', 'javascript', 'c++', 'programming']),
+    ('Database', ['sql', 'database', 'mongodb']),
+    ('Cloud', ['aws', 'cloud', 'azure']),
+    ('Management', ['agile', 'scrum', 'management']),
+]
+DEFAULT_CATEGORY = 'Other'
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def canonical_skill(skill):
+    """Lowercase, trim quotes/brackets and collapse whitespace"""
+    skill = str(skill).strip().strip('[]"\' ').lower()
+    return re.sub(r'\s+', ' ', skill)
+
+
+def categorize_skill(canonical):
+    """Map a canonical skill to its dashboard category"""
+    for category, keywords in SKILL_CATEGORIES:
+        if any(keyword in canonical for keyword in keywords):
+            return category
+    return DEFAULT_CATEGORY
+
+
+def iter_skill_names(skills):
+    """Flatten the skill shapes used by the app into individual names.
+
+    The analyzer passes a list of strings, the builder a dict of
+    category -> list, and stored rows hold JSON (or, for older rows, a
+    str()) of either.
+    """
+    if skills is None:
+        return
+    if isinstance(skills, str):
+        parsed = parse_field(skills)
+        if isinstance(parsed, (list, tuple, set, dict)):
+            yield from iter_skill_names(parsed)
+        else:
+            yield from skills.split(',')
+    elif isinstance(skills, dict):
+        for values in skills.values():
+            yield from iter_skill_names(values)
+    elif isinstance(skills, (list, tuple, set)):
+        for skill in skills:
+            if isinstance(skill, (list, tuple, set, dict)):
+                yield from iter_skill_names(skill)
+            elif skill is not None:
+                yield str(skill)
+    else:
+        yield str(skills)
+
+
+def normalize_skills(skills):
+    """Return (skill_name, skill_canonical, skill_category) tuples, deduplicated"""
+    seen = set()
+    normalized = []
+    for name in iter_skill_names(skills):
+        canonical = canonical_skill(name)
+        if not canonical or canonical in seen:
+            continue
+        seen.add(canonical)
+        normalized.append((name.strip().strip('[]"\' '), canonical, categorize_skill(canonical)))
+    return normalized
+
+
+def skill_rows(resume_id, skills):
+    """Build resume_skills parameter tuples for one resume"""
+    return [
+        (resume_id, name, canonical, category)
+        for name, canonical, category in normalize_skills(skills)
+    ]
+
+
+def insert_skill_rows(cursor, rows):
+    cursor.executemany('''
+    INSERT INTO resume_skills (resume_id, skill_name, skill_canonical, skill_category)
+    VALUES (?, ?, ?, ?)
+    ''', rows)
+    return len(rows)
+
+
+def insert_resume_skills(cursor, resume_id, skills):
+    """Insert one resume_skills row per distinct skill of a resume"""
+    return insert_skill_rows(cursor, skill_rows(resume_id, skills))
+
+
+def backfill_resume_skills(cursor, batch_size=BACKFILL_BATCH_SIZE):
+    """Populate resume_skills for resumes that have no skill rows yet.
+
+    Walks resume_data in id order so it can be run repeatedly; returns the
+    number of skill rows written.
+    """
+    written = 0
+    last_id = 0
+    while True:
+        cursor.execute('''
+        SELECT id, skills FROM resume_data
+        WHERE id > ?
+          AND NOT EXISTS (SELECT 1 FROM resume_skills rs WHERE rs.resume_id = resume_data.id)
+        ORDER BY id
+        LIMIT ?
+        ''', (last_id, batch_size))
+        rows = cursor.fetchall()
+        if not rows:
+            return written
+        for resume_id, skills in rows:
+            written += insert_resume_skills(cursor, resume_id, skills)
+        last_id = rows[-1][0]
+
+
+if __name__ == '__main__':
+    from config.database import init_database
+    from config.connection_pool import write_connection
+
+    init_database()
+    with write_connection() as conn:
+        count = backfill_resume_skills(conn.cursor())
+    print(f"Backfilled {count} resume_skills rows")
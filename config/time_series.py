@@ -0,0 +1,137 @@
+"""
+Bucketed time series over the created_at column of the main tables.
+
+time_series() aggregates rows per hour, day or week between start and end
+with one GROUP BY over a created_at index range, then fills the buckets
+that had no rows, so charts get a point for every bucket. created_at is
+stored in UTC (CURRENT_TIMESTAMP), so buckets are UTC days and hours and
+weeks start on Monday.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from config.connection_pool import read_connection
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# SQL bucket expression, label format and width of each bucket
+BUCKETS = {
+    'hour': ("strftime('%Y-%m-%d %H:00', created_at)", '%Y-%m-%d %H:00', timedelta(hours=1)),
+    'day': ("date(created_at)", '%Y-%m-%d', timedelta(days=1)),
+    'week': ("date(created_at, 'weekday 0', '-6 days')", '%Y-%m-%d', timedelta(weeks=1)),
+}
+
+# Metrics and group_by columns allowed per table; both are interpolated into
+# SQL, so only these names are accepted
+TABLES = {
+    'resume_data': {
+        'metrics': {'count': 'COUNT(*)'},
+        'group_by': ('target_role', 'target_category'),
+    },
+    'resume_analysis': {
+        'metrics': {'count': 'COUNT(*)', 'avg_ats_score': 'AVG(ats_score)'},
+        'group_by': (),
+    },
+    'ai_analysis': {
+        'metrics': {'count': 'COUNT(*)', 'avg_score': 'AVG(resume_score)'},
+        'group_by': ('model_used', 'job_role'),
+    },
+}
+
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _as_datetime(value):
+    """Naive UTC datetime from a datetime, date or stored timestamp string"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+def bucket_start(value, bucket='day'):
+    """Start of the bucket containing value"""
+    value = _as_datetime(value)
+    if bucket == 'hour':
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == 'week':
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def bucket_labels(start, end, bucket='day'):
+    """Labels of every bucket from the one containing start to the one containing end"""
+    _, label_format, width = BUCKETS[bucket]
+    current, last = bucket_start(start, bucket), bucket_start(end, bucket)
+    labels = []
+    while current <= last:
+        labels.append(current.strftime(label_format))
+        current += width
+    return labels
+
+
+def time_series(table, metric='count', bucket='day', start=None, end=None, group_by=None,
+                fill=0, conn=None):
+    """Aggregate table rows per time bucket between start and end.
+
+    start and end may be datetimes, dates or timestamp strings (UTC); end
+    defaults to now and start to six buckets before end. Whole buckets are
+    included at both ends. Buckets without rows get fill.
+
+    Returns (labels, values) where values is a list aligned with labels, or
+    with group_by a dict mapping each group to such a list. conn defaults
+    to a pooled read connection.
+    """
+    if table not in TABLES:
+        raise ValueError(f"Unknown time series table: {table}")
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unknown time series bucket: {bucket}")
+    metrics = TABLES[table]['metrics']
+    if metric not in metrics:
+        raise ValueError(f"Unknown metric for {table}: {metric}")
+    if group_by is not None and group_by not in TABLES[table]['group_by']:
+        raise ValueError(f"Cannot group {table} by {group_by}")
+
+    expression, _, width = BUCKETS[bucket]
+    end = _as_datetime(end) if end is not None else utc_now()
+    start = _as_datetime(start) if start is not None else bucket_start(end, bucket) - 6 * width
+    labels = bucket_labels(start, end, bucket)
+    lower = bucket_start(start, bucket)
+    upper = bucket_start(end, bucket) + width
+
+    group_column = group_by or 'NULL'
+    query = f'''
+        SELECT {expression} AS bucket, {group_column} AS grp, {metrics[metric]}
+        FROM {table}
+        WHERE created_at >= ? AND created_at < ?
+        GROUP BY bucket, grp
+    '''
+    params = (lower.strftime(TIMESTAMP_FORMAT), upper.strftime(TIMESTAMP_FORMAT))
+
+    try:
+        if conn is None:
+            with read_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+        else:
+            rows = conn.execute(query, params).fetchall()
+    except Exception as e:
+        print(f"Error querying {table} time series: {str(e)}")
+        rows = []
+
+    positions = {label: i for i, label in enumerate(labels)}
+    series = {}
+    for label, group, value in rows:
+        if label not in positions:
+            continue
+        values = series.setdefault(group, [fill] * len(labels))
+        values[positions[label]] = value if value is not None else fill
+
+    if group_by is None:
+        return labels, series.get(None, [fill] * len(labels))
+    return labels, series
@@ -0,0 +1,189 @@
+"""
+Write-behind persistence queue for resume_data.db.
+
+UI code enqueues insert jobs instead of committing on the Streamlit script
+thread. A single writer thread drains the bounded queue and applies pending
+jobs in group commits (one transaction per batch). Pending jobs are flushed
+on interpreter shutdown.
+
+Durability is selected with WORKBRIDGE_WRITE_DURABILITY:
+
+  async - submit() returns as soon as the job is queued (default)
+  sync  - submit() waits until the job's transaction has committed
+"""
+
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+from config.connection_pool import DB_PATH, get_connection_manager
+
+DURABILITY_ASYNC = 'async'
+DURABILITY_SYNC = 'sync'
+DURABILITY = os.environ.get('WORKBRIDGE_WRITE_DURABILITY', DURABILITY_ASYNC)
+
+MAX_PENDING = 1000
+# How long close() (run at exit) waits for the writer before dropping what is left
+CLOSE_TIMEOUT = float(os.environ.get('WORKBRIDGE_WRITE_CLOSE_TIMEOUT', '10'))
+MAX_BATCH = 200
+# How long the writer lingers for more jobs before committing a batch
+BATCH_WAIT_SECONDS = 0.005
+
+_STOP = object()
+
+
+class WriteBehindQueue:
+    """Bounded queue of write jobs applied by one writer thread.
+
+    A job is a callable taking a cursor; its return value becomes the
+    result of the Future returned by submit(). If a batch fails, its jobs
+    are retried one transaction each so a single bad row does not discard
+    the others.
+    """
+
+    def __init__(self, db_path=DB_PATH, durability=DURABILITY,
+                 max_pending=MAX_PENDING, max_batch=MAX_BATCH):
+        if durability not in (DURABILITY_ASYNC, DURABILITY_SYNC):
+            raise ValueError(f"Unknown durability mode: {durability}")
+        self.db_path = db_path
+        self.durability = durability
+        self.max_batch = max_batch
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write queue is closed")
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='workbridge-db-writer', daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, job):
+        """Queue a write job and return a Future for its result.
+
+        Blocks while the queue is full. In sync durability mode it also
+        waits for the commit and re-raises the job's error, if any.
+        """
+        self._ensure_started()
+        future = Future()
+        future.add_done_callback(_report_failure)
+        self._queue.put((job, future))
+        if self.durability == DURABILITY_SYNC:
+            future.result()
+        return future
+
+    def pending(self):
+        """Approximate number of jobs waiting to be written"""
+        return self._queue.qsize()
+
+    def flush(self, timeout=None):
+        """Block until every job queued so far has been committed"""
+        if self._thread is None:
+            return
+        marker = Future()
+        self._queue.put((None, marker), timeout=timeout)
+        marker.result(timeout=timeout)
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """Flush pending jobs and stop the writer thread, waiting at most timeout seconds
+
+        Jobs the writer has not started by then are dropped: their Futures
+        fail and the number dropped is logged.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put((_STOP, None), timeout=timeout)
+            thread.join(timeout)
+        except queue.Full:
+            pass
+        if thread.is_alive():
+            self._drop_pending(timeout)
+
+    def _drop_pending(self, timeout):
+        dropped = 0
+        while True:
+            try:
+                job, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if callable(job):
+                dropped += 1
+                future.set_exception(RuntimeError("Write queue closed before the write was committed"))
+            elif job is None:
+                future.set_result(None)
+        print(f"Error closing write queue: writer still busy after {timeout}s, dropped {dropped} queued writes")
+
+    def _next_batch(self):
+        batch = [self._queue.get()]
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get(timeout=BATCH_WAIT_SECONDS))
+            except queue.Empty:
+                break
+            if batch[-1][0] is None or batch[-1][0] is _STOP:
+                break
+        return batch
+
+    def _run(self):
+        manager = get_connection_manager(self.db_path)
+        while True:
+            batch = self._next_batch()
+            jobs = [(job, future) for job, future in batch if callable(job)]
+            if jobs:
+                self._commit(manager, jobs)
+
+            for job, future in batch:
+                if job is None:
+                    future.set_result(None)
+            if any(job is _STOP for job, _ in batch):
+                return
+
+    def _commit(self, manager, jobs):
+        try:
+            with manager.write() as conn:
+                cursor = conn.cursor()
+                results = [job(cursor) for job, _ in jobs]
+        except Exception as e:
+            if len(jobs) == 1:
+                jobs[0][1].set_exception(e)
+            else:
+                for job in jobs:
+                    self._commit(manager, [job])
+            return
+
+        for (_, future), result in zip(jobs, results):
+            future.set_result(result)
+
+
+def _report_failure(future):
+    # Async callers usually drop the Future, so surface errors here
+    error = future.exception()
+    if error is not None:
+        print(f"Error in queued database write: {error}")
+
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """Return the process-wide write-behind queue, creating it on first use"""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            _write_queue = WriteBehindQueue()
+            atexit.register(_write_queue.close)
+        return _write_queue
@@ -2,16 +2,39 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-from config.database import get_database_connection
+from datetime import datetime, timedelta, timezone
+from config.connection_pool import get_read_only_pool
+from config.maintenance import get_archive_stats
+from config.score_stats import score_statistics
+from config.search import HIGHLIGHT_END, HIGHLIGHT_START, search_resumes
+from config.time_series import time_series
+from dashboard.exports import iter_csv, iter_jsonl, spool, xlsx_file
+from dashboard.resume_browser import PAGE_SIZE, fetch_resume_page, filter_options, resume_query
 import io
 import uuid
 from plotly.subplots import make_subplots
 from io import BytesIO
+import html
+
+SEARCH_PAGE_SIZE = 20
+
+def format_size(size_bytes):
+    """Human-readable byte count"""
+    if size_bytes < 1024:
+        return f"{size_bytes} bytes"
+    if size_bytes < 1024 * 1024:
+        return f"{size_bytes/1024:.1f} KB"
+    return f"{size_bytes/(1024*1024):.1f} MB"
+
+def utc_day(days_ago=0):
+    """UTC date string matching daily_metrics.day (SQLite's date('now'))"""
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime('%Y-%m-%d')
 
 class DashboardManager:
     def __init__(self):
-        self.conn = get_database_connection()
+        # Shared read-only connections, checked out per query; a rerun
+        # constructs a new manager but never opens a connection of its own
+        self.pool = get_read_only_pool()
         self.colors = {
             'primary': '#4CAF50',
             'secondary': '#2196F3',
@@ -110,286 +133,279 @@ class DashboardManager:
         """, unsafe_allow_html=True)
 
     def get_resume_metrics(self):
-        """Get resume-related metrics from database"""
-        cursor = self.conn.cursor()
-        
-        # Get current date
-        now = datetime.now()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        start_of_week = now - timedelta(days=now.weekday())
-        start_of_month = now.replace(day=1)
+        """Get resume-related metrics from the daily_metrics rollup"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            # Period boundaries in UTC, like the daily_metrics.day the triggers write
+            now = datetime.now(timezone.utc)
+            start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            start_of_week = start_of_day - timedelta(days=now.weekday())
+            start_of_month = start_of_day.replace(day=1)
         
-        # Fetch metrics for different time periods
-        metrics = {}
-        for period, start_date in [
-            ('Today', start_of_day),
-            ('This Week', start_of_week),
-            ('This Month', start_of_month),
-            ('All Time', datetime(2000, 1, 1))
-        ]:
-            cursor.execute("""
-                SELECT 
-                    COUNT(DISTINCT rd.id) as total_resumes,
-                    ROUND(AVG(ra.ats_score), 1) as avg_ats_score,
-                    ROUND(AVG(ra.keyword_match_score), 1) as avg_keyword_score,
-                    COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END) as high_scoring
-                FROM resume_data rd
-                LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-                WHERE rd.created_at >= ?
-            """, (start_date.strftime('%Y-%m-%d %H:%M:%S'),))
+            # Fetch metrics for different time periods
+            metrics = {}
+            for period, start_date in [
+                ('Today', start_of_day),
+                ('This Week', start_of_week),
+                ('This Month', start_of_month),
+                ('All Time', datetime(2000, 1, 1, tzinfo=timezone.utc))
+            ]:
+                cursor.execute("""
+                    SELECT 
+                        SUM(resume_count) as total_resumes,
+                        ROUND(SUM(ats_sum) / NULLIF(SUM(ats_count), 0), 1) as avg_ats_score,
+                        ROUND(SUM(keyword_sum) / NULLIF(SUM(keyword_count), 0), 1) as avg_keyword_score,
+                        SUM(high_scoring) as high_scoring
+                    FROM daily_metrics
+                    WHERE day >= ?
+                """, (start_date.strftime('%Y-%m-%d'),))
             
-            row = cursor.fetchone()
-            if row:
-                metrics[period] = {
-                    'total': row[0] or 0,
-                    'ats_score': row[1] or 0,
-                    'keyword_score': row[2] or 0,
-                    'high_scoring': row[3] or 0
-                }
-            else:
-                metrics[period] = {
-                    'total': 0,
-                    'ats_score': 0,
-                    'keyword_score': 0,
-                    'high_scoring': 0
-                }
+                row = cursor.fetchone()
+                if row:
+                    metrics[period] = {
+                        'total': row[0] or 0,
+                        'ats_score': row[1] or 0,
+                        'keyword_score': row[2] or 0,
+                        'high_scoring': row[3] or 0
+                    }
+                else:
+                    metrics[period] = {
+                        'total': 0,
+                        'ats_score': 0,
+                        'keyword_score': 0,
+                        'high_scoring': 0
+                    }
         
-        return metrics
+            return metrics
+
+    def get_ats_statistics(self):
+        """ATS score mean, percentiles and histogram from one scan of resume_analysis"""
+        with self.pool.connection() as conn:
+            return score_statistics('resume_analysis', conn=conn)
 
     def get_skill_distribution(self):
         """Get skill distribution data"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            WITH RECURSIVE split(skill, rest) AS (
-                SELECT '', skills || ','
-                FROM resume_data
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split
-                WHERE rest <> ''
-            ),
-            SkillCategories AS (
-                SELECT 
-                    CASE 
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%python%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%java%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%javascript%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%c++%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%programming%' THEN 'Programming'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%sql%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%database%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%mongodb%' THEN 'Database'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%aws%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%cloud%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%azure%' THEN 'Cloud'
-                        WHEN LOWER(TRIM(skill, '[]" ')) LIKE '%agile%' OR LOWER(TRIM(skill, '[]" ')) LIKE '%scrum%' OR 
-                             LOWER(TRIM(skill, '[]" ')) LIKE '%management%' THEN 'Management'
-                        ELSE 'Other'
-                    END as category,
-                    COUNT(*) as count
-                FROM split
-                WHERE skill <> ''
-                GROUP BY category
-            )
-            SELECT category, count
-            FROM SkillCategories
-            ORDER BY count DESC
-        """)
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT skill_category as category, COUNT(*) as count
+                FROM resume_skills
+                GROUP BY skill_category
+                ORDER BY count DESC
+            """)
         
-        categories, counts = [], []
-        for row in cursor.fetchall():
-            categories.append(row[0])
-            counts.append(row[1])
+            categories, counts = [], []
+            for row in cursor.fetchall():
+                categories.append(row[0])
+                counts.append(row[1])
             
-        return categories, counts
+            return categories, counts
 
     def get_weekly_trends(self):
-        """Get weekly submission trends"""
-        cursor = self.conn.cursor()
-        now = datetime.now()
-        dates = [(now - timedelta(days=x)).strftime('%Y-%m-%d') for x in range(6, -1, -1)]
+        """Get submissions per day for the last seven days"""
+        with self.pool.connection() as conn:
+            days, submissions = time_series('resume_data', bucket='day', start=utc_day(6), conn=conn)
         
-        submissions = []
-        for date in dates:
-            cursor.execute("""
-                SELECT COUNT(*) 
-                FROM resume_data 
-                WHERE DATE(created_at) = DATE(?)
-            """, (date,))
-            submissions.append(cursor.fetchone()[0])
-            
-        return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
+        # Shortened weekday labels (e.g., 'Mon', 'Tue')
+        return [datetime.strptime(day, '%Y-%m-%d').strftime('%a') for day in days], submissions
 
     def get_job_category_stats(self):
         """Get statistics by job category"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT 
-                COALESCE(target_category, 'Other') as category,
-                COUNT(*) as count,
-                ROUND(AVG(CASE WHEN ra.ats_score >= 70 THEN 1 ELSE 0 END) * 100, 1) as success_rate
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 5
-        """)
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    category,
+                    SUM(resume_count) as count,
+                    ROUND(SUM(high_scoring) * 100.0 / NULLIF(SUM(resume_count), 0), 1) as success_rate
+                FROM daily_metrics
+                GROUP BY category
+                ORDER BY count DESC
+                LIMIT 5
+            """)
         
-        categories, success_rates = [], []
-        for row in cursor.fetchall():
-            categories.append(row[0])
-            success_rates.append(row[2] or 0)
+            categories, success_rates = [], []
+            for row in cursor.fetchall():
+                categories.append(row[0])
+                success_rates.append(row[2] or 0)
             
-        return categories, success_rates
+            return categories, success_rates
 
 
             
-        st.sidebar.markdown("### 🛠️ Admin Tools")
+            st.sidebar.markdown("### 🛠️ Admin Tools")
         
-        # Data Export Options
-        export_format = st.sidebar.selectbox(
-            "Export Format",
-            ["Excel", "CSV", "JSON"],
-            key="export_format"
-        )
+            # Data Export Options
+            export_format = st.sidebar.selectbox(
+                "Export Format",
+                ["Excel", "CSV", "JSON"],
+                key="export_format"
+            )
         
-        if st.sidebar.button("📥 Export Data"):
-            if export_format == "Excel":
-                excel_data = self.export_to_excel()
-                if excel_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download Excel",
-                        data=excel_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
-            elif export_format == "CSV":
-                csv_data = self.export_to_csv()
-                if csv_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download CSV",
-                        data=csv_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv"
-                    )
-            else:
-                json_data = self.export_to_json()
-                if json_data:
-                    st.sidebar.download_button(
-                        "⬇️ Download JSON",
-                        data=json_data,
-                        file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
-                        mime="application/json"
-                    )
+            if st.sidebar.button("📥 Export Data"):
+                if export_format == "Excel":
+                    excel_data = self.export_to_excel()
+                    if excel_data:
+                        st.sidebar.download_button(
+                            "⬇️ Download Excel",
+                            data=excel_data,
+                            file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        )
+                elif export_format == "CSV":
+                    csv_data = self.export_to_csv()
+                    if csv_data:
+                        st.sidebar.download_button(
+                            "⬇️ Download CSV",
+                            data=csv_data,
+                            file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                            mime="text/csv"
+                        )
+                else:
+                    json_data = self.export_to_json()
+                    if json_data:
+                        st.sidebar.download_button(
+                            "⬇️ Download JSON",
+                            data=json_data,
+                            file_name=f"resume_data_{datetime.now().strftime('%Y%m%d_%H%M')}.jsonl",
+                            mime="application/x-ndjson"
+                        )
 
-        # Database Stats
-        st.sidebar.markdown("### 📊 Database Stats")
-        stats = self.get_database_stats()
-        st.sidebar.markdown(f"""
-            - Total Resumes: {stats['total_resumes']}
-            - Today's Submissions: {stats['today_submissions']}
-            - Storage Used: {stats['storage_size']}
-        """)
+            # Database Stats
+            st.sidebar.markdown("### 📊 Database Stats")
+            stats = self.get_database_stats()
+            st.sidebar.markdown(f"""
+                - Total Resumes: {stats['total_resumes']}
+                - Today's Submissions: {stats['today_submissions']}
+                - Live Storage: {stats['storage_size']} ({stats['reclaimable_size']} reclaimable)
+                - Archived: {stats['archived_resumes']} resumes ({stats['archive_size']})
+            """)
 
-    def get_resume_data(self):
-        """Get all resume data"""
-        cursor = self.conn.cursor()
+    def get_resume_data(self, filters=None, sort='created_at', descending=True, after=None,
+                        page_size=PAGE_SIZE):
+        """Get one page of resume data; returns (rows, next_cursor)"""
         try:
-            cursor.execute('''
-            SELECT 
-                r.id,
-                r.name,
-                r.email,
-                r.phone,
-                r.linkedin,
-                r.github,
-                r.portfolio,
-                r.target_role,
-                r.target_category,
-                r.created_at,
-                a.ats_score,
-                a.keyword_match_score,
-                a.format_score,
-                a.section_score
-            FROM resume_data r
-            LEFT JOIN resume_analysis a ON r.id = a.resume_id
-            ORDER BY r.created_at DESC
-            ''')
-            return cursor.fetchall()
+            with self.pool.connection() as conn:
+                return fetch_resume_page(conn, filters, sort, descending, after, page_size)
         except Exception as e:
             print(f"Error fetching resume data: {str(e)}")
-            return []
+            return [], None
 
     def render_resume_data_section(self):
-        """Render resume data section with Excel download"""
+        """Render the paginated resume browser with Excel download"""
         st.markdown("<h2 class='section-title'>Resume Submissions</h2>", unsafe_allow_html=True)
         
-        # Get resume data
-        resume_data = self.get_resume_data()
+        # Style the dataframe
+        st.markdown("""
+        <style>
+        .resume-data {
+            background-color: #2D2D2D;
+            border-radius: 10px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+        }
+        </style>
+        """, unsafe_allow_html=True)
         
-        if resume_data:
-            # Convert to DataFrame
-            columns = [
-                'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 
-                'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
-                'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
-            ]
-            df = pd.DataFrame(resume_data, columns=columns)
+        with self.pool.connection() as conn:
+            roles, categories = filter_options(conn)
+        
+        with st.container():
+            st.markdown('<div class="resume-data">', unsafe_allow_html=True)
+            
+            # Add filters
+            col1, col2 = st.columns(2)
+            with col1:
+                target_role = st.selectbox(
+                    "Filter by Target Role",
+                    options=["All"] + roles,
+                    key="role_filter"
+                )
+            with col2:
+                target_category = st.selectbox(
+                    "Filter by Category",
+                    options=["All"] + categories,
+                    key="category_filter"
+                )
             
-            # Format scores as percentages
-            score_columns = ['ATS Score', 'Keyword Match', 'Format Score', 'Section Score']
-            for col in score_columns:
-                df[col] = df[col].apply(lambda x: f"{x*100:.1f}%" if pd.notnull(x) else "N/A")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                score_range = st.slider("ATS Score", 0, 100, (0, 100), key="score_filter")
+            with col2:
+                date_range = st.date_input("Submission Date", value=(), key="date_filter")
+            with col3:
+                sort_labels = {
+                    'Submission Date': 'created_at',
+                    'ATS Score': 'ats_score',
+                    'Name': 'name',
+                    'Target Role': 'target_role'
+                }
+                sort_label = st.selectbox("Sort by", list(sort_labels), key="sort_filter")
+                descending = st.toggle("Descending", value=True, key="sort_descending")
             
-            # Style the dataframe
-            st.markdown("""
-            <style>
-            .resume-data {
-                background-color: #2D2D2D;
-                border-radius: 10px;
-                padding: 1rem;
-                margin-bottom: 1rem;
+            filters = {
+                'role': None if target_role == "All" else target_role,
+                'category': None if target_category == "All" else target_category,
+                'min_score': score_range[0] if score_range[0] > 0 else None,
+                'max_score': score_range[1] if score_range[1] < 100 else None,
+                'start_date': date_range[0] if len(date_range) > 0 else None,
+                'end_date': date_range[1] if len(date_range) > 1 else None
             }
-            </style>
-            """, unsafe_allow_html=True)
+            sort = sort_labels[sort_label]
             
-            with st.container():
-                st.markdown('<div class="resume-data">', unsafe_allow_html=True)
-                
-                # Add filters
-                col1, col2 = st.columns(2)
-                with col1:
-                    target_role = st.selectbox(
-                        "Filter by Target Role",
-                        options=["All"] + list(df['Target Role'].unique()),
-                        key="role_filter"
-                    )
-                with col2:
-                    target_category = st.selectbox(
-                        "Filter by Category",
-                        options=["All"] + list(df['Target Category'].unique()),
-                        key="category_filter"
-                    )
+            # Page cursors are kept per filter/sort combination; changing either
+            # goes back to the first page
+            page_key = (tuple(filters.items()), sort, descending)
+            if st.session_state.get('resume_page_key') != page_key:
+                st.session_state.resume_page_key = page_key
+                st.session_state.resume_page_cursors = [None]
+            cursors = st.session_state.resume_page_cursors
+            
+            resume_data, next_cursor = self.get_resume_data(filters, sort, descending, cursors[-1])
+            
+            if resume_data:
+                # Convert to DataFrame
+                columns = [
+                    'ID', 'Name', 'Email', 'Phone', 'LinkedIn', 'GitHub', 
+                    'Portfolio', 'Target Role', 'Target Category', 'Submission Date',
+                    'ATS Score', 'Keyword Match', 'Format Score', 'Section Score'
+                ]
+                df = pd.DataFrame(resume_data, columns=columns)
                 
-                # Apply filters
-                filtered_df = df.copy()
-                if target_role != "All":
-                    filtered_df = filtered_df[filtered_df['Target Role'] == target_role]
-                if target_category != "All":
-                    filtered_df = filtered_df[filtered_df['Target Category'] == target_category]
+                # Format scores as percentages
+                score_columns = ['ATS Score', 'Keyword Match', 'Format Score', 'Section Score']
+                for col in score_columns:
+                    df[col] = df[col].apply(lambda x: f"{x*100:.1f}%" if pd.notnull(x) else "N/A")
                 
-                # Display filtered data
+                # Display the current page
                 st.dataframe(
-                    filtered_df,
+                    df,
                     use_container_width=True,
                     hide_index=True
                 )
-                
-                # Add download buttons
-                col1, col2 = st.columns(2)
-                with col1:
-                    # Download filtered data
-                    excel_buffer = BytesIO()
-                    filtered_df.to_excel(excel_buffer, index=False, engine='openpyxl')
-                    excel_buffer.seek(0)
+            else:
+                st.info("No resume submissions available")
+            
+            # Pagination
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                if st.button("← Previous", disabled=len(cursors) == 1, key="resume_page_prev"):
+                    cursors.pop()
+                    st.rerun()
+            with col2:
+                st.markdown(f"Page {len(cursors)}")
+            with col3:
+                if st.button("Next →", disabled=next_cursor is None, key="resume_page_next"):
+                    cursors.append(next_cursor)
+                    st.rerun()
+            
+            # Downloads are only built on request
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("📥 Prepare Filtered Data", key="prepare_filtered_data"):
+                    query, params = resume_query(filters, sort, descending, with_sort_key=False)
+                    with self.pool.connection() as conn:
+                        excel_buffer = xlsx_file(conn, query, params)
                     
                     st.download_button(
                         label="📥 Download Filtered Data",
@@ -398,160 +414,88 @@ class DashboardManager:
                         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                         key="download_filtered_data"
                     )
-                
-                with col2:
-                    # Download all data
-                    excel_buffer_all = BytesIO()
-                    df.to_excel(excel_buffer_all, index=False, engine='openpyxl')
-                    excel_buffer_all.seek(0)
-                    
-                    st.download_button(
-                        label="📥 Download All Data",
-                        data=excel_buffer_all,
-                        file_name=f"resume_data_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        key="download_all_data"
-                    )
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-        else:
-            st.info("No resume submissions available")
+            
+            with col2:
+                if st.button("📥 Prepare All Data", key="prepare_all_data"):
+                    excel_buffer_all = self.export_to_excel()
+                    if excel_buffer_all:
+                        st.download_button(
+                            label="📥 Download All Data",
+                            data=excel_buffer_all,
+                            file_name=f"resume_data_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            key="download_all_data"
+                        )
+            
+            st.markdown('</div>', unsafe_allow_html=True)
 
 
 
     def export_to_excel(self):
-        """Export data to Excel format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to Excel format, as a rewound file object"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            
-            # Create Excel writer object
-            output = BytesIO()
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                # Write main data
-                df.to_excel(writer, sheet_name='Resume Data', index=False)
-                
-                # Get the workbook and the worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Resume Data']
-                
-                # Add formatting
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'text_wrap': True,
-                    'valign': 'top',
-                    'fg_color': '#D7E4BC',
-                    'border': 1
-                })
-                
-                # Write headers with formatting
-                for col_num, value in enumerate(df.columns.values):
-                    worksheet.write(0, col_num, value, header_format)
-                    
-                # Auto-adjust columns' width
-                for i, col in enumerate(df.columns):
-                    max_length = max(
-                        df[col].astype(str).apply(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(i, i, min(max_length, 50))
-            
-            # Return the Excel file
-            output.seek(0)
-            return output.getvalue()
-            
+            with self.pool.connection() as conn:
+                return xlsx_file(conn)
         except Exception as e:
             st.error(f"Error exporting to Excel: {str(e)}")
             return None
 
     def export_to_csv(self):
-        """Export data to CSV format"""
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to CSV format, as a rewound file object"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_csv(index=False).encode('utf-8')
+            with self.pool.connection() as conn:
+                return spool(iter_csv(conn))
         except Exception as e:
             st.error(f"Error exporting to CSV: {str(e)}")
             return None
 
     def export_to_json(self):
-        """Export data to JSON format"""
-        query = """
-            SELECT 
-                rd.*, ra.*
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
+        """Export data to JSON Lines format, as a rewound file object"""
         try:
-            df = pd.read_sql_query(query, self.conn)
-            return df.to_json(orient='records', date_format='iso')
+            with self.pool.connection() as conn:
+                return spool(iter_jsonl(conn))
         except Exception as e:
             st.error(f"Error exporting to JSON: {str(e)}")
             return None
 
     def get_database_stats(self):
         """Get database statistics"""
-        cursor = self.conn.cursor()
         stats = {}
         
-        # Total resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        stats['total_resumes'] = cursor.fetchone()[0]
-        
-        # Today's submissions
-        cursor.execute("""
-            SELECT COUNT(*) 
-            FROM resume_data 
-            WHERE DATE(created_at) = DATE('now')
-        """)
-        stats['today_submissions'] = cursor.fetchone()[0]
-        
-        # Database size (approximate)
-        cursor.execute("PRAGMA page_count")
-        page_count = cursor.fetchone()[0]
-        cursor.execute("PRAGMA page_size")
-        page_size = cursor.fetchone()[0]
-        size_bytes = page_count * page_size
-        
-        if size_bytes < 1024:
-            stats['storage_size'] = f"{size_bytes} bytes"
-        elif size_bytes < 1024 * 1024:
-            stats['storage_size'] = f"{size_bytes/1024:.1f} KB"
-        else:
-            stats['storage_size'] = f"{size_bytes/(1024*1024):.1f} MB"
+        # Total resumes and today's submissions
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 
+                    COALESCE(SUM(resume_count), 0),
+                    COALESCE(SUM(CASE WHEN day = ? THEN resume_count END), 0)
+                FROM daily_metrics
+            """, (utc_day(),))
+            stats['total_resumes'], stats['today_submissions'] = cursor.fetchone()
         
+        # Live database size; free pages are reclaimed by config.maintenance
+        with self.pool.connection() as conn:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        stats['storage_size'] = format_size(page_count * page_size)
+        stats['reclaimable_size'] = format_size(free_pages * page_size)
+
+        archive = get_archive_stats()
+        stats['archived_resumes'] = archive['resumes']
+        stats['archive_size'] = format_size(archive['size_bytes'])
+
         return stats
 
     def get_admin_logs(self):
         """Get admin logs"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute('''
-            SELECT admin_email, action, timestamp
-            FROM admin_logs
-            ORDER BY timestamp DESC
-            ''')
-            return cursor.fetchall()
+            with self.pool.connection() as conn:
+                return conn.execute('''
+                SELECT admin_email, action, timestamp
+                FROM admin_logs
+                ORDER BY timestamp DESC
+                ''').fetchall()
         except Exception as e:
             print(f"Error fetching admin logs: {str(e)}")
             return []
@@ -735,8 +679,13 @@ class DashboardManager:
         
         with col1:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            fig = self.create_enhanced_ats_gauge(float(stats['Avg ATS Score'].rstrip('%')))
+            ats_stats = self.get_ats_statistics()
+            fig = self.create_enhanced_ats_gauge(ats_stats['mean'])
             st.plotly_chart(fig, use_container_width=True)
+            metric_cols = st.columns(3)
+            metric_cols[0].metric("Median ATS", ats_stats['p50'])
+            metric_cols[1].metric("90th Percentile", ats_stats['p90'])
+            metric_cols[2].metric("99th Percentile", ats_stats['p99'])
             st.markdown('</div>', unsafe_allow_html=True)
 
         with col2:
@@ -783,136 +732,153 @@ class DashboardManager:
             """, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+        # Resume Search Section
+        st.markdown('<div class="section-title">🔍 Resume Search</div>', unsafe_allow_html=True)
+        self.render_resume_search_section()
 
+    def render_resume_search_section(self):
+        """Render full-text search over stored resumes"""
+        query = st.text_input(
+            "Search resumes",
+            placeholder='e.g. kubernetes bangalore, "machine learning", pyth*',
+            key="resume_search_query"
+        )
+        if not query:
+            return
+        
+        results = search_resumes(query, limit=SEARCH_PAGE_SIZE)
+        if not results:
+            st.info("No resumes match your search")
+            return
+        
+        for result in results:
+            # Escape stored text before adding highlight markup
+            snippet = html.escape(result['snippet'] or '')
+            snippet = snippet.replace(HIGHLIGHT_START, '<mark>').replace(HIGHLIGHT_END, '</mark>')
+            st.markdown(f"""
+                <div class="insight-card">
+                    <h3 style="color: #4FD1C5; margin-bottom: 0.5rem;">
+                        {html.escape(result['name'] or 'Unnamed')} · {html.escape(result['target_role'] or 'No target role')}
+                    </h3>
+                    <p style="color: rgba(255, 255, 255, 0.7); margin: 0;">{snippet}</p>
+                    <p style="color: rgba(255, 255, 255, 0.5); margin-top: 0.5rem; font-size: 0.85rem;">
+                        #{result['id']} · {html.escape(result['target_category'] or 'Other')} · {result['created_at']}
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
 
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
-        cursor = self.conn.cursor()
         indicators = {}
         
-        # Compare with last week's data
+        # Compare all-time totals with the totals as of last week
+        try:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT 
+                        SUM(resume_count),
+                        SUM(CASE WHEN day < ? THEN resume_count END),
+                        SUM(ats_sum) / NULLIF(SUM(ats_count), 0),
+                        SUM(CASE WHEN day < ? THEN ats_sum END) /
+                            NULLIF(SUM(CASE WHEN day < ? THEN ats_count END), 0),
+                        SUM(high_scoring),
+                        SUM(CASE WHEN day < ? THEN high_scoring END)
+                    FROM daily_metrics
+                """, (utc_day(7),) * 4)
+                total, prev_total, ats, prev_ats, high, prev_high = cursor.fetchone()
+            pairs = {
+                'resumes': (total, prev_total),
+                'ats': (ats, prev_ats),
+                'high_performing': (high, prev_high),
+                'success_rate': (
+                    high * 100.0 / total if total else None,
+                    prev_high * 100.0 / prev_total if prev_total else None
+                )
+            }
+        except Exception:
+            pairs = {}
+        
         for metric in ['resumes', 'ats', 'high_performing', 'success_rate']:
-            try:
-                if metric == 'resumes':
-                    cursor.execute("""
-                        SELECT 
-                            (COUNT(*) - (
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT COUNT(*) 
-                                FROM resume_data 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_data
-                    """)
-                elif metric == 'ats':
-                    cursor.execute("""
-                        SELECT 
-                            (AVG(ats_score) - (
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            )) * 100.0 / 
-                            NULLIF((
-                                SELECT AVG(ats_score) 
-                                FROM resume_analysis 
-                                WHERE created_at < date('now', '-7 days')
-                            ), 0)
-                        FROM resume_analysis
-                    """)
-                
-                change = cursor.fetchone()[0] or 0
-                indicators[metric] = {
-                    'value': abs(round(change, 1)),
-                    'icon': '↑' if change >= 0 else '↓',
-                    'class': 'trend-up' if change >= 0 else 'trend-down'
-                }
-            except Exception:
+            current, previous = pairs.get(metric, (None, None))
+            if current is None or not previous:
                 indicators[metric] = {
                     'value': 0,
                     'icon': '→',
                     'class': 'trend-neutral'
                 }
+                continue
+            
+            change = (current - previous) * 100.0 / previous
+            indicators[metric] = {
+                'value': abs(round(change, 1)),
+                'icon': '↑' if change >= 0 else '↓',
+                'class': 'trend-up' if change >= 0 else 'trend-down'
+            }
         
         return indicators
 
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
-        cursor = self.conn.cursor()
         insights = []
         
-        # Most Successful Job Category
-        cursor.execute("""
-            SELECT target_category, AVG(ats_score) as avg_score,
-                   COUNT(*) as submission_count
-            FROM resume_data rd
-            JOIN resume_analysis ra ON rd.id = ra.resume_id
-            GROUP BY target_category
-            ORDER BY avg_score DESC
-            LIMIT 1
-        """)
-        top_category = cursor.fetchone()
-        if top_category:
-            insights.append({
-                'title': 'Top Performing Category',
-                'icon': '🏆',
-                'description': f"{top_category[0]} leads with {top_category[1]:.1f}% average ATS score across {top_category[2]} submissions",
-                'trend_class': 'trend-up',
-                'trend_icon': '↑',
-                'trend_value': f"{top_category[1]:.1f}%"
-            })
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            # Most Successful Job Category
+            cursor.execute("""
+                SELECT category, SUM(ats_sum) / SUM(ats_count) as avg_score,
+                       SUM(ats_count) as submission_count
+                FROM daily_metrics
+                GROUP BY category
+                HAVING SUM(ats_count) > 0
+                ORDER BY avg_score DESC
+                LIMIT 1
+            """)
+            top_category = cursor.fetchone()
+            if top_category:
+                insights.append({
+                    'title': 'Top Performing Category',
+                    'icon': '🏆',
+                    'description': f"{top_category[0]} leads with {top_category[1]:.1f}% average ATS score across {top_category[2]} submissions",
+                    'trend_class': 'trend-up',
+                    'trend_icon': '↑',
+                    'trend_value': f"{top_category[1]:.1f}%"
+                })
         
-        # Recent Improvement
-        cursor.execute("""
-            SELECT 
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at >= date('now', '-7 days')) as recent_score,
-                (SELECT AVG(ats_score) FROM resume_analysis 
-                 WHERE created_at < date('now', '-7 days')) as old_score
-        """)
-        scores = cursor.fetchone()
-        if scores and scores[0] and scores[1]:
-            change = scores[0] - scores[1]
-            insights.append({
-                'title': 'Weekly Trend',
-                'icon': '📈',
-                'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
-                'trend_class': 'trend-up' if change >= 0 else 'trend-down',
-                'trend_icon': '↑' if change >= 0 else '↓',
-                'trend_value': f"{abs(change):.1f}%"
-            })
+            # Recent Improvement
+            cursor.execute("""
+                SELECT 
+                    SUM(CASE WHEN day >= ? THEN ats_sum END) /
+                        SUM(CASE WHEN day >= ? THEN ats_count END) as recent_score,
+                    SUM(CASE WHEN day < ? THEN ats_sum END) /
+                        SUM(CASE WHEN day < ? THEN ats_count END) as old_score
+                FROM daily_metrics
+            """, (utc_day(7),) * 4)
+            scores = cursor.fetchone()
+            if scores and scores[0] and scores[1]:
+                change = scores[0] - scores[1]
+                insights.append({
+                    'title': 'Weekly Trend',
+                    'icon': '📈',
+                    'description': f"ATS scores have {'improved' if change >= 0 else 'decreased'} by {abs(change):.1f}% in the last week",
+                    'trend_class': 'trend-up' if change >= 0 else 'trend-down',
+                    'trend_icon': '↑' if change >= 0 else '↓',
+                    'trend_value': f"{abs(change):.1f}%"
+                })
         
         # Most Common Skills
-        cursor.execute("""
-            WITH RECURSIVE
-            split(skill, rest) AS (
-                SELECT '', skills || ',' 
-                FROM resume_data 
-                WHERE skills IS NOT NULL
-                UNION ALL
-                SELECT
-                    substr(rest, 0, instr(rest, ',')),
-                    substr(rest, instr(rest, ',') + 1)
-                FROM split 
-                WHERE rest <> ''
-            ),
-            cleaned_skills AS (
-                SELECT TRIM(REPLACE(REPLACE(skill, '[', ''), ']', '')) as skill
-                FROM split 
-                WHERE skill <> ''
-            )
-            SELECT skill, COUNT(*) as count
-            FROM cleaned_skills
-            GROUP BY skill
-            ORDER BY count DESC
-            LIMIT 3
-        """)
-        top_skills = cursor.fetchall()
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT MIN(skill_name) as skill, COUNT(*) as count
+                FROM resume_skills
+                GROUP BY skill_canonical
+                ORDER BY count DESC
+                LIMIT 3
+            """)
+            top_skills = cursor.fetchall()
         if top_skills:
-            skills_text = f"Most in-demand skills: Python ({top_skills[0][1]} resumes), Java ({top_skills[1][1]} resumes), Express ({top_skills[2][1]} resumes)"
+            skills_text = ", ".join(f"{skill} ({count} resumes)" for skill, count in top_skills)
             insights.append({
                 'title': 'Top Skills',
                 'icon': '💡',
@@ -926,29 +892,28 @@ class DashboardManager:
 
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
-        cursor = self.conn.cursor()
-        
-        # Total Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_data")
-        total_resumes = cursor.fetchone()[0]
-        
-        # Average ATS Score
-        cursor.execute("SELECT AVG(ats_score) FROM resume_analysis")
-        avg_ats = cursor.fetchone()[0] or 0
-        
-        # High Performing Resumes
-        cursor.execute("SELECT COUNT(*) FROM resume_analysis WHERE ats_score >= 70")
-        high_performing = cursor.fetchone()[0]
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            # Total resumes, average ATS score and high performing resumes
+            cursor.execute("""
+                SELECT 
+                    COALESCE(SUM(resume_count), 0),
+                    SUM(ats_sum) / NULLIF(SUM(ats_count), 0),
+                    COALESCE(SUM(high_scoring), 0)
+                FROM daily_metrics
+            """)
+            total_resumes, avg_ats, high_performing = cursor.fetchone()
+            avg_ats = avg_ats or 0
         
-        # Success Rate
-        success_rate = (high_performing / total_resumes * 100) if total_resumes > 0 else 0
+            # Success Rate
+            success_rate = (high_performing / total_resumes * 100) if total_resumes > 0 else 0
         
-        return {
-            "Total Resumes": f"{total_resumes:,}",
-            "Avg ATS Score": f"{avg_ats:.1f}%",
-            "High Performing": f"{high_performing:,}",
-            "Success Rate": f"{success_rate:.1f}%"
-        }
+            return {
+                "Total Resumes": f"{total_resumes:,}",
+                "Avg ATS Score": f"{avg_ats:.1f}%",
+                "High Performing": f"{high_performing:,}",
+                "Success Rate": f"{success_rate:.1f}%"
+            }
 
     def create_enhanced_ats_gauge(self, value):
         """Create an enhanced ATS score gauge chart"""
@@ -0,0 +1,173 @@
+"""
+Streaming exporters for the admin dashboard.
+
+Rows are paged from the cursor in fixed chunks and written as they arrive,
+so memory use stays flat however large resume_data grows. CSV and JSON
+Lines are produced as generators of byte chunks that can be sent to the
+client while the export is still running. Excel workbooks use
+xlsxwriter's constant_memory mode and size columns from a sample of the
+first rows instead of measuring every cell.
+"""
+
+import csv
+import io
+import json
+import tempfile
+
+import xlsxwriter
+
+CHUNK_SIZE = 1000
+# Rows inspected to size Excel columns
+WIDTH_SAMPLE_ROWS = 1000
+MAX_COLUMN_WIDTH = 50
+# Exports larger than this are spooled to a temporary file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+EXPORT_QUERY = """
+    SELECT
+        rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    ORDER BY rd.id
+"""
+
+# Analysis columns are aliased where they would collide with resume_data's
+JSON_EXPORT_QUERY = """
+    SELECT
+        rd.*,
+        ra.id AS analysis_id, ra.ats_score, ra.keyword_match_score,
+        ra.format_score, ra.section_score, ra.missing_skills,
+        ra.recommendations, ra.created_at AS analyzed_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+    ORDER BY rd.id
+"""
+
+
+def iter_chunks(conn, query, chunk_size=CHUNK_SIZE, params=()):
+    """Execute query and return (column names, generator of row lists)"""
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    columns = [description[0] for description in cursor.description]
+
+    def chunks():
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield rows
+        finally:
+            cursor.close()
+
+    return columns, chunks()
+
+
+def iter_csv(conn, query=EXPORT_QUERY, chunk_size=CHUNK_SIZE):
+    """Yield the export as UTF-8 CSV, one encoded chunk of rows at a time"""
+    columns, chunks = iter_chunks(conn, query, chunk_size)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def iter_jsonl(conn, query=JSON_EXPORT_QUERY, chunk_size=CHUNK_SIZE):
+    """Yield the export as JSON Lines, one encoded chunk of rows at a time"""
+    columns, chunks = iter_chunks(conn, query, chunk_size)
+    for rows in chunks:
+        yield ''.join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str) + '\n'
+            for row in rows
+        ).encode('utf-8')
+
+
+def spool(chunks, max_size=SPOOL_MAX_BYTES):
+    """Write byte chunks to a SpooledTemporaryFile and return it, rewound.
+
+    The file is handed to st.download_button as is, so the export is never
+    copied into a bytes object of its own; exports past max_size live on
+    disk rather than in memory until the button reads them.
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=max_size)
+    try:
+        for chunk in chunks:
+            output.write(chunk)
+    except BaseException:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+def xlsx_file(conn, query=EXPORT_QUERY, params=(), max_size=SPOOL_MAX_BYTES):
+    """Build the xlsx export in a SpooledTemporaryFile and return it, rewound"""
+    output = tempfile.SpooledTemporaryFile(max_size=max_size)
+    try:
+        write_xlsx(conn, output, query, params=params)
+    except BaseException:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+def write_xlsx(conn, output, query=EXPORT_QUERY, chunk_size=CHUNK_SIZE,
+               sheet_name='Resume Data', params=()):
+    """Write the export to output (a path or binary file object) as xlsx.
+
+    Rows are flushed to disk as they are written, so the workbook never
+    holds more than the current row in memory.
+    """
+    columns, chunks = iter_chunks(conn, query, chunk_size, params)
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        # Resume text is data, not formulas or hyperlinks
+        'strings_to_formulas': False,
+        'strings_to_urls': False
+    })
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({
+            'bold': True,
+            'text_wrap': True,
+            'valign': 'top',
+            'fg_color': '#D7E4BC',
+            'border': 1
+        })
+
+        # Column widths are taken from the first rows; constant_memory mode
+        # does not allow going back once rows have been written
+        first = next(chunks, [])
+        sample = first[:WIDTH_SAMPLE_ROWS]
+        for i, column in enumerate(columns):
+            width = max([len(str(column))] + [len(str(row[i])) for row in sample if row[i] is not None])
+            worksheet.set_column(i, i, min(width + 2, MAX_COLUMN_WIDTH))
+
+        worksheet.write_row(0, 0, columns, header_format)
+        row_number = 1
+        for rows in _prepend(first, chunks):
+            for row in rows:
+                worksheet.write_row(row_number, 0, row)
+                row_number += 1
+    finally:
+        workbook.close()
+    return output
+
+
+def _prepend(first, chunks):
+    if first:
+        yield first
+    yield from chunks
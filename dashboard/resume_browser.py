@@ -0,0 +1,154 @@
+"""
+Keyset-paginated queries for the admin resume browser.
+
+Filtering, sorting and paging all happen in SQL: a page is fetched with
+WHERE (sort key, id) < (last row's sort key, last row's id) ... LIMIT n,
+so each page costs the same however deep into the history it is. Each
+resume is joined to its most recent analysis only, which keeps the
+(sort key, id) cursor unique.
+
+The role and category filter options come from DISTINCT scans that do
+grow with the history, so filter_options() keeps them for
+FILTER_OPTIONS_TTL seconds instead of scanning on every render.
+"""
+
+import os
+import threading
+import time
+
+PAGE_SIZE = 50
+FILTER_OPTIONS_TTL = float(os.environ.get('WORKBRIDGE_FILTER_OPTIONS_TTL', '300'))
+
+# Sort options: name -> SQL expression (non-NULL so row values compare)
+SORT_COLUMNS = {
+    'created_at': 'r.created_at',
+    'ats_score': 'COALESCE(a.ats_score, -1)',
+    'name': "COALESCE(r.name, '')",
+    'target_role': "COALESCE(r.target_role, '')"
+}
+
+BROWSER_QUERY = """
+    SELECT
+        r.id,
+        r.name,
+        r.email,
+        r.phone,
+        r.linkedin,
+        r.github,
+        r.portfolio,
+        r.target_role,
+        r.target_category,
+        r.created_at,
+        a.ats_score,
+        a.keyword_match_score,
+        a.format_score,
+        a.section_score{sort_key}
+    FROM resume_data r
+    LEFT JOIN resume_analysis a
+        ON a.id = (SELECT MAX(id) FROM resume_analysis WHERE resume_id = r.id)
+    {where}
+    ORDER BY {sort_expression} {direction}, r.id {direction}
+"""
+
+
+def build_filters(role=None, category=None, min_score=None, max_score=None,
+                  start_date=None, end_date=None):
+    """Return (SQL conditions, params) for the browser filters.
+
+    Dates are inclusive 'YYYY-MM-DD' strings (or date objects) and are
+    compared as ranges so the created_at indexes apply.
+    """
+    conditions, params = [], []
+    if role:
+        conditions.append('r.target_role = ?')
+        params.append(role)
+    if category:
+        conditions.append('r.target_category = ?')
+        params.append(category)
+    if min_score is not None:
+        conditions.append('a.ats_score >= ?')
+        params.append(min_score)
+    if max_score is not None:
+        conditions.append('a.ats_score <= ?')
+        params.append(max_score)
+    if start_date:
+        conditions.append('r.created_at >= ?')
+        params.append(str(start_date))
+    if end_date:
+        conditions.append("r.created_at < date(?, '+1 day')")
+        params.append(str(end_date))
+    return conditions, params
+
+
+def resume_query(filters=None, sort='created_at', descending=True, after=None,
+                 with_sort_key=True):
+    """Build the browser SELECT for the given filters, sort and cursor.
+
+    with_sort_key appends the sort key column fetch_resume_page needs for
+    its cursor; exports leave it out.
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort column: {sort}")
+    sort_expression = SORT_COLUMNS[sort]
+    conditions, params = build_filters(**(filters or {}))
+    if after is not None:
+        conditions.append(f"({sort_expression}, r.id) {'<' if descending else '>'} (?, ?)")
+        params.extend(after)
+
+    query = BROWSER_QUERY.format(
+        sort_expression=sort_expression,
+        sort_key=f",\n        {sort_expression} AS sort_key" if with_sort_key else '',
+        where=f"WHERE {' AND '.join(conditions)}" if conditions else '',
+        direction='DESC' if descending else 'ASC'
+    )
+    return query, params
+
+
+def fetch_resume_page(conn, filters=None, sort='created_at', descending=True,
+                      after=None, page_size=PAGE_SIZE):
+    """Fetch one page of resumes.
+
+    Returns (rows, next_cursor). Rows are the BROWSER_QUERY columns without
+    the trailing sort key; next_cursor is passed as after= to get the next
+    page and is None on the last page.
+    """
+    query, params = resume_query(filters, sort, descending, after)
+    cursor = conn.cursor()
+    cursor.execute(f"{query} LIMIT ?", params + [page_size + 1])
+    rows = cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = (rows[-1][-1], rows[-1][0])
+    return [row[:-1] for row in rows], next_cursor
+
+
+def distinct_values(conn, column):
+    """Sorted non-empty values of a resume_data column (index-only scan)"""
+    if column not in ('target_role', 'target_category'):
+        raise ValueError(f"Unknown filter column: {column}")
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT DISTINCT {column} FROM resume_data
+        WHERE {column} IS NOT NULL AND {column} != ''
+        ORDER BY {column}
+    """)
+    return [row[0] for row in cursor.fetchall()]
+
+
+_filter_options = {}
+_filter_options_lock = threading.Lock()
+
+
+def filter_options(conn, ttl=FILTER_OPTIONS_TTL):
+    """(roles, categories) for the browser filters, rescanned at most every ttl seconds"""
+    now = time.monotonic()
+    with _filter_options_lock:
+        cached = _filter_options.get('values')
+        if cached is not None and now < _filter_options['expires']:
+            return cached
+    values = (distinct_values(conn, 'target_role'), distinct_values(conn, 'target_category'))
+    with _filter_options_lock:
+        _filter_options.update(values=values, expires=now + ttl)
+    return values
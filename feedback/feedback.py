@@ -1,76 +1,173 @@
 import streamlit as st
-import sqlite3
 from datetime import datetime
 import pandas as pd
+import threading
 import time
 
+from config.connection_pool import get_connection_manager
+
+FEEDBACK_DB_PATH = "feedback/feedback.db"
+FEEDBACK_PAGE_SIZE = 20
+
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS feedback (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        rating INTEGER,
+        usability_score INTEGER,
+        feature_satisfaction INTEGER,
+        missing_features TEXT,
+        improvement_suggestions TEXT,
+        user_experience TEXT,
+        timestamp DATETIME
+    )
+    ''',
+    # Running totals, one row; kept current by the insert trigger below.
+    # Each average has its own count because the ratings may be NULL.
+    '''
+    CREATE TABLE IF NOT EXISTS feedback_summary (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        responses INTEGER NOT NULL DEFAULT 0,
+        rating_sum REAL NOT NULL DEFAULT 0,
+        usability_sum REAL NOT NULL DEFAULT 0,
+        satisfaction_sum REAL NOT NULL DEFAULT 0,
+        rating_count INTEGER NOT NULL DEFAULT 0,
+        usability_count INTEGER NOT NULL DEFAULT 0,
+        satisfaction_count INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+]
+
+SUMMARY_COUNT_COLUMNS = ['rating_count', 'usability_count', 'satisfaction_count']
+
+# Totals recomputed from the feedback rows
+SUMMARY_TOTALS = '''
+    SELECT COUNT(*), COALESCE(SUM(rating), 0), COALESCE(SUM(usability_score), 0),
+           COALESCE(SUM(feature_satisfaction), 0),
+           COUNT(rating), COUNT(usability_score), COUNT(feature_satisfaction)
+    FROM feedback
+'''
+
+SUMMARY_TRIGGER = [
+    'DROP TRIGGER IF EXISTS trg_feedback_summary',
+    '''
+    CREATE TRIGGER trg_feedback_summary
+    AFTER INSERT ON feedback
+    BEGIN
+        UPDATE feedback_summary SET
+            responses = responses + 1,
+            rating_sum = rating_sum + COALESCE(NEW.rating, 0),
+            usability_sum = usability_sum + COALESCE(NEW.usability_score, 0),
+            satisfaction_sum = satisfaction_sum + COALESCE(NEW.feature_satisfaction, 0),
+            rating_count = rating_count + (NEW.rating IS NOT NULL),
+            usability_count = usability_count + (NEW.usability_score IS NOT NULL),
+            satisfaction_count = satisfaction_count + (NEW.feature_satisfaction IS NOT NULL)
+        WHERE id = 1;
+    END
+    ''',
+]
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+
 class FeedbackManager:
-    def __init__(self):
-        self.db_path = "feedback/feedback.db"
+    def __init__(self, db_path=FEEDBACK_DB_PATH):
+        self.db_path = db_path
+        self.connections = get_connection_manager(db_path)
         self.setup_database()
 
     def setup_database(self):
-        """Create feedback table if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS feedback (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                rating INTEGER,
-                usability_score INTEGER,
-                feature_satisfaction INTEGER,
-                missing_features TEXT,
-                improvement_suggestions TEXT,
-                user_experience TEXT,
-                timestamp DATETIME
+        """Create the feedback tables once per process"""
+        with _init_lock:
+            if self.db_path in _initialized:
+                return
+            with self.connections.write() as conn:
+                for statement in SCHEMA:
+                    conn.execute(statement)
+                self._upgrade_summary(conn)
+                for statement in SUMMARY_TRIGGER:
+                    conn.execute(statement)
+            _initialized.add(self.db_path)
+
+    @staticmethod
+    def _upgrade_summary(conn):
+        """Seed the summary row, recomputing it if the table predates the per-column counts"""
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(feedback_summary)')}
+        missing = [column for column in SUMMARY_COUNT_COLUMNS if column not in columns]
+        for column in missing:
+            conn.execute(f'ALTER TABLE feedback_summary ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0')
+        if missing:
+            conn.execute('DELETE FROM feedback_summary')
+        conn.execute(f'''
+            INSERT OR IGNORE INTO feedback_summary (
+                id, responses, rating_sum, usability_sum, satisfaction_sum,
+                rating_count, usability_count, satisfaction_count
             )
+            SELECT 1, * FROM ({SUMMARY_TOTALS})
         ''')
-        conn.commit()
-        conn.close()
 
     def save_feedback(self, feedback_data):
         """Save feedback to database"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            INSERT INTO feedback (
-                rating, usability_score, feature_satisfaction,
-                missing_features, improvement_suggestions,
-                user_experience, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            feedback_data['rating'],
-            feedback_data['usability_score'],
-            feedback_data['feature_satisfaction'],
-            feedback_data['missing_features'],
-            feedback_data['improvement_suggestions'],
-            feedback_data['user_experience'],
-            datetime.now()
-        ))
-        conn.commit()
-        conn.close()
+        # The summary trigger runs in this same transaction
+        with self.connections.write() as conn:
+            conn.execute('''
+                INSERT INTO feedback (
+                    rating, usability_score, feature_satisfaction,
+                    missing_features, improvement_suggestions,
+                    user_experience, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                feedback_data['rating'],
+                feedback_data['usability_score'],
+                feedback_data['feature_satisfaction'],
+                feedback_data['missing_features'],
+                feedback_data['improvement_suggestions'],
+                feedback_data['user_experience'],
+                datetime.now()
+            ))
 
     def get_feedback_stats(self):
-        """Get feedback statistics"""
-        conn = sqlite3.connect(self.db_path)
-        df = pd.read_sql_query("SELECT * FROM feedback", conn)
-        conn.close()
-        
-        if df.empty:
-            return {
-                'avg_rating': 0,
-                'avg_usability': 0,
-                'avg_satisfaction': 0,
-                'total_responses': 0
-            }
-        
+        """Get feedback statistics from the running totals"""
+        with self.connections.read() as conn:
+            row = conn.execute('''
+                SELECT responses, rating_sum, usability_sum, satisfaction_sum,
+                       rating_count, usability_count, satisfaction_count
+                FROM feedback_summary WHERE id = 1
+            ''').fetchone()
+
+        if not row:
+            row = (0,) * 7
+        # Average over the responses that answered, so a NULL does not count as 0
         return {
-            'avg_rating': df['rating'].mean(),
-            'avg_usability': df['usability_score'].mean(),
-            'avg_satisfaction': df['feature_satisfaction'].mean(),
-            'total_responses': len(df)
+            'avg_rating': row[1] / row[4] if row[4] else 0,
+            'avg_usability': row[2] / row[5] if row[5] else 0,
+            'avg_satisfaction': row[3] / row[6] if row[6] else 0,
+            'total_responses': row[0]
         }
 
+    def get_feedback_page(self, after=None, page_size=FEEDBACK_PAGE_SIZE):
+        """Newest feedback first, one page at a time.
+
+        Returns (rows, next_cursor); pass next_cursor as after= for the next
+        page. It is None on the last page.
+        """
+        with self.connections.read() as conn:
+            rows = conn.execute('''
+                SELECT id, timestamp, rating, usability_score, feature_satisfaction,
+                       missing_features, improvement_suggestions, user_experience
+                FROM feedback
+                WHERE ? IS NULL OR id < ?
+                ORDER BY id DESC
+                LIMIT ?
+            ''', (after, after, page_size + 1)).fetchall()
+
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = rows[-1][0]
+        return rows, next_cursor
+
     def render_feedback_form(self):
         """Render the feedback form"""
         st.markdown("""
@@ -293,3 +390,31 @@ class FeedbackManager:
                     <div style="color: #E0E0E0; font-size: 1.2em;">{metric['delta']}</div>
                 </div>
             """, unsafe_allow_html=True)
+
+        # Individual responses, newest first
+        st.markdown("#### Recent Feedback")
+        cursors = st.session_state.setdefault('feedback_page_cursors', [None])
+        rows, next_cursor = self.get_feedback_page(cursors[-1])
+        if rows:
+            st.dataframe(
+                pd.DataFrame(rows, columns=[
+                    'ID', 'Submitted', 'Rating', 'Usability', 'Satisfaction',
+                    'Missing Features', 'Suggestions', 'Experience'
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No feedback yet")
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("← Previous", disabled=len(cursors) == 1, key="feedback_page_prev"):
+                cursors.pop()
+                st.rerun()
+        with col2:
+            st.markdown(f"Page {len(cursors)}")
+        with col3:
+            if st.button("Next →", disabled=next_cursor is None, key="feedback_page_next"):
+                cursors.append(next_cursor)
+                st.rerun()
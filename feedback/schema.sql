@@ -7,4 +7,39 @@ CREATE TABLE IF NOT EXISTS feedback (
     improvement_suggestions TEXT,
     user_experience TEXT,
     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-);
\ No newline at end of file
+);
+
+-- Running totals for get_feedback_stats(), maintained by trg_feedback_summary
+CREATE TABLE IF NOT EXISTS feedback_summary (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    responses INTEGER NOT NULL DEFAULT 0,
+    rating_sum REAL NOT NULL DEFAULT 0,
+    usability_sum REAL NOT NULL DEFAULT 0,
+    satisfaction_sum REAL NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    usability_count INTEGER NOT NULL DEFAULT 0,
+    satisfaction_count INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO feedback_summary (
+    id, responses, rating_sum, usability_sum, satisfaction_sum,
+    rating_count, usability_count, satisfaction_count
+)
+SELECT 1, COUNT(*), COALESCE(SUM(rating), 0), COALESCE(SUM(usability_score), 0),
+       COALESCE(SUM(feature_satisfaction), 0),
+       COUNT(rating), COUNT(usability_score), COUNT(feature_satisfaction)
+FROM feedback;
+
+CREATE TRIGGER IF NOT EXISTS trg_feedback_summary
+AFTER INSERT ON feedback
+BEGIN
+    UPDATE feedback_summary SET
+        responses = responses + 1,
+        rating_sum = rating_sum + COALESCE(NEW.rating, 0),
+        usability_sum = usability_sum + COALESCE(NEW.usability_score, 0),
+        satisfaction_sum = satisfaction_sum + COALESCE(NEW.feature_satisfaction, 0),
+        rating_count = rating_count + (NEW.rating IS NOT NULL),
+        usability_count = usability_count + (NEW.usability_score IS NOT NULL),
+        satisfaction_count = satisfaction_count + (NEW.feature_satisfaction IS NOT NULL)
+    WHERE id = 1;
+END;
@@ -0,0 +1,80 @@
+"""
+Shared test setup.
+
+Every database and cache file the code under test touches is pointed at a
+scratch directory before any project module is imported, so the tests
+never write to the checked-in databases.
+"""
+
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SCRATCH = tempfile.mkdtemp(prefix='workbridge-tests-')
+os.environ['WORKBRIDGE_DB_PATH'] = os.path.join(SCRATCH, 'resume_data.db')
+os.environ['WORKBRIDGE_EXTRACTION_CACHE'] = os.path.join(SCRATCH, 'extraction_cache.db')
+os.environ['WORKBRIDGE_ARCHIVE_PATH'] = os.path.join(SCRATCH, 'resume_archive.db')
+os.environ['WORKBRIDGE_PARQUET_DIR'] = os.path.join(SCRATCH, 'analytics_data')
+os.environ['WORKBRIDGE_SESSION_SECRET_FILE'] = os.path.join(SCRATCH, '.session_secret')
+os.environ.pop('WORKBRIDGE_SESSION_SECRET', None)
+
+SKILLS = ['Python', 'SQL', 'Docker', 'Kubernetes', 'AWS', 'React', 'Java', 'Excel']
+
+
+def make_resume(i, rng=random):
+    """A resume dict in the shape the analyzer and builder save"""
+    return {
+        'personal_info': {
+            'full_name': f'Candidate {i}',
+            'email': f'candidate{i}@example.com',
+            'phone': '555-0100'
+        },
+        'summary': 'Engineer with experience building data products.',
+        'target_role': 'Software Engineer',
+        'target_category': 'Software Development and Engineering',
+        'experience': [{'company': 'Acme', 'position': 'Engineer'}],
+        'skills': rng.sample(SKILLS, 3)
+    }
+
+
+def make_analysis(ats_score=70.0):
+    return {
+        'ats_score': ats_score,
+        'keyword_match_score': 60.0,
+        'format_score': 80.0,
+        'section_score': 90.0,
+        'missing_skills': 'Docker',
+        'recommendations': 'Add metrics'
+    }
+
+
+def make_pdf(pages=1, lines=30, text='Experience with Python and SQL'):
+    """A PDF with a text layer; pages=0 lines gives blank, scanned-looking pages"""
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        for i in range(lines):
+            pdf.drawString(72, 760 - 22 * i, f"{text} ({page}.{i})")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def database():
+    """The scratch resume database, migrated to the current schema"""
+    from config.database import init_database
+
+    init_database()
+    yield os.environ['WORKBRIDGE_DB_PATH']
+    shutil.rmtree(SCRATCH, ignore_errors=True)
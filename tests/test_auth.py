@@ -0,0 +1,72 @@
+import os
+import threading
+
+import pytest
+
+import config.auth as auth
+from config.auth import create_session, resume_session, revoke_session, rotate_session
+from config.connection_pool import write_connection
+
+
+@pytest.fixture(scope='module')
+def user_id():
+    with write_connection() as conn:
+        return conn.execute(
+            "INSERT INTO users (username, email, password_hash) VALUES ('auth_user', 'auth@example.com', 'x')"
+        ).lastrowid
+
+
+def test_valid_token_resumes_the_session(user_id):
+    token = create_session(user_id)
+    assert resume_session(token)['id'] == user_id
+
+
+def test_tampered_or_expired_tokens_are_rejected(user_id):
+    session_id, expires_at, signature = create_session(user_id).split('.')
+    assert resume_session(f"{session_id}.{int(expires_at) + 3600}.{signature}") is None
+    assert resume_session(f"{session_id}.{expires_at}.{signature[:-2]}AA") is None
+    assert resume_session(create_session(user_id, ttl=-1)) is None
+    assert resume_session('not-a-token') is None
+
+
+def test_rotation_retires_the_old_token(user_id):
+    token = create_session(user_id)
+    user, rotated = rotate_session(token)
+
+    assert user['id'] == user_id and rotated != token
+    assert resume_session(token) is None
+    assert rotate_session(token) == (None, None)
+    assert resume_session(rotated)['id'] == user_id
+
+
+def test_revoked_token_no_longer_resumes(user_id):
+    token = create_session(user_id)
+    revoke_session(token)
+    assert resume_session(token) is None
+
+
+def test_concurrent_first_starts_agree_on_one_secret(tmp_path, monkeypatch):
+    monkeypatch.setattr(auth, 'SESSION_SECRET_FILE', str(tmp_path / '.session_secret'))
+    keys = []
+
+    def start():
+        monkeypatch.setattr(auth, '_secret', None, raising=False)
+        auth._create_secret_file()
+        keys.append(auth._read_secret())
+
+    threads = [threading.Thread(target=start) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(keys)) == 1 and len(keys[0]) == 64
+    assert os.listdir(tmp_path) == ['.session_secret']
+
+
+def test_empty_secret_file_is_rejected(tmp_path, monkeypatch):
+    path = tmp_path / '.session_secret'
+    path.write_text('')
+    monkeypatch.setattr(auth, 'SESSION_SECRET_FILE', str(path))
+    with pytest.raises(RuntimeError):
+        auth._read_secret()
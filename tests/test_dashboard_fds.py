@@ -0,0 +1,60 @@
+import contextlib
+import os
+import threading
+
+import pytest
+
+from config.connection_pool import READ_POOL_SIZE, get_read_only_pool
+from config.database import save_many
+from conftest import make_analysis, make_resume
+
+pytestmark = pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc/self/fd")
+
+# Dashboard renders after warm-up
+RERUNS = int(os.environ.get('WORKBRIDGE_TEST_FD_RERUNS', '1000'))
+
+
+def open_fds():
+    return len(os.listdir('/proc/self/fd'))
+
+
+def render():
+    # What one Streamlit rerun of the dashboard does, on its own script thread
+    from dashboard.dashboard import DashboardManager
+
+    dashboard = DashboardManager()
+    dashboard.get_quick_stats()
+    dashboard.get_resume_metrics()
+    dashboard.get_trend_indicators()
+    dashboard.get_detailed_insights()
+    dashboard.get_database_stats()
+    dashboard.get_resume_data()
+
+
+def rerun(times, sessions=4):
+    for _ in range(times // sessions):
+        threads = [threading.Thread(target=render) for _ in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+def fill_pool(pool):
+    """Check out every pooled reader at once, so all of them are open"""
+    with contextlib.ExitStack() as stack:
+        for _ in range(READ_POOL_SIZE):
+            stack.enter_context(pool.connection())
+
+
+def test_open_fds_stay_flat_across_dashboard_reruns():
+    save_many([(make_resume(i), make_analysis()) for i in range(50)])
+    pool = get_read_only_pool()
+
+    fill_pool(pool)
+    rerun(20)
+    warm = open_fds()
+    rerun(RERUNS)
+
+    assert open_fds() == warm
+    assert pool.open_connections() == READ_POOL_SIZE
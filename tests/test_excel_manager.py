@@ -0,0 +1,46 @@
+import threading
+
+import openpyxl
+
+from utils.excel_manager import ExcelManager
+
+
+def test_saves_from_another_instance_are_visible(tmp_path):
+    first = ExcelManager(str(tmp_path / 'journal'), str(tmp_path / 'resume_data.xlsx'))
+    second = ExcelManager(str(tmp_path / 'journal'), str(tmp_path / 'resume_data.xlsx'))
+
+    first.save_resume_data(1, 'Engineer', 'first resume')
+    assert list(first.get_user_resumes(1)['content']) == ['first resume']
+    assert list(second.get_user_resumes(1)['content']) == ['first resume']
+
+    second.save_resume_data(1, 'Engineer', 'second resume')
+    assert list(first.get_user_resumes(1)['content']) == ['first resume', 'second resume']
+
+
+def test_concurrent_writers_record_correct_offsets(tmp_path):
+    managers = [ExcelManager(str(tmp_path / 'journal'), str(tmp_path / 'resume_data.xlsx')) for _ in range(4)]
+
+    def save(manager, user_id):
+        for i in range(50):
+            manager.save_resume_data(user_id, 'Engineer', f'user {user_id} resume {i}')
+
+    threads = [threading.Thread(target=save, args=(manager, user_id)) for user_id, manager in enumerate(managers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reader = ExcelManager(str(tmp_path / 'journal'), str(tmp_path / 'resume_data.xlsx'))
+    for user_id in range(4):
+        contents = list(reader.get_user_resumes(user_id)['content'])
+        assert contents == [f'user {user_id} resume {i}' for i in range(50)]
+    assert len(reader.get_all_resumes()) == 200
+
+
+def test_export_builds_the_workbook(tmp_path):
+    manager = ExcelManager(str(tmp_path / 'journal'), str(tmp_path / 'resume_data.xlsx'))
+    manager.save_resume_data(7, 'Analyst', 'resume', {'score': 80})
+
+    sheet = openpyxl.load_workbook(manager.export_to_excel()).active
+    assert [cell.value for cell in sheet[1]] == ['user_id', 'job_role', 'content', 'analysis_data', 'created_at']
+    assert sheet.max_row == 2
@@ -0,0 +1,48 @@
+import csv
+import io
+import json
+
+import openpyxl
+
+from config.connection_pool import read_connection
+from config.database import save_many
+from conftest import make_analysis, make_resume
+from dashboard.exports import iter_csv, iter_jsonl, spool, xlsx_file
+
+
+def exported_rows():
+    with read_connection() as conn:
+        return conn.execute('SELECT COUNT(*) FROM resume_data').fetchone()[0]
+
+
+def test_csv_export_streams_every_row_in_small_chunks():
+    save_many([(make_resume(i), make_analysis()) for i in range(25)])
+    with read_connection() as conn:
+        chunks = list(iter_csv(conn, chunk_size=10))
+        total = exported_rows()
+
+    assert len(chunks) >= total // 10
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8'))))
+    assert rows[0][:2] == ['name', 'email']
+    assert len(rows) == total + 1
+
+
+def test_jsonl_export_has_one_object_per_resume():
+    with read_connection() as conn:
+        output = spool(iter_jsonl(conn, chunk_size=7), max_size=1024)
+        total = exported_rows()
+
+    # Larger than max_size, so the export went to disk rather than memory
+    assert output._rolled
+    records = [json.loads(line) for line in output.read().decode('utf-8').splitlines()]
+    assert len(records) == total
+    assert {'id', 'name', 'ats_score', 'analyzed_at'} <= set(records[0])
+
+
+def test_xlsx_export_round_trips():
+    with read_connection() as conn:
+        output = xlsx_file(conn)
+        total = exported_rows()
+
+    sheet = openpyxl.load_workbook(output, read_only=True).active
+    assert sheet.max_row == total + 1
@@ -0,0 +1,66 @@
+import itertools
+
+from utils.extraction import join_pages, limit_pages
+from utils.extraction_cache import get_extraction_cache
+from utils.resume_analyzer import DETECT_MAX_CHARS, ResumeAnalyzer
+from conftest import make_pdf
+
+
+class Pages:
+    """An endless page stream that counts what was read and whether it was closed"""
+
+    def __init__(self, text='x' * 100):
+        self.text = text
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        try:
+            while True:
+                self.read += 1
+                yield self.text
+        finally:
+            self.closed = True
+
+
+def test_page_budget_stops_the_stream():
+    pages, usage = Pages(), {}
+    assert len(list(limit_pages(iter(pages), max_pages=3, max_chars=0, seconds=0, usage=usage))) == 3
+    assert usage == {'pages': 3, 'chars': 300, 'stopped': 'max_pages'}
+    assert pages.read == 3 and pages.closed
+
+
+def test_char_budget_cuts_the_last_page_short():
+    usage = {}
+    text = join_pages(limit_pages(iter(Pages()), max_pages=0, max_chars=250, seconds=0, usage=usage))
+    assert len(text) == 250 + 2  # three pages joined by newlines
+    assert usage['stopped'] == 'max_chars'
+
+
+def test_zero_disables_a_budget():
+    usage = {}
+    pages = list(limit_pages(['a', 'b', 'c'], max_pages=0, max_chars=0, seconds=0, usage=usage))
+    assert pages == ['a', 'b', 'c'] and usage['stopped'] is None
+
+
+def test_time_budget_is_checked_between_pages():
+    usage = {}
+    list(limit_pages(itertools.repeat('page'), max_pages=0, max_chars=0, seconds=0.05, usage=usage))
+    assert usage['stopped'] == 'seconds'
+
+
+def test_detection_reads_only_the_start_of_a_stream():
+    pages = Pages('experience education skills work project summary ' * 20)
+    assert ResumeAnalyzer().detect_document_type(iter(pages)) == 'resume'
+    assert pages.read * len(pages.text) < DETECT_MAX_CHARS + len(pages.text)
+    assert pages.closed
+
+
+def test_detect_pdf_type_shares_the_cached_extraction():
+    resume = make_pdf(pages=60, text='Experience Education Skills Work Project Summary Employment')
+    analyzer, cache = ResumeAnalyzer(), get_extraction_cache()
+    misses = cache.misses
+
+    assert analyzer.detect_pdf_type(resume) == 'resume'
+    analyzer.extract_text_from_pdf(resume)
+    assert cache.misses == misses + 1
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from utils.extraction_cache import ExtractionCache, get_extraction_cache
+from conftest import make_pdf
+
+
+def test_second_lookup_is_a_memory_hit(tmp_path):
+    cache = ExtractionCache(str(tmp_path / 'cache.db'))
+    calls = []
+
+    def extract(data):
+        calls.append(data)
+        return data.decode()
+
+    assert cache.extract(b'resume', 'test', 1, extract) == 'resume'
+    assert cache.extract(b'resume', 'test', 1, extract) == 'resume'
+    assert len(calls) == 1 and cache.hits['memory'] == 1 and cache.misses == 1
+
+    # A new version is a different key
+    cache.extract(b'resume', 'test', 2, extract)
+    assert len(calls) == 2
+
+
+def test_disk_tier_is_shared_between_caches(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    ExtractionCache(path).extract(b'resume', 'test', 1, lambda data: 'text')
+
+    other = ExtractionCache(path)
+    assert other.extract(b'resume', 'test', 1, lambda data: 'recomputed') == 'text'
+    assert other.hits['disk'] == 1
+
+
+def test_concurrent_misses_extract_once(tmp_path):
+    cache = ExtractionCache(str(tmp_path / 'cache.db'))
+    calls = []
+
+    def slow(data):
+        calls.append(data)
+        time.sleep(0.2)
+        return 'text'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.extract(b'x', 'test', 1, slow)))
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ['text'] * 6
+    assert len(calls) == 1
+
+
+def test_empty_results_and_errors_are_not_cached(tmp_path):
+    cache = ExtractionCache(str(tmp_path / 'cache.db'))
+    assert cache.extract(b'x', 'test', 1, lambda data: '') == ''
+
+    def fail(data):
+        raise ValueError('broken')
+
+    try:
+        cache.extract(b'y', 'test', 1, fail)
+    except ValueError:
+        pass
+    assert cache.extract(b'x', 'test', 1, lambda data: 'later') == 'later'
+    assert cache.extract(b'y', 'test', 1, lambda data: 'later') == 'later'
+
+
+def test_analyzers_and_parser_share_one_pdf_extraction(monkeypatch):
+    import utils.pdf_router as router
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+    from utils.resume_analyzer import ResumeAnalyzer
+    from utils.resume_parser import ResumeParser
+
+    extractions = []
+    text_layer = router._text_layer
+    monkeypatch.setattr(router, '_text_layer', lambda data: extractions.append(data) or text_layer(data))
+    pdf = make_pdf(text='Shared extraction check')
+
+    text = ResumeAnalyzer().extract_text_from_pdf(pdf)
+    assert 'Shared extraction check' in text
+    assert ResumeParser().extract_text_from_pdf(pdf) == text
+    assert AIResumeAnalyzer().extract_text_from_pdf(pdf) == text
+    assert len(extractions) == 1
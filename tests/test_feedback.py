@@ -0,0 +1,78 @@
+import os
+import sqlite3
+
+import pytest
+
+from feedback.feedback import FeedbackManager
+
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', 'feedback', 'schema.sql')
+
+
+def feedback(rating, usability=None, satisfaction=None):
+    return {
+        'rating': rating, 'usability_score': usability, 'feature_satisfaction': satisfaction,
+        'missing_features': '', 'improvement_suggestions': '', 'user_experience': '',
+    }
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return FeedbackManager(str(tmp_path / 'feedback.db'))
+
+
+def test_averages_skip_unanswered_ratings(manager):
+    manager.save_feedback(feedback(5, 4))
+    manager.save_feedback(feedback(3))
+
+    stats = manager.get_feedback_stats()
+    assert stats['total_responses'] == 2
+    assert stats['avg_rating'] == 4
+    assert stats['avg_usability'] == 4
+    assert stats['avg_satisfaction'] == 0
+
+
+def test_summary_without_counts_is_recomputed(tmp_path):
+    path = str(tmp_path / 'feedback.db')
+    conn = sqlite3.connect(path)
+    conn.executescript('''
+        CREATE TABLE feedback (id INTEGER PRIMARY KEY AUTOINCREMENT, rating INTEGER,
+            usability_score INTEGER, feature_satisfaction INTEGER, missing_features TEXT,
+            improvement_suggestions TEXT, user_experience TEXT, timestamp DATETIME);
+        CREATE TABLE feedback_summary (id INTEGER PRIMARY KEY CHECK (id = 1),
+            responses INTEGER NOT NULL DEFAULT 0, rating_sum REAL NOT NULL DEFAULT 0,
+            usability_sum REAL NOT NULL DEFAULT 0, satisfaction_sum REAL NOT NULL DEFAULT 0);
+        INSERT INTO feedback (rating, usability_score) VALUES (4, 2), (2, NULL);
+        INSERT INTO feedback_summary VALUES (1, 2, 6, 2, 0);
+    ''')
+    conn.close()
+
+    manager = FeedbackManager(path)
+    manager.save_feedback(feedback(3, 5, 1))
+
+    stats = manager.get_feedback_stats()
+    assert stats['total_responses'] == 3
+    assert (stats['avg_rating'], stats['avg_usability'], stats['avg_satisfaction']) == (3, 3.5, 1)
+
+
+def test_schema_file_seeds_the_summary_row():
+    conn = sqlite3.connect(':memory:')
+    with open(SCHEMA_FILE) as f:
+        conn.executescript(f.read())
+    conn.execute("INSERT INTO feedback (rating, usability_score, feature_satisfaction) VALUES (5, 4, 3)")
+    assert conn.execute('SELECT responses, rating_sum, rating_count FROM feedback_summary').fetchall() == [(1, 5, 1)]
+
+
+def test_feedback_pages_cover_every_row_once(manager):
+    for rating in range(1, 6):
+        for _ in range(5):
+            manager.save_feedback(feedback(rating))
+
+    seen, cursor = [], None
+    while True:
+        rows, cursor = manager.get_feedback_page(cursor, page_size=7)
+        seen.extend(row[0] for row in rows)
+        if cursor is None:
+            break
+
+    assert len(seen) == 25
+    assert seen == sorted(seen, reverse=True)
@@ -0,0 +1,82 @@
+import json
+
+from config.connection_pool import read_connection, write_connection
+from config.database import save_analysis_data, save_many
+from config.maintenance import (
+    _archive_resume_batch, analyze, archive_old_rows, get_archive_stats, load_archived_resume, open_archive
+)
+from conftest import make_analysis, make_resume
+
+
+def test_old_rows_move_to_an_archive_at_an_awkward_path(tmp_path):
+    ids = save_many([(make_resume(i), make_analysis()) for i in range(3)])
+    with write_connection() as conn:
+        conn.execute("UPDATE resume_data SET created_at = '2001-01-01 00:00:00' WHERE id IN (SELECT value FROM json_each(?))",
+                     (json.dumps(ids),))
+    with read_connection() as conn:
+        metrics_before = conn.execute('SELECT SUM(resume_count) FROM daily_metrics').fetchone()[0]
+    archive_path = str(tmp_path / 'archive ?#%25.db')
+
+    archived = archive_old_rows(days=365, archive_path=archive_path)
+
+    assert archived['resume_data'] >= 3
+    with read_connection() as conn:
+        live = conn.execute('SELECT COUNT(*) FROM resume_data WHERE id IN (SELECT value FROM json_each(?))',
+                            (json.dumps(ids),)).fetchone()[0]
+        metrics_after = conn.execute('SELECT SUM(resume_count) FROM daily_metrics').fetchone()[0]
+    assert live == 0
+    # The rollup keeps counting archived resumes
+    assert metrics_after == metrics_before
+
+    stats = get_archive_stats(archive_path)
+    assert stats['resumes'] >= 3 and stats['size_bytes'] > 0
+    record = load_archived_resume(ids[0], archive_path)
+    assert record['resume']['name'] == 'Candidate 0'
+    assert record['analyses'][0]['ats_score'] == 70.0
+    assert len(record['skills']) == 3
+
+
+class RacingArchive:
+    """An archive connection that adds an analysis to a resume just as its batch is archived"""
+
+    def __init__(self, conn, resume_id):
+        self.conn = conn
+        self.resume_id = resume_id
+
+    def executemany(self, *args):
+        return self.conn.executemany(*args)
+
+    def commit(self):
+        self.conn.commit()
+        save_analysis_data(self.resume_id, make_analysis(ats_score=55.0))
+
+
+def test_resume_that_gains_an_analysis_keeps_its_children(tmp_path):
+    ids = save_many([(make_resume(i), make_analysis()) for i in range(2)])
+    with write_connection() as conn:
+        conn.execute("UPDATE resume_data SET created_at = '2001-01-01 00:00:00' WHERE id IN (SELECT value FROM json_each(?))",
+                     (json.dumps(ids),))
+    archive = open_archive(str(tmp_path / 'archive.db'))
+
+    _archive_resume_batch(RacingArchive(archive, ids[1]), '2002-01-01', ids[0] - 1, 10)
+
+    with read_connection() as conn:
+        live = dict(conn.execute('''
+            SELECT r.id, (SELECT COUNT(*) FROM resume_analysis WHERE resume_id = r.id) +
+                         (SELECT COUNT(*) FROM resume_skills WHERE resume_id = r.id)
+            FROM resume_data r WHERE r.id IN (?, ?)
+        ''', ids).fetchall())
+    # The untouched resume is gone; the raced one keeps both analyses and its skills
+    assert live == {ids[1]: 2 + 3}
+
+    # The next run archives it in full
+    _archive_resume_batch(archive, '2002-01-01', ids[0] - 1, 10)
+    archive.close()
+    record = load_archived_resume(ids[1], str(tmp_path / 'archive.db'))
+    assert len(record['analyses']) == 2 and len(record['skills']) == 3
+
+
+def test_analyze_resets_the_sampling_limit():
+    analyze(analysis_limit=100)
+    with write_connection() as conn:
+        assert conn.execute('PRAGMA analysis_limit').fetchone()[0] == 0
@@ -0,0 +1,100 @@
+import sqlite3
+
+import pytest
+
+from config.migrations import MIGRATIONS, apply_migrations, get_schema_version
+
+# resume_data and resume_analysis as they were before migrations existed
+LEGACY_SCHEMA = '''
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL, password_hash TEXT NOT NULL
+);
+CREATE TABLE resume_data (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, email TEXT NOT NULL,
+    phone TEXT NOT NULL, linkedin TEXT, github TEXT, portfolio TEXT, summary TEXT,
+    target_role TEXT, target_category TEXT, education TEXT, experience TEXT,
+    projects TEXT, skills TEXT, template TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE resume_skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, resume_id INTEGER, skill_name TEXT NOT NULL,
+    skill_category TEXT NOT NULL, proficiency_score REAL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE resume_analysis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, resume_id INTEGER, ats_score REAL,
+    keyword_match_score REAL, format_score REAL, section_score REAL,
+    missing_skills TEXT, recommendations TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+'''
+
+
+@pytest.fixture
+def legacy(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'legacy.db'))
+    conn.executescript(LEGACY_SCHEMA)
+    conn.execute('''
+        INSERT INTO resume_data (name, email, phone, target_role, target_category, experience, skills, created_at)
+        VALUES ('Ada', 'ada@example.com', '555', 'Data Engineer', 'Data Science',
+                ?, ?, '2024-03-01 10:00:00')
+    ''', (str([{'company': 'Acme', 'position': 'Analyst'}]), str(['Python', 'SQL'])))
+    conn.execute("INSERT INTO resume_analysis (resume_id, ats_score, keyword_match_score) VALUES (1, 80, 60)")
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def columns(conn, table):
+    return {row[1] for row in conn.execute(f'PRAGMA table_xinfo({table})')}
+
+
+def test_migrations_apply_one_version_at_a_time(legacy):
+    cursor = legacy.cursor()
+    for version, _, _ in MIGRATIONS:
+        assert apply_migrations(cursor, target=version) == [version]
+        assert get_schema_version(cursor) == version
+    legacy.commit()
+    assert apply_migrations(cursor) == []
+
+
+def test_migrated_legacy_database_has_every_feature(legacy):
+    cursor = legacy.cursor()
+    assert apply_migrations(cursor) == [version for version, _, _ in MIGRATIONS]
+    legacy.commit()
+
+    # 1, 4, 9: new tables and columns
+    tables = {row[0] for row in legacy.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {'ai_analysis', 'daily_metrics', 'resume_search', 'auth_sessions'} <= tables
+    assert 'user_id' in columns(legacy, 'resume_data')
+    # 2, 7: indexes
+    indexes = {row[0] for row in legacy.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'idx_resume_analysis_resume_id', 'idx_resume_data_role_created',
+            'idx_resume_data_category_created', 'idx_auth_sessions_expires_at'} <= indexes
+    # 3: skills backfilled with their canonical names
+    skills = legacy.execute('SELECT skill_name, skill_canonical FROM resume_skills ORDER BY skill_name').fetchall()
+    assert [name for name, _ in skills] == ['Python', 'SQL'] and all(canonical for _, canonical in skills)
+    # 5: rollup rebuilt from the existing rows
+    assert legacy.execute('SELECT day, category, resume_count, ats_sum, high_scoring FROM daily_metrics').fetchall() == [
+        ('2024-03-01', 'Data Science', 1, 80.0, 1)
+    ]
+    # 6: legacy reprs converted to JSON, generated columns readable
+    assert legacy.execute('SELECT skills, skill_count, first_role FROM resume_data').fetchone() == (
+        '["Python","SQL"]', 2, 'Analyst'
+    )
+    # 8: existing rows indexed for search
+    assert legacy.execute("SELECT rowid FROM resume_search WHERE resume_search MATCH 'analyst'").fetchall() == [(1,)]
+
+
+def test_migrations_can_be_run_again(legacy):
+    cursor = legacy.cursor()
+    apply_migrations(cursor)
+    # A half-applied database: every step runs a second time
+    cursor.execute('DELETE FROM schema_version')
+    apply_migrations(cursor)
+    legacy.commit()
+
+    assert legacy.execute('SELECT COUNT(*) FROM resume_skills').fetchone()[0] == 2
+    assert legacy.execute('SELECT SUM(resume_count) FROM daily_metrics').fetchone()[0] == 1
+    assert get_schema_version(cursor) == MIGRATIONS[-1][0]
@@ -0,0 +1,19 @@
+import pytest
+
+import utils.ocr as ocr
+
+
+@pytest.fixture
+def fake_ocr(monkeypatch):
+    # No poppler or tesseract here: report 12 pages and "OCR" each to its number
+    monkeypatch.setattr(ocr, 'page_count', lambda path, poppler_path=None: 12)
+    monkeypatch.setattr(ocr, 'ocr_page', lambda path, page_number, **options: f"page {page_number}")
+
+
+def test_max_pages_caps_the_pages_read(fake_ocr):
+    assert ocr.ocr_pdf(b'%PDF', max_pages=3, workers=1) == "page 1\npage 2\npage 3"
+
+
+def test_zero_max_pages_reads_every_page(fake_ocr):
+    text = ocr.ocr_pdf(b'%PDF', max_pages=0, workers=1)
+    assert text.splitlines() == [f"page {n}" for n in range(1, 13)]
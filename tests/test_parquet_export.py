@@ -0,0 +1,46 @@
+import pyarrow.parquet as pq
+
+from config.connection_pool import read_connection, write_connection
+from config.database import save_many
+from config.parquet_export import export_parquet, parts, read_watermark
+from conftest import make_analysis, make_resume
+
+
+def exported_ids(directory, table):
+    return sorted(
+        row_id
+        for _, _, path in parts(directory, table)
+        for row_id in pq.read_table(path, columns=['id']).column('id').to_pylist()
+    )
+
+
+def table_ids(table):
+    with read_connection() as conn:
+        return [row[0] for row in conn.execute(f'SELECT id FROM {table} ORDER BY id')]
+
+
+def test_refresh_only_exports_new_rows(tmp_path):
+    save_many([(make_resume(i), make_analysis()) for i in range(10)])
+    export_parquet(str(tmp_path))
+    watermark = read_watermark(str(tmp_path), 'resume_data')
+    assert watermark == table_ids('resume_data')[-1]
+
+    new_ids = save_many([(make_resume(i), make_analysis()) for i in range(5)])
+    written = export_parquet(str(tmp_path))
+
+    assert written['resume_data'] == 5
+    assert parts(str(tmp_path), 'resume_data')[-1][:2] == (new_ids[0], new_ids[-1])
+    assert exported_ids(str(tmp_path), 'resume_data') == table_ids('resume_data')
+
+
+def test_deleted_rows_rebuild_the_table(tmp_path):
+    ids = save_many([(make_resume(i), make_analysis()) for i in range(5)])
+    export_parquet(str(tmp_path))
+
+    with write_connection() as conn:
+        conn.execute('DELETE FROM resume_analysis WHERE resume_id = ?', (ids[0],))
+        conn.execute('DELETE FROM resume_skills WHERE resume_id = ?', (ids[0],))
+        conn.execute('DELETE FROM resume_data WHERE id = ?', (ids[0],))
+    export_parquet(str(tmp_path))
+
+    assert exported_ids(str(tmp_path), 'resume_data') == table_ids('resume_data')
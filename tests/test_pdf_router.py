@@ -0,0 +1,94 @@
+import hashlib
+import json
+
+import utils.pdf_router as router
+from config.connection_pool import get_connection_manager
+from utils.extraction_cache import CACHE_PATH
+from utils.pdf_router import cached_pdf_text, extract_pdf_text, is_adequate
+from conftest import make_pdf
+
+
+class FakeOCR:
+    def __init__(self, text=' '.join(['Scanned resume text'] * 10)):
+        self.text = text
+        self.calls = 0
+
+    def __call__(self, pdf_bytes):
+        self.calls += 1
+        return self.text
+
+
+def extractors(route):
+    return [step['extractor'] for step in route['steps']]
+
+
+def test_text_layer_is_read_with_pypdf_alone():
+    ocr = FakeOCR()
+    text, route = extract_pdf_text(make_pdf(pages=2), ocr=ocr, record=False)
+
+    assert route['probe']['has_text_layer']
+    assert extractors(route) == ['pypdf'] and route['extractor'] == 'pypdf'
+    assert 'Experience with Python' in text and ocr.calls == 0
+
+
+def test_scanned_pages_fall_through_to_ocr():
+    ocr = FakeOCR()
+    text, route = extract_pdf_text(make_pdf(pages=2, lines=0), ocr=ocr, record=False)
+
+    assert not route['probe']['has_text_layer']
+    assert extractors(route) == ['pypdf', 'ocr'] and route['extractor'] == 'ocr'
+    assert text == ocr.text and ocr.calls == 1
+
+
+def test_failed_probe_still_tries_pypdf_before_ocr(monkeypatch):
+    def broken_probe(reader):
+        raise ValueError('bad resources')
+
+    monkeypatch.setattr(router, 'probe_text_layer', broken_probe)
+    ocr = FakeOCR()
+    text, route = extract_pdf_text(make_pdf(), ocr=ocr, record=False)
+
+    assert 'error' in route['probe']
+    assert route['extractor'] == 'pypdf' and ocr.calls == 0
+    assert 'Experience with Python' in text
+
+
+def test_unreadable_file_goes_to_pdfplumber_then_ocr():
+    ocr = FakeOCR()
+    text, route = extract_pdf_text(b'not a pdf', ocr=ocr, record=False)
+
+    assert extractors(route) == ['pdfplumber', 'ocr']
+    assert 'error' in route['steps'][0]
+    assert text == ocr.text
+
+
+def test_adequacy_rejects_short_or_garbled_text():
+    assert is_adequate('word ' * 20)
+    assert not is_adequate('too short')
+    assert not is_adequate('�' * 100)
+
+
+def test_cached_text_layer_is_judged_per_text_page_and_ocr_recorded():
+    # A scan with a one-line text layer on each page: long enough for one
+    # page, too short for the pages that have text
+    pdf = make_pdf(pages=5, lines=1, text='Scanned header')
+    assert 'Scanned header' in cached_pdf_text(pdf)
+
+    ocr = FakeOCR()
+    assert cached_pdf_text(pdf, ocr=ocr) == ocr.text
+    assert cached_pdf_text(pdf, ocr=ocr) == ocr.text
+    assert ocr.calls == 1
+
+    with get_connection_manager(CACHE_PATH).read() as conn:
+        route = conn.execute(
+            "SELECT route FROM extraction_routes WHERE sha256 = ? AND extractor = 'ocr'",
+            (hashlib.sha256(pdf).hexdigest(),)
+        ).fetchone()
+    assert extractors(json.loads(route[0])) == ['cached', 'ocr']
+
+
+def test_adequate_cached_text_layer_skips_ocr():
+    ocr = FakeOCR()
+    pdf = make_pdf(pages=2, text='Adequate text layer')
+    assert 'Adequate text layer' in cached_pdf_text(pdf, ocr=ocr)
+    assert ocr.calls == 0
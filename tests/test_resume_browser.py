@@ -0,0 +1,74 @@
+import pytest
+
+from config.connection_pool import read_connection
+from config.database import save_many
+from dashboard import resume_browser
+from dashboard.resume_browser import fetch_resume_page, filter_options, resume_query
+from conftest import make_analysis, make_resume
+
+ROLE = 'Pagination Tester'
+
+
+@pytest.fixture(scope='module', autouse=True)
+def resumes():
+    records = []
+    for i in range(23):
+        resume = make_resume(i)
+        resume['target_role'] = ROLE
+        # Few distinct scores, so most sort keys tie and the id breaks them
+        records.append((resume, make_analysis(ats_score=float(i % 3 * 10)) if i % 5 else None))
+    return save_many(records)
+
+
+def all_pages(sort, descending, page_size=4):
+    rows, cursor = [], None
+    with read_connection() as conn:
+        while True:
+            page, cursor = fetch_resume_page(conn, {'role': ROLE}, sort, descending, cursor, page_size)
+            assert len(page) <= page_size
+            rows.extend(page)
+            if cursor is None:
+                return rows
+
+
+@pytest.mark.parametrize('sort', ['created_at', 'ats_score', 'name'])
+@pytest.mark.parametrize('descending', [True, False])
+def test_pages_match_the_unpaged_order(sort, descending):
+    query, params = resume_query({'role': ROLE}, sort, descending, with_sort_key=False)
+    with read_connection() as conn:
+        expected = conn.execute(query, params).fetchall()
+
+    rows = all_pages(sort, descending)
+    assert len(expected) == 23
+    assert rows == expected
+
+
+def test_filters_apply_before_paging():
+    with read_connection() as conn:
+        rows, cursor = fetch_resume_page(conn, {'role': ROLE, 'min_score': 20}, page_size=50)
+    assert cursor is None
+    assert rows and all(row[10] >= 20 for row in rows)
+
+
+def test_unknown_sort_is_rejected():
+    with pytest.raises(ValueError):
+        resume_query(sort='email')
+
+
+def test_filter_options_are_cached_until_the_ttl(monkeypatch):
+    scans = []
+    monkeypatch.setattr(resume_browser, '_filter_options', {})
+    distinct = resume_browser.distinct_values
+    monkeypatch.setattr(resume_browser, 'distinct_values',
+                        lambda conn, column: scans.append(column) or distinct(conn, column))
+
+    with read_connection() as conn:
+        roles, categories = filter_options(conn, ttl=60)
+        assert ROLE in roles and categories
+        assert filter_options(conn, ttl=60) == (roles, categories)
+        assert len(scans) == 2
+
+        # Once the TTL has passed, the next render scans again
+        resume_browser._filter_options['expires'] = 0
+        filter_options(conn, ttl=60)
+    assert len(scans) == 4
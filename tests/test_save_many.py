@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from config.connection_pool import read_connection, write_connection
+from config.database import save_many, save_resume_data
+from conftest import make_analysis, make_resume
+
+
+def test_ids_are_contiguous_and_rows_line_up():
+    rng = random.Random(5)
+    records = [(make_resume(i, rng), make_analysis(ats_score=float(i))) for i in range(10)]
+    records.append(make_resume(10, rng))  # a resume without an analysis
+
+    ids = save_many(records)
+
+    assert ids == list(range(ids[0], ids[0] + 11))
+    with read_connection() as conn:
+        names = conn.execute(
+            f"SELECT id, name FROM resume_data WHERE id BETWEEN {ids[0]} AND {ids[-1]} ORDER BY id"
+        ).fetchall()
+        scores = dict(conn.execute(
+            f"SELECT resume_id, ats_score FROM resume_analysis WHERE resume_id BETWEEN {ids[0]} AND {ids[-1]}"
+        ).fetchall())
+        skill_rows = conn.execute(
+            f"SELECT COUNT(*) FROM resume_skills WHERE resume_id BETWEEN {ids[0]} AND {ids[-1]}"
+        ).fetchone()[0]
+
+    assert names == [(resume_id, f'Candidate {i}') for i, resume_id in enumerate(ids)]
+    assert scores == {resume_id: float(i) for i, resume_id in enumerate(ids[:10])}
+    assert skill_rows == 3 * 11
+
+
+def test_reserved_ids_never_reuse_a_deleted_id():
+    last = save_resume_data(make_resume(0))
+    with write_connection() as conn:
+        conn.execute('DELETE FROM resume_data WHERE id = ?', (last,))
+
+    ids = save_many([make_resume(1), make_resume(2)])
+    assert ids == [last + 1, last + 2]
+    # Single inserts continue after the reserved range
+    assert save_resume_data(make_resume(3)) == last + 3
+
+
+def test_failed_batch_writes_nothing():
+    with read_connection() as conn:
+        before = conn.execute('SELECT COUNT(*) FROM resume_data').fetchone()[0]
+
+    with pytest.raises(ValueError):
+        save_many([(make_resume(0), make_analysis()), (make_resume(1), make_analysis(ats_score='n/a'))])
+
+    with read_connection() as conn:
+        assert conn.execute('SELECT COUNT(*) FROM resume_data').fetchone()[0] == before
+
+
+def test_empty_batch_is_a_no_op():
+    assert save_many([]) == []
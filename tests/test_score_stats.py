@@ -0,0 +1,44 @@
+import sqlite3
+
+import pytest
+
+from config.connection_pool import read_connection
+from config.database import save_many
+from config.score_stats import bin_labels, score_statistics
+from conftest import make_analysis, make_resume
+
+
+def test_statistics_of_a_known_set_of_scores():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE ai_analysis (resume_score REAL, job_role TEXT)')
+    conn.executemany('INSERT INTO ai_analysis VALUES (?, ?)', [
+        (0, 'a'), (20, 'a'), (21, 'a'), (55, 'b'), (100, 'b'), (None, 'b'), (150, 'c'),
+    ])
+
+    stats = score_statistics('ai_analysis', conn=conn)
+
+    assert (stats['count'], stats['scored']) == (7, 6)
+    assert stats['mean'] == pytest.approx(round(346 / 6, 1))
+    assert [bucket['count'] for bucket in stats['histogram']] == [2, 1, 1, 0, 1]
+    assert [bucket['range'] for bucket in stats['histogram']] == bin_labels()
+    roles = {entry['role']: entry for entry in stats['by_role']}
+    assert (roles['b']['count'], roles['b']['scored'], roles['b']['mean']) == (3, 2, 77.5)
+
+
+def test_unknown_source_is_rejected():
+    with pytest.raises(ValueError):
+        score_statistics('resume_data')
+
+
+def test_dashboard_ats_statistics_match_the_table():
+    from dashboard.dashboard import DashboardManager
+
+    save_many([(make_resume(i), make_analysis(ats_score=float(i))) for i in range(40, 60)])
+
+    stats = DashboardManager().get_ats_statistics()
+    with read_connection() as conn:
+        count, average = conn.execute('SELECT COUNT(ats_score), AVG(ats_score) FROM resume_analysis').fetchone()
+
+    assert stats['scored'] == count
+    assert stats['mean'] == round(average, 1)
+    assert sum(bucket['count'] for bucket in stats['histogram']) == count
@@ -0,0 +1,37 @@
+from config.database import save_many
+from config.search import build_match_query, search_resumes
+from conftest import make_resume
+
+
+def resume(i, summary, skills=('Python',)):
+    data = make_resume(i)
+    data['summary'] = summary
+    data['skills'] = list(skills)
+    return data
+
+
+def test_build_match_query_quotes_user_input():
+    assert build_match_query('data "machine learning" pyth* OR(') == '"data" "machine learning" "pyth"* "OR("'
+    assert build_match_query('  ') == ''
+
+
+def test_older_but_more_relevant_resume_ranks_first():
+    # The best match is written first, then buried under newer weak matches
+    [best] = save_many([resume(0, 'zanzibarite zanzibarite zanzibarite specialist', ['zanzibarite'])])
+    save_many([resume(i, f'generalist {i} who once met a zanzibarite' + ' filler' * 30) for i in range(1, 3000)])
+
+    results = search_resumes('zanzibarite', limit=5)
+
+    assert results[0]['id'] == best
+    assert '\x02' in results[0]['snippet']
+
+
+def test_pages_follow_one_ranking():
+    everything = [row['id'] for row in search_resumes('zanzibarite', limit=3000)]
+    paged = []
+    for offset in range(0, len(everything), 500):
+        paged += [row['id'] for row in search_resumes('zanzibarite', limit=500, offset=offset)]
+
+    assert len(everything) == 3000
+    assert paged == everything
+    assert search_resumes('zanzibarite', limit=10, offset=3000) == []
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from config.connection_pool import read_connection
+from config.write_queue import DURABILITY_SYNC, WriteBehindQueue
+
+
+def count_rows(table):
+    with read_connection() as conn:
+        return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+def insert_user(name):
+    return lambda cursor: cursor.execute(
+        "INSERT INTO users (username, email, password_hash) VALUES (?, ?, 'x')", (name, f'{name}@example.com')
+    ).lastrowid
+
+
+def test_queued_writes_commit_in_order_after_flush(database):
+    writes = WriteBehindQueue(database)
+    before = count_rows('users')
+    futures = [writes.submit(insert_user(f'queued{i}')) for i in range(20)]
+    writes.flush(timeout=10)
+
+    ids = [future.result(timeout=0) for future in futures]
+    assert ids == sorted(ids)
+    assert count_rows('users') == before + 20
+    writes.close()
+
+
+def test_failed_job_does_not_discard_its_batch(database):
+    writes = WriteBehindQueue(database)
+    good = writes.submit(insert_user('batch_good'))
+    bad = writes.submit(insert_user('batch_good'))  # duplicate username
+    writes.flush(timeout=10)
+
+    assert good.result(timeout=0)
+    with pytest.raises(Exception):
+        bad.result(timeout=0)
+    writes.close()
+
+
+def test_sync_durability_raises_the_job_error(database):
+    writes = WriteBehindQueue(database, durability=DURABILITY_SYNC)
+    future = writes.submit(insert_user('sync_user'))
+    assert future.done()
+    with pytest.raises(Exception):
+        writes.submit(insert_user('sync_user'))
+    writes.close()
+
+
+def test_close_gives_up_on_a_stuck_writer_and_fails_pending_writes(database):
+    writes = WriteBehindQueue(database)
+    started, release = threading.Event(), threading.Event()
+
+    def stuck_job(cursor):
+        started.set()
+        return release.wait(10)
+
+    stuck = writes.submit(stuck_job)
+    # Queue the next write only once the writer is inside the stuck job
+    assert started.wait(10)
+    dropped = writes.submit(insert_user('never_written'))
+
+    writes.close(timeout=0.2)
+
+    with pytest.raises(RuntimeError):
+        dropped.result(timeout=0)
+    release.set()
+    assert stuck.result(timeout=10) is True
@@ -2,15 +2,17 @@ import os
 import streamlit as st
 from dotenv import load_dotenv
 import google.generativeai as genai
-import pdfplumber
-from pdf2image import convert_from_path
-import pytesseract
-import tempfile
+import io
 import requests
 import json
 import math
 import re
 
+from utils.extraction import join_pages, limit_pages
+from utils.extraction_cache import DOCX_EXTRACTOR_VERSION, get_extraction_cache, read_bytes
+from utils.ocr import OCR_MAX_PAGES, ocr_pdf
+from utils.pdf_router import cached_pdf_text
+
 
 class AIResumeAnalyzer:
     def __init__(self):
@@ -25,160 +27,93 @@ class AIResumeAnalyzer:
             genai.configure(api_key=self.google_api_key)
     
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF using pdfplumber and OCR if needed"""
-        text = ""
+        """Extract text from PDF with the fastest adequate extractor, and OCR if needed"""
+        return self._extract_pdf_text(read_bytes(pdf_file))
+
+    def _extract_pdf_text(self, pdf_bytes):
+        try:
+            # The shared cached text layer, with OCR if the router finds it inadequate
+            text = cached_pdf_text(pdf_bytes, ocr=self._ocr_pdf_text)
+            if text:
+                return text
+        except Exception as e:
+            st.error(f"PDF processing failed: {e}")
         
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            if hasattr(pdf_file, 'getbuffer'):
-                temp_file.write(pdf_file.getbuffer())
-            elif hasattr(pdf_file, 'read'):
-                temp_file.write(pdf_file.read())
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                temp_file.write(pdf_file)
-            temp_path = temp_file.name
+        # If all extraction methods failed, return an empty string
+        st.error("All text extraction methods failed. Please try a different PDF or manually extract the text.")
+        return ""
+
+    def _ocr_pdf_text(self, pdf_bytes):
+        st.warning("Standard text extraction methods failed. Your PDF might be image-based or scanned.")
         
         try:
-            # Try direct text extraction with pdfplumber
-            try:
-                with pdfplumber.open(temp_path) as pdf:
-                    for page in pdf.pages:
-                        try:
-                            # Suppress specific warnings about PDFColorSpace conversion
-                            import warnings
-                            with warnings.catch_warnings():
-                                warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
-                                warnings.filterwarnings("ignore", message=".*Cannot convert.*")
-                                page_text = page.extract_text()
-                                if page_text:
-                                    text += page_text + "\n"
-                        except Exception as e:
-                            # Don't show these specific errors to the user
-                            if "PDFColorSpace" not in str(e) and "Cannot convert" not in str(e):
-                                st.warning(f"Error extracting text from page with pdfplumber: {e}")
-            except Exception as e:
-                st.warning(f"pdfplumber extraction failed: {e}")
-            
-            # If pdfplumber extraction worked, return the text
-            if text.strip():
-                os.unlink(temp_path)  # Clean up the temp file
-                return text.strip()
-            
-            # Try PyPDF2 as a fallback
-            st.info("Trying PyPDF2 extraction method...")
-            try:
-                import pypdf
-                pdf_text = ""
-                with open(temp_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            pdf_text += page_text + "\n"
-                
-                if pdf_text.strip():
-                    os.unlink(temp_path)  # Clean up the temp file
-                    return pdf_text.strip()
-            except Exception as e:
-                st.warning(f"PyPDF2 extraction failed: {e}")
-            
-            # If we got here, both extraction methods failed
-            st.warning("Standard text extraction methods failed. Your PDF might be image-based or scanned.")
+            # Check if we can import the required OCR libraries
+            import pytesseract
+            import pdf2image
+            
+            st.info("Attempting OCR for image-based PDF. This may take a moment...")
+            
+            # Check if poppler is installed
+            poppler_path = None
+            if os.name == 'nt':  # Windows
+                # Try to find poppler in common locations
+                possible_paths = [
+                    r'C:\poppler\Library\bin',
+                    r'C:\Program Files\poppler\bin',
+                    r'C:\Program Files (x86)\poppler\bin',
+                    r'C:\poppler\bin'
+                ]
+                for path in possible_paths:
+                    if os.path.exists(path):
+                        poppler_path = path
+                        st.success(f"Found Poppler at: {path}")
+                        break
+                
+                if not poppler_path:
+                    st.warning("Poppler not found in common locations. Using default path: C:\\poppler\\Library\\bin")
+                    poppler_path = r'C:\poppler\Library\bin'
             
-            # Try OCR as a last resort
+            # Rasterize and OCR the pages in parallel worker processes
             try:
-                # Check if we can import the required OCR libraries
-                import pytesseract
-                from pdf2image import convert_from_path
-                
-                st.info("Attempting OCR for image-based PDF. This may take a moment...")
-                
-                # Check if poppler is installed
-                poppler_path = None
-                if os.name == 'nt':  # Windows
-                    # Try to find poppler in common locations
-                    possible_paths = [
-                        r'C:\poppler\Library\bin',
-                        r'C:\Program Files\poppler\bin',
-                        r'C:\Program Files (x86)\poppler\bin',
-                        r'C:\poppler\bin'
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            poppler_path = path
-                            st.success(f"Found Poppler at: {path}")
-                            break
-                    
-                    if not poppler_path:
-                        st.warning("Poppler not found in common locations. Using default path: C:\\poppler\\Library\\bin")
-                        poppler_path = r'C:\poppler\Library\bin'
-                
-                # Try to convert PDF to images
-                try:
-                    if poppler_path and os.name == 'nt':
-                        images = convert_from_path(temp_path, poppler_path=poppler_path)
-                    else:
-                        images = convert_from_path(temp_path)
-                    
-                    # Process each image with OCR
-                    ocr_text = ""
-                    for i, image in enumerate(images):
-                        st.info(f"Processing page {i+1} with OCR...")
-                        page_text = pytesseract.image_to_string(image)
-                        ocr_text += page_text + "\n"
-                    
-                    if ocr_text.strip():
-                        os.unlink(temp_path)  # Clean up the temp file
-                        return ocr_text.strip()
-                    else:
-                        st.error("OCR extraction yielded no text. Please check if the PDF contains actual text content.")
-                except Exception as e:
-                    st.error(f"PDF to image conversion failed: {e}")
-                    st.info("If you're on Windows, make sure Poppler is installed and in your PATH.")
-                    st.info("Download Poppler from: https://github.com/oschwartz10612/poppler-windows/releases/")
-            except ImportError as e:
-                st.error(f"OCR libraries not available: {e}")
-                st.info("Please install the required OCR libraries:")
-                st.code("pip install pytesseract pdf2image")
-                st.info("For Windows, also download and install:")
-                st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
-                st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
+                st.info(f"Running OCR on up to {OCR_MAX_PAGES} pages..." if OCR_MAX_PAGES else "Running OCR on every page...")
+                ocr_text = ocr_pdf(pdf_bytes, poppler_path=poppler_path if os.name == 'nt' else None)
+                
+                if ocr_text.strip():
+                    return ocr_text.strip()
+                else:
+                    st.error("OCR extraction yielded no text. Please check if the PDF contains actual text content.")
             except Exception as e:
-                st.error(f"OCR processing failed: {e}")
-        
+                st.error(f"PDF to image conversion failed: {e}")
+                st.info("If you're on Windows, make sure Poppler is installed and in your PATH.")
+                st.info("Download Poppler from: https://github.com/oschwartz10612/poppler-windows/releases/")
+        except ImportError as e:
+            st.error(f"OCR libraries not available: {e}")
+            st.info("Please install the required OCR libraries:")
+            st.code("pip install pytesseract pdf2image")
+            st.info("For Windows, also download and install:")
+            st.info("1. Tesseract OCR: https://github.com/UB-Mannheim/tesseract/wiki")
+            st.info("2. Poppler: https://github.com/oschwartz10612/poppler-windows/releases/")
         except Exception as e:
-            st.error(f"PDF processing failed: {e}")
-        
-        # Clean up the temp file
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
-        
-        # If all extraction methods failed, return an empty string
-        st.error("All text extraction methods failed. Please try a different PDF or manually extract the text.")
+            st.error(f"OCR processing failed: {e}")
+
         return ""
     
     def extract_text_from_docx(self, docx_file):
         """Extract text from DOCX file"""
+        return get_extraction_cache().extract(
+            read_bytes(docx_file), 'ai_resume_analyzer.docx', DOCX_EXTRACTOR_VERSION, self._extract_docx_text
+        )
+
+    def _extract_docx_text(self, docx_bytes):
         from docx import Document
         
-        # Save the uploaded file to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-            temp_file.write(docx_file.getbuffer())
-            temp_path = temp_file.name
-        
         text = ""
         try:
-            doc = Document(temp_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
+            doc = Document(io.BytesIO(docx_bytes))
+            text = join_pages(limit_pages((para.text for para in doc.paragraphs), max_pages=0))
         except Exception as e:
             st.error(f"Error extracting text from DOCX: {e}")
         
-        os.unlink(temp_path)  # Clean up the temp file
         return text
     
     def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
@@ -1,8 +1,15 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, func
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, DateTime, func
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
+from contextlib import contextmanager
 import datetime
 import json
+import threading
+from config.connection_pool import DB_PATH, BUSY_TIMEOUT_MS, configure_connection
+
+# Engine pool sizing; sessions borrow a connection only while in use
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
 
 # Create the base class for declarative models
 Base = declarative_base()
@@ -37,12 +44,77 @@ class AIAnalysis(Base):
     job_role = Column(String(100))
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+_engines = {}
+_sessions = {}
+_engines_lock = threading.Lock()
+
+def get_engine(db_path=DB_PATH):
+    """Return the process-wide engine for a database file.
+
+    The engine is created once per path with a connection pool and the same
+    pragmas as config.connection_pool, and the ORM tables are created the
+    first time it is requested.
+    """
+    with _engines_lock:
+        engine = _engines.get(db_path)
+        if engine is None:
+            engine = create_engine(
+                f'sqlite:///{db_path}',
+                pool_size=POOL_SIZE,
+                max_overflow=MAX_OVERFLOW,
+                connect_args={'check_same_thread': False, 'timeout': BUSY_TIMEOUT_MS / 1000}
+            )
+            event.listen(engine, 'connect', lambda dbapi_conn, record: configure_connection(dbapi_conn))
+            Base.metadata.create_all(engine)
+            _engines[db_path] = engine
+            _sessions[db_path] = scoped_session(sessionmaker(bind=engine))
+        return engine
+
+def get_session_registry(db_path=DB_PATH):
+    """Return the thread-scoped session registry bound to the cached engine"""
+    get_engine(db_path)
+    return _sessions[db_path]
+
+@contextmanager
+def read_session(db_path=DB_PATH):
+    """Yield this thread's session for queries, releasing it afterwards"""
+    registry = get_session_registry(db_path)
+    try:
+        yield registry()
+    finally:
+        registry.remove()
+
+@contextmanager
+def write_session(db_path=DB_PATH):
+    """Yield this thread's session inside one transaction.
+
+    Commits when the block exits normally and rolls back if it raises.
+    """
+    registry = get_session_registry(db_path)
+    session = registry()
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        registry.remove()
+
+def dispose_engines():
+    """Close every pooled connection, e.g. on shutdown or in benchmarks"""
+    with _engines_lock:
+        for registry in _sessions.values():
+            registry.remove()
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _sessions.clear()
+
 class DatabaseManager:
-    def __init__(self, db_path='resume_data.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    def __init__(self, db_path=DB_PATH):
+        self.engine = get_engine(db_path)
+        self.session = get_session_registry(db_path)
     
     def save_resume(self, user_id, job_role, content):
         resume = Resume(
@@ -79,16 +151,12 @@ class DatabaseManager:
         self.session.close()
 
 def get_database_connection():
-    """Get a connection to the database"""
-    engine = create_engine('sqlite:///resume_data.db')
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get this thread's session on the cached engine (caller closes it)"""
+    return get_session_registry()()
 
 def save_resume_data(resume_data):
     """Save resume data to the database"""
-    session = get_database_connection()
-    try:
+    with write_session() as session:
         # Convert resume_data to JSON string
         resume_json = json.dumps(resume_data)
         
@@ -100,18 +168,12 @@ def save_resume_data(resume_data):
         )
         
         session.add(resume)
-        session.commit()
+        session.flush()
         return resume.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
 
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
-    session = get_database_connection()
-    try:
+    with write_session() as session:
         # Create a new AIAnalysis object
         ai_analysis = AIAnalysis(
             resume_id=resume_id,
@@ -121,39 +183,34 @@ def save_ai_analysis_data(resume_id, analysis_data):
         )
         
         session.add(ai_analysis)
-        session.commit()
+        session.flush()
         return ai_analysis.id
-    except Exception as e:
-        session.rollback()
-        raise e
-    finally:
-        session.close()
 
 def get_ai_analysis_statistics():
     """Get statistics about AI analyses"""
-    session = get_database_connection()
     try:
-        # Get total number of analyses
-        total_analyses = session.query(func.count(AIAnalysis.id)).scalar() or 0
-        
-        # Get average resume score
-        average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
-        
-        # Get model usage distribution
-        model_usage_query = session.query(
-            AIAnalysis.model_used, 
-            func.count(AIAnalysis.id)
-        ).group_by(AIAnalysis.model_used).all()
-        
-        model_usage = {model: count for model, count in model_usage_query}
-        
-        # Get job role distribution
-        job_roles_query = session.query(
-            AIAnalysis.job_role, 
-            func.count(AIAnalysis.id)
-        ).group_by(AIAnalysis.job_role).all()
-        
-        job_roles = {role: count for role, count in job_roles_query}
+        with read_session() as session:
+            # Get total number of analyses
+            total_analyses = session.query(func.count(AIAnalysis.id)).scalar() or 0
+            
+            # Get average resume score
+            average_score = session.query(func.avg(AIAnalysis.resume_score)).scalar() or 0
+            
+            # Get model usage distribution
+            model_usage_query = session.query(
+                AIAnalysis.model_used, 
+                func.count(AIAnalysis.id)
+            ).group_by(AIAnalysis.model_used).all()
+            
+            model_usage = {model: count for model, count in model_usage_query}
+            
+            # Get job role distribution
+            job_roles_query = session.query(
+                AIAnalysis.job_role, 
+                func.count(AIAnalysis.id)
+            ).group_by(AIAnalysis.job_role).all()
+            
+            job_roles = {role: count for role, count in job_roles_query}
         
         return {
             'total_analyses': total_analyses,
@@ -163,6 +220,4 @@ def get_ai_analysis_statistics():
         }
     except Exception as e:
         print(f"Error getting AI analysis statistics: {e}")
-        return None
-    finally:
-        session.close()
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -1,43 +1,160 @@
-import pandas as pd
+import json
+import os
+import threading
 from datetime import datetime
 
+import pandas as pd
+import xlsxwriter
+
+from config.json_fields import to_json
+
+COLUMNS = ['user_id', 'job_role', 'content', 'analysis_data', 'created_at']
+
+# One lock per journal directory, shared by every ExcelManager in the process
+_journal_locks = {}
+_journal_locks_lock = threading.Lock()
+
+
+def _journal_lock(journal_dir):
+    with _journal_locks_lock:
+        return _journal_locks.setdefault(os.path.abspath(journal_dir), threading.Lock())
+
 class ExcelManager:
-    def __init__(self):
-        self.excel_file = "resume_data.xlsx"
-    
+    """Resume records kept in an append-only JSON Lines journal.
+
+    Each save appends one line to the current month's journal file
+    (resume_data-YYYY-MM.jsonl) and one entry to a per-user offset index,
+    so saving costs the same however many rows exist. The .xlsx workbook
+    is built on demand by export_to_excel().
+
+    Lines are appended with single unbuffered O_APPEND writes, and a
+    record's offset is taken from the file position after its own write,
+    so concurrent writers never record each other's offsets. The cached
+    index is topped up from the index file whenever it has grown, which
+    picks up appends made by other instances and processes.
+    """
+
+    def __init__(self, journal_dir="resume_journal", excel_file="resume_data.xlsx"):
+        self.journal_dir = journal_dir
+        self.excel_file = excel_file
+        self.index_file = os.path.join(journal_dir, "user_index.jsonl")
+        self._lock = _journal_lock(journal_dir)
+        self._index = None
+        # Bytes of the index file already read into _index
+        self._index_size = 0
+        os.makedirs(journal_dir, exist_ok=True)
+        self._import_legacy_workbook()
+
+    def _journal_files(self):
+        return sorted(
+            os.path.join(self.journal_dir, name)
+            for name in os.listdir(self.journal_dir)
+            if name.startswith("resume_data-") and name.endswith(".jsonl")
+        )
+
+    def _import_legacy_workbook(self):
+        # One-time move of a workbook written by the old read-modify-rewrite store
+        if not os.path.exists(self.excel_file) or self._journal_files():
+            return
+        try:
+            df = pd.read_excel(self.excel_file)
+            for record in df.astype(object).where(df.notna(), None).to_dict('records'):
+                self._append({column: record.get(column) for column in COLUMNS})
+        except Exception as e:
+            print(f"Error importing {self.excel_file}: {str(e)}")
+
+    def _append(self, record):
+        month = str(record.get('created_at') or datetime.now().strftime("%Y-%m"))[:7]
+        journal = os.path.join(self.journal_dir, f"resume_data-{month}.jsonl")
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+        with self._lock:
+            # Unbuffered, so the line goes out in one O_APPEND write and tell() is where it ended
+            with open(journal, 'ab', buffering=0) as f:
+                f.write(line)
+                offset = f.tell() - len(line)
+            entry = {'user_id': record['user_id'], 'file': os.path.basename(journal),
+                     'offset': offset, 'length': len(line)}
+            with open(self.index_file, 'ab', buffering=0) as f:
+                f.write((json.dumps(entry, default=str) + "\n").encode('utf-8'))
+
+    def _load_index(self):
+        with self._lock:
+            if self._index is None:
+                self._index, self._index_size = {}, 0
+            size = os.path.getsize(self.index_file) if os.path.exists(self.index_file) else 0
+            if size != self._index_size:
+                if size < self._index_size:
+                    # Replaced or truncated: read it again from the start
+                    self._index, self._index_size = {}, 0
+                with open(self.index_file, 'rb') as f:
+                    f.seek(self._index_size)
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            break  # Final line still being written
+                        self._index_size += len(line)
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # Torn line from an interrupted write
+                        self._index.setdefault(str(entry['user_id']), []).append(entry)
+            return self._index
+
     def save_resume_data(self, user_id, job_role, content, analysis_data=None):
         try:
-            # Try to read existing Excel file
-            try:
-                df = pd.read_excel(self.excel_file)
-            except FileNotFoundError:
-                df = pd.DataFrame()
-            
-            # Create new data entry
-            new_data = {
+            self._append({
                 'user_id': user_id,
                 'job_role': job_role,
                 'content': content,
-                'analysis_data': str(analysis_data) if analysis_data else None,
+                'analysis_data': to_json(analysis_data) if analysis_data else None,
                 'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # Append new data
-            df = pd.concat([df, pd.DataFrame([new_data])], ignore_index=True)
-            
-            # Save to Excel
-            df.to_excel(self.excel_file, index=False)
+            })
             return True
         except Exception as e:
             print(f"Error saving to Excel: {str(e)}")
             return False
-    
+
+    def iter_records(self):
+        """Yield every saved record, oldest month first"""
+        for journal in self._journal_files():
+            with open(journal, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+
     def get_all_resumes(self):
-        try:
-            return pd.read_excel(self.excel_file)
-        except FileNotFoundError:
-            return pd.DataFrame()
-    
+        return pd.DataFrame(list(self.iter_records()), columns=COLUMNS)
+
     def get_user_resumes(self, user_id):
-        df = self.get_all_resumes()
-        return df[df['user_id'] == user_id]
\ No newline at end of file
+        records = []
+        handles = {}
+        try:
+            for entry in self._load_index().get(str(user_id), []):
+                if entry['file'] not in handles:
+                    handles[entry['file']] = open(os.path.join(self.journal_dir, entry['file']), 'rb')
+                f = handles[entry['file']]
+                f.seek(entry['offset'])
+                records.append(json.loads(f.read(entry['length'])))
+        finally:
+            for f in handles.values():
+                f.close()
+        return pd.DataFrame(records, columns=COLUMNS)
+
+    def export_to_excel(self, path=None):
+        """Build the .xlsx workbook from the journal; returns its path"""
+        path = path or self.excel_file
+        workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False
+        })
+        try:
+            worksheet = workbook.add_worksheet('Resume Data')
+            worksheet.write_row(0, 0, COLUMNS, workbook.add_format({'bold': True}))
+            for row, record in enumerate(self.iter_records(), start=1):
+                worksheet.write_row(row, 0, [record.get(column) for column in COLUMNS])
+        finally:
+            workbook.close()
+        return path
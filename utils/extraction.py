@@ -0,0 +1,99 @@
+"""
+Helpers shared by the document text extractors.
+
+Extraction works on the uploaded bytes in memory: pdfplumber, pypdf and
+python-docx all read from a BytesIO. Only rasterizing a PDF for OCR needs
+a real file, because poppler is a separate program; scratch_path() writes
+the bytes into a private directory on tmpfs (/dev/shm where available)
+and removes it when the block exits, however it exits.
+
+Extractors produce text one page (or paragraph) at a time from generators,
+so nothing is read past what a caller consumes. limit_pages() stops the
+stream when a page, character or wall-clock budget runs out, which keeps a
+300-page upload from pinning a worker, and join_pages() joins what was
+read once at the end. Callers that only need the start of a document,
+such as document type detection, just stop iterating.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+
+SHM_DIR = '/dev/shm'
+
+
+def _default_scratch_dir():
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        return SHM_DIR
+    return None
+
+
+# None uses the system temp directory
+SCRATCH_DIR = os.environ.get('WORKBRIDGE_SCRATCH_DIR') or _default_scratch_dir()
+
+# Budgets for one document; 0 disables a budget
+EXTRACT_MAX_PAGES = int(os.environ.get('WORKBRIDGE_EXTRACT_MAX_PAGES', '50'))
+EXTRACT_MAX_CHARS = int(os.environ.get('WORKBRIDGE_EXTRACT_MAX_CHARS', '200000'))
+EXTRACT_SECONDS = float(os.environ.get('WORKBRIDGE_EXTRACT_SECONDS', '30'))
+
+
+@contextmanager
+def scratch_path(data, suffix=''):
+    """Path to a temporary copy of data, deleted when the block exits"""
+    directory = tempfile.mkdtemp(prefix='workbridge-', dir=SCRATCH_DIR)
+    try:
+        path = os.path.join(directory, f"document{suffix}")
+        with open(path, 'wb') as f:
+            f.write(data)
+        yield path
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def limit_pages(pages, max_pages=EXTRACT_MAX_PAGES, max_chars=EXTRACT_MAX_CHARS, seconds=EXTRACT_SECONDS,
+                usage=None):
+    """
+    Page texts from pages until max_pages pages, max_chars characters or
+    seconds of wall-clock time have been used.
+
+    The page that crosses max_chars is cut short. If usage is a dict, it
+    gets the pages and chars yielded and the budget that stopped the
+    stream, if any. The underlying generator is closed when this one is.
+    """
+    deadline = time.monotonic() + seconds if seconds else None
+    count = chars = 0
+    stopped = None
+    pages = iter(pages)
+    try:
+        while True:
+            if max_pages and count >= max_pages:
+                stopped = 'max_pages'
+                break
+            # Checked between pages: a page already being extracted is not interrupted
+            if deadline is not None and time.monotonic() >= deadline:
+                stopped = 'seconds'
+                break
+            text = next(pages, None)
+            if text is None:
+                break
+            count += 1
+            if max_chars and chars + len(text) >= max_chars:
+                text = text[:max_chars - chars]
+                stopped = 'max_chars'
+            chars += len(text)
+            yield text
+            if stopped:
+                break
+    finally:
+        if usage is not None:
+            usage.update(pages=count, chars=chars, stopped=stopped)
+        close = getattr(pages, 'close', None)
+        if close is not None:
+            close()
+
+
+def join_pages(pages):
+    """Text of a stream of page texts, joined once"""
+    return "\n".join(pages).strip()
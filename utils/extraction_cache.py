@@ -0,0 +1,170 @@
+"""
+Content-addressed cache for text extracted from uploaded documents.
+
+Extraction (and OCR in particular) is the slowest step of an analysis, and
+Streamlit reruns the script, so the same upload used to be extracted again
+on every rerun and by every analyzer that looked at it. Each extractor
+now goes through ExtractionCache.extract(), keyed by the SHA-256 of the
+file bytes plus the extractor's name and version. A hit is served from an
+in-process LRU, then from a small SQLite file shared by every process; a
+miss runs the extractor once (concurrent callers for the same key wait for
+it) and stores the text in both tiers.
+
+Bump an extractor's version when its output changes so stale entries are
+no longer used. Empty results and exceptions are not cached, so a failed
+extraction is retried next time.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from config.connection_pool import get_connection_manager
+
+# Empty disables the disk tier
+CACHE_PATH = os.environ.get('WORKBRIDGE_EXTRACTION_CACHE', 'extraction_cache.db')
+MEMORY_ENTRIES = int(os.environ.get('WORKBRIDGE_EXTRACTION_CACHE_ENTRIES', '128'))
+
+# Version of every analyzer's DOCX extractor; bump when the extracted text
+# changes, so cached extractions are redone (PDFs: pdf_router.TEXT_LAYER_VERSION)
+DOCX_EXTRACTOR_VERSION = 2
+
+CREATE_CACHE_TABLE = '''
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID
+'''
+
+
+def read_bytes(file):
+    """Bytes of an uploaded file, file-like object or bytes, leaving the file position unchanged"""
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        return bytes(file)
+    if hasattr(file, 'getvalue'):
+        return file.getvalue()
+    position = file.tell()
+    file.seek(0)
+    data = file.read()
+    file.seek(position)
+    return data
+
+
+def content_key(data, extractor, version):
+    """Cache key for data extracted by extractor at version"""
+    return f"{hashlib.sha256(data).hexdigest()}:{extractor}:{version}"
+
+
+class ExtractionCache:
+    """Two-tier (memory LRU, then SQLite) cache of extracted text"""
+
+    def __init__(self, path=CACHE_PATH, memory_entries=MEMORY_ENTRIES):
+        self.path = path
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._ready = False
+        self.hits = {'memory': 0, 'disk': 0}
+        self.misses = 0
+
+    def _disk(self):
+        """Connection manager for the disk tier, or None if it is disabled"""
+        if not self.path:
+            return None
+        connections = get_connection_manager(self.path)
+        if not self._ready:
+            with connections.write() as conn:
+                conn.execute(CREATE_CACHE_TABLE)
+            self._ready = True
+        return connections
+
+    def _remember(self, key, text):
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Cached text for key, or None"""
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.hits['memory'] += 1
+                return text
+
+        try:
+            disk = self._disk()
+            if disk is None:
+                return None
+            with disk.read() as conn:
+                row = conn.execute('SELECT text FROM extraction_cache WHERE key = ?', (key,)).fetchone()
+        except Exception as e:
+            print(f"Error reading extraction cache: {str(e)}")
+            return None
+        if row is None:
+            return None
+        self.hits['disk'] += 1
+        self._remember(key, row[0])
+        return row[0]
+
+    def put(self, key, text):
+        """Store text for key in both tiers"""
+        self._remember(key, text)
+        try:
+            disk = self._disk()
+            if disk is not None:
+                with disk.write() as conn:
+                    conn.execute('INSERT OR REPLACE INTO extraction_cache (key, text) VALUES (?, ?)', (key, text))
+        except Exception as e:
+            print(f"Error writing extraction cache: {str(e)}")
+
+    def extract(self, data, extractor, version, fn):
+        """Text of data as extracted by fn(data), computed at most once per key"""
+        key = content_key(data, extractor, version)
+        text = self.get(key)
+        if text is not None:
+            return text
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another caller may have extracted it while we waited
+            text = self.get(key)
+            if text is not None:
+                return text
+            self.misses += 1
+            try:
+                text = fn(data)
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+            if text:
+                self.put(key, text)
+            return text
+
+    def clear(self):
+        """Drop every cached entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        disk = self._disk()
+        if disk is not None:
+            with disk.write() as conn:
+                conn.execute('DELETE FROM extraction_cache')
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache():
+    """Return the process-wide ExtractionCache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ExtractionCache()
+        return _cache
@@ -0,0 +1,117 @@
+"""
+Parallel OCR for image-based PDFs.
+
+ocr_pdf() writes the PDF to a scratch file on tmpfs and fans its pages
+out to a shared process pool, one task per page. Each worker rasterizes
+only its own page with poppler (pdf2image) and runs tesseract on it, so
+both steps run in parallel and no images cross process boundaries. Page
+texts come back in page order and are joined once.
+
+The pool is sized to the cores this process may run on and uses the spawn
+start method, which is safe under Streamlit's threads. Settings can be
+overridden per call or with WORKBRIDGE_OCR_* environment variables:
+
+  DPI        rasterization resolution (300 reads small print better)
+  GRAYSCALE  rasterize in grayscale, a third of the pixels to OCR
+  PSM / OEM  tesseract page segmentation and engine modes
+  MAX_PAGES  pages OCR'd at most; later pages are skipped, and 0 OCRs
+             every page, like the 0 of the WORKBRIDGE_EXTRACT_* budgets
+  WORKERS    pool size; 0 or 1 runs pages one by one in this process
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.extraction import scratch_path
+
+
+def _available_cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+OCR_DPI = int(os.environ.get('WORKBRIDGE_OCR_DPI', '200'))
+OCR_GRAYSCALE = os.environ.get('WORKBRIDGE_OCR_GRAYSCALE', '1') != '0'
+OCR_PSM = int(os.environ.get('WORKBRIDGE_OCR_PSM', '3'))
+OCR_OEM = int(os.environ.get('WORKBRIDGE_OCR_OEM', '3'))
+OCR_LANG = os.environ.get('WORKBRIDGE_OCR_LANG', 'eng')
+OCR_MAX_PAGES = int(os.environ.get('WORKBRIDGE_OCR_MAX_PAGES', '10'))
+OCR_WORKERS = int(os.environ.get('WORKBRIDGE_OCR_WORKERS', str(_available_cores())))
+
+
+def ocr_page(path, page_number, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE, psm=OCR_PSM, oem=OCR_OEM,
+             lang=OCR_LANG, poppler_path=None):
+    """Rasterize one page (1-based) of the PDF at path and OCR it"""
+    import pytesseract
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(
+        path, dpi=dpi, first_page=page_number, last_page=page_number,
+        grayscale=grayscale, poppler_path=poppler_path
+    )
+    if not images:
+        return ""
+    return pytesseract.image_to_string(images[0], lang=lang, config=f"--psm {psm} --oem {oem}")
+
+
+def _ocr_page_task(args):
+    path, page_number, options = args
+    return ocr_page(path, page_number, **options)
+
+
+def page_count(path, poppler_path=None):
+    """Number of pages in the PDF at path"""
+    from pdf2image import pdfinfo_from_path
+
+    return int(pdfinfo_from_path(path, poppler_path=poppler_path)['Pages'])
+
+
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers):
+    """Shared process pool with workers processes"""
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pools[workers] = pool
+        return pool
+
+
+def _reset_pool(workers):
+    with _pool_lock:
+        pool = _pools.pop(workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def ocr_pdf(pdf_bytes, dpi=OCR_DPI, grayscale=OCR_GRAYSCALE, psm=OCR_PSM, oem=OCR_OEM, lang=OCR_LANG,
+            max_pages=OCR_MAX_PAGES, workers=OCR_WORKERS, poppler_path=None):
+    """OCR text of the first max_pages pages (all if 0) of a PDF, in page order"""
+    options = {
+        'dpi': dpi, 'grayscale': grayscale, 'psm': psm, 'oem': oem,
+        'lang': lang, 'poppler_path': poppler_path,
+    }
+    with scratch_path(pdf_bytes, suffix='.pdf') as path:
+        pages = page_count(path, poppler_path)
+        if max_pages:
+            pages = min(pages, max_pages)
+        tasks = [(path, page_number, options) for page_number in range(1, pages + 1)]
+        if workers <= 1 or pages <= 1:
+            texts = [_ocr_page_task(task) for task in tasks]
+        else:
+            try:
+                # map() returns results in task order whatever order pages finish in
+                texts = list(_get_pool(workers).map(_ocr_page_task, tasks))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool next time
+                _reset_pool(workers)
+                raise
+    return "\n".join(text.strip() for text in texts).strip()
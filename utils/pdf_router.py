@@ -0,0 +1,283 @@
+"""
+Adaptive routing of PDF text extraction.
+
+probe_text_layer() is a cheap pre-pass over the first few pages: it reads
+each page's font and image resources and scans its raw content stream for
+text-showing operators (Tj, TJ, ' and "), without decoding any text. The
+router then picks the cheapest extractor that can work:
+
+  no text layer        pypdf, in case the probe missed text, then OCR
+                       unless pypdf's text is adequate; no pdfplumber
+  text layer           pypdf, the fastest; pdfplumber's layout-aware
+                       extraction only if pypdf's text is too short or
+                       garbled; OCR only if that fails too
+
+A result is adequate when it has at least MIN_CHARS_PER_PAGE characters
+per page with text operators and at most MAX_GARBLED_SHARE of its
+characters are replacement, control or private-use characters (what
+fonts without a Unicode map usually come out as).
+
+Extractors are page generators read through limit_pages(), so each one
+stops at the page, character and time budgets; iter_pdf_pages() exposes
+the text layer as such a stream. extract_pdf_text() returns the text
+together with its route: the probe, each extractor tried with its timing,
+outcome and pages read, and the one that was used. The route is also
+recorded in the extraction_routes table next to the extraction cache.
+cached_pdf_text() is what the analyzers call: it caches the text layer
+once for all of them and, for callers with OCR, runs the router over
+that cached text so OCR is decided and recorded in the same way.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import warnings
+
+from config.connection_pool import get_connection_manager
+from utils.extraction import EXTRACT_MAX_CHARS, EXTRACT_MAX_PAGES, EXTRACT_SECONDS, join_pages, limit_pages
+from utils.extraction_cache import CACHE_PATH, get_extraction_cache
+
+PROBE_PAGES = int(os.environ.get('WORKBRIDGE_PDF_PROBE_PAGES', '3'))
+MIN_CHARS_PER_PAGE = int(os.environ.get('WORKBRIDGE_PDF_MIN_CHARS_PER_PAGE', '40'))
+MAX_GARBLED_SHARE = float(os.environ.get('WORKBRIDGE_PDF_MAX_GARBLED_SHARE', '0.2'))
+
+# Bump when the text-layer output changes, so cached extractions are redone
+TEXT_LAYER_VERSION = 1
+
+# Text-showing operators, as whole tokens in a content stream
+TEXT_OPERATORS = re.compile(rb'(?<![A-Za-z*\'"])(?:Tj|TJ|\'|")(?![A-Za-z*])')
+GARBLED = re.compile(r'[\ufffd\ue000-\uf8ff\x00-\x08\x0b\x0c\x0e-\x1f]|\(cid:\d+\)')
+
+CREATE_ROUTES_TABLE = '''
+CREATE TABLE IF NOT EXISTS extraction_routes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sha256 TEXT NOT NULL,
+    extractor TEXT,
+    chars INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    route TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+'''
+
+
+def _resolve(obj):
+    return obj.get_object() if obj is not None and hasattr(obj, 'get_object') else obj
+
+
+def _content_bytes(page):
+    """Raw (decoded, not parsed) content stream bytes of a page"""
+    contents = _resolve(page.get('/Contents'))
+    if contents is None:
+        return b''
+    if isinstance(contents, list):
+        return b'\n'.join(_resolve(part).get_data() for part in contents)
+    return contents.get_data()
+
+
+def _page_resources(page):
+    """(fonts, images, forms) declared in a page's resources"""
+    resources = _resolve(page.get('/Resources')) or {}
+    fonts = _resolve(resources.get('/Font')) or {}
+    images = forms = 0
+    for xobject in (_resolve(resources.get('/XObject')) or {}).values():
+        subtype = _resolve(xobject).get('/Subtype')
+        if subtype == '/Image':
+            images += 1
+        elif subtype == '/Form':
+            forms += 1
+    return [_resolve(font) for font in fonts.values()], images, forms
+
+
+def probe_text_layer(reader, max_pages=PROBE_PAGES):
+    """Whether the first max_pages pages of a pypdf reader have a text layer"""
+    start = time.perf_counter()
+    probe = {
+        'pages': len(reader.pages), 'probed': 0, 'text_pages': 0, 'image_pages': 0,
+        'fonts': 0, 'unmapped_fonts': 0,
+    }
+    for page in reader.pages[:max_pages]:
+        fonts, images, forms = _page_resources(page)
+        probe['probed'] += 1
+        probe['fonts'] += len(fonts)
+        # Composite fonts need a ToUnicode map to come out as readable text
+        probe['unmapped_fonts'] += sum(
+            1 for font in fonts if font.get('/Subtype') == '/Type0' and '/ToUnicode' not in font
+        )
+        # Text drawn inside form XObjects is not in the page's own stream
+        if fonts and (forms or TEXT_OPERATORS.search(_content_bytes(page))):
+            probe['text_pages'] += 1
+        elif images:
+            probe['image_pages'] += 1
+    probe['has_text_layer'] = probe['text_pages'] > 0
+    probe['seconds'] = round(time.perf_counter() - start, 4)
+    return probe
+
+
+def is_adequate(text, text_pages=1):
+    """Whether extracted text is long enough and not mostly garbage"""
+    text = text.strip()
+    if len(text) < MIN_CHARS_PER_PAGE * max(1, text_pages):
+        return False
+    garbled = sum(len(match) for match in GARBLED.findall(text))
+    return garbled / len(text) <= MAX_GARBLED_SHARE
+
+
+def pypdf_pages(reader):
+    """Text of each page with pypdf, extracted as it is consumed"""
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def pdfplumber_pages(pdf_bytes):
+    """Text of each page with pdfplumber's layout-aware extraction, extracted as it is consumed"""
+    import pdfplumber
+
+    with warnings.catch_warnings(), pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        # pdfminer warns about colour spaces it cannot convert; the text is unaffected
+        warnings.filterwarnings("ignore", message=".*PDFColorSpace.*")
+        warnings.filterwarnings("ignore", message=".*Cannot convert.*")
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            # Parsed layout objects are not needed once the page is read
+            page.close()
+
+
+def iter_pdf_pages(pdf_bytes, max_pages=EXTRACT_MAX_PAGES, max_chars=EXTRACT_MAX_CHARS, seconds=EXTRACT_SECONDS):
+    """Page texts of a PDF's text layer with pypdf, lazily and within the budgets"""
+    import pypdf
+
+    reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+    return limit_pages(pypdf_pages(reader), max_pages, max_chars, seconds)
+
+
+def _run(route, name, pages, budget):
+    """Read one extractor's pages within budget, adding its timing and outcome to route"""
+    start = time.perf_counter()
+    step = {'extractor': name}
+    usage = {}
+    try:
+        text = join_pages(limit_pages(pages(), usage=usage, **budget))
+    except Exception as e:
+        text = ""
+        step['error'] = str(e)
+    step['seconds'] = round(time.perf_counter() - start, 4)
+    step['chars'] = len(text)
+    step.update(usage)
+    route['steps'].append(step)
+    return text
+
+
+def extract_pdf_text(pdf_bytes, ocr=None, record=True, max_pages=EXTRACT_MAX_PAGES,
+                     max_chars=EXTRACT_MAX_CHARS, seconds=EXTRACT_SECONDS, text_layer=None):
+    """
+    Text of a PDF from the cheapest adequate extractor, and the route taken.
+
+    Text extractors stop at max_pages pages or max_chars characters, and
+    all of them together at seconds of wall-clock time. ocr, if given, is
+    called with the PDF bytes as the last resort. text_layer, if given, is
+    text the extractors already produced (e.g. from the cache); it is
+    judged like their output instead of extracting again.
+    """
+    import pypdf
+
+    start = time.perf_counter()
+    deadline = start + seconds if seconds else None
+    route = {'probe': None, 'steps': [], 'extractor': None}
+    reader = None
+    try:
+        reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+        route['probe'] = probe_text_layer(reader)
+    except Exception as e:
+        route['probe'] = {'error': str(e)}
+
+    probe = route['probe']
+    text_pages = probe.get('text_pages', 1)
+    candidates = []
+    if text_layer is not None:
+        candidates.append(('cached', lambda: iter([text_layer])))
+    # pypdf is cheap enough to try whatever the probe says, even if it failed
+    elif reader is not None:
+        candidates.append(('pypdf', lambda: pypdf_pages(reader)))
+    # Only a probe that found no text layer rules out pdfplumber; if pypdf
+    # could not open or probe the file, pdfminer may still cope
+    if text_layer is None and probe.get('has_text_layer', True):
+        candidates.append(('pdfplumber', lambda: pdfplumber_pages(pdf_bytes)))
+    if ocr is not None:
+        # OCR has its own page cap and yields the document in one piece
+        candidates.append(('ocr', lambda: iter([ocr(pdf_bytes)])))
+
+    best = ""
+    for name, pages in candidates:
+        remaining = deadline - time.perf_counter() if deadline is not None else 0
+        if deadline is not None and remaining <= 0:
+            route['stopped'] = 'seconds'
+            break
+        if name in ('cached', 'ocr'):
+            budget = {'max_pages': 0, 'max_chars': max_chars, 'seconds': 0}
+        else:
+            budget = {'max_pages': max_pages, 'max_chars': max_chars, 'seconds': remaining}
+        text = _run(route, name, pages, budget)
+        # OCR has no text layer to measure against
+        if is_adequate(text, text_pages if name != 'ocr' else 1):
+            best = text
+            route['extractor'] = name
+            break
+        if len(text) > len(best):
+            best = text
+            route['extractor'] = name
+
+    route['seconds'] = round(time.perf_counter() - start, 4)
+    if record:
+        record_route(pdf_bytes, best, route)
+    return best, route
+
+
+def cached_pdf_text(pdf_bytes, ocr=None):
+    """
+    Text of a PDF through the extraction cache.
+
+    The text layer is extracted once per content under one key for every
+    analyzer. With ocr, the router then judges that text against the
+    probe and OCRs the PDF only if it is not adequate; the outcome is
+    cached under its own key and the route recorded like any other.
+    """
+    cache = get_extraction_cache()
+    if ocr is None:
+        return cache.extract(pdf_bytes, 'pdf_router.pdf', TEXT_LAYER_VERSION, _text_layer)
+    try:
+        text_layer = cache.extract(pdf_bytes, 'pdf_router.pdf', TEXT_LAYER_VERSION, _text_layer)
+    except Exception:
+        # Let the router run the text extractors itself and record their errors
+        text_layer = None
+    return cache.extract(
+        pdf_bytes, 'pdf_router.ocr', TEXT_LAYER_VERSION,
+        lambda data: extract_pdf_text(data, ocr=ocr, text_layer=text_layer)[0]
+    )
+
+
+def _text_layer(pdf_bytes):
+    text, route = extract_pdf_text(pdf_bytes)
+    errors = [step['error'] for step in route['steps'] if 'error' in step]
+    if not text and errors:
+        raise Exception(errors[-1])
+    return text
+
+
+def record_route(pdf_bytes, text, route):
+    """Append a document's extraction route to the extraction_routes table"""
+    if not CACHE_PATH:
+        return
+    try:
+        with get_connection_manager(CACHE_PATH).write() as conn:
+            conn.execute(CREATE_ROUTES_TABLE)
+            conn.execute(
+                'INSERT INTO extraction_routes (sha256, extractor, chars, seconds, route) VALUES (?, ?, ?, ?, ?)',
+                (hashlib.sha256(pdf_bytes).hexdigest(), route['extractor'], len(text), route['seconds'],
+                 json.dumps(route))
+            )
+    except Exception as e:
+        print(f"Error recording extraction route: {str(e)}")
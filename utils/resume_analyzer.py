@@ -1,5 +1,12 @@
 import re
 
+from utils.extraction import join_pages, limit_pages
+from utils.extraction_cache import DOCX_EXTRACTOR_VERSION, get_extraction_cache, read_bytes
+from utils.pdf_router import cached_pdf_text
+
+# Characters read when detecting the document type; enough for any resume
+DETECT_MAX_CHARS = 20000
+
 class ResumeAnalyzer:
     def __init__(self):
         # Document type indicators
@@ -22,8 +29,11 @@ class ResumeAnalyzer:
             ]
         }
         
-    def detect_document_type(self, text):
-        text = text.lower()
+    def detect_document_type(self, text, max_chars=DETECT_MAX_CHARS):
+        """Document type of text, or of a stream of page texts read only up to max_chars"""
+        if not isinstance(text, str):
+            text = join_pages(limit_pages(text, max_pages=0, max_chars=max_chars))
+        text = text[:max_chars].lower()
         scores = {}
         
         # Calculate score for each document type
@@ -38,6 +48,10 @@ class ResumeAnalyzer:
         
         # Only return a document type if the score is significant
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
+
+    def detect_pdf_type(self, file):
+        """Document type of a PDF, from the cached extraction the analysis reuses"""
+        return self.detect_document_type(cached_pdf_text(read_bytes(file)))
         
     def calculate_keyword_match(self, resume_text, required_skills):
         resume_text = resume_text.lower()
@@ -119,43 +133,26 @@ class ResumeAnalyzer:
         
     def extract_text_from_pdf(self, file):
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            # First make sure we have the file content as bytes
-            if hasattr(file, 'read'):
-                # If it's already a file-like object, read it
-                file_content = file.read()
-                file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = file
-                
-            # Create BytesIO from bytes content
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            return cached_pdf_text(read_bytes(file))
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return get_extraction_cache().extract(
+                read_bytes(docx_file), 'resume_analyzer.docx', DOCX_EXTRACTOR_VERSION, self._docx_text
+            )
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
+    def _docx_text(self, file_content):
+        from docx import Document
+        import io
+
+        doc = Document(io.BytesIO(file_content))
+        return join_pages(limit_pages((paragraph.text for paragraph in doc.paragraphs), max_pages=0))
+
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
         # Basic patterns for personal info
@@ -450,7 +447,7 @@ class ResumeAnalyzer:
             # Extract personal information
             personal_info = self.extract_personal_info(text)
             
-            # First detect document type
+            # First detect document type, from the first DETECT_MAX_CHARS characters
             doc_type = self.detect_document_type(text)
             if doc_type != 'resume':
                 return {
@@ -1,47 +1,36 @@
-import pypdf
 import docx
 import re
 from io import BytesIO
 
+from utils.extraction import join_pages, limit_pages
+from utils.extraction_cache import DOCX_EXTRACTOR_VERSION, get_extraction_cache, read_bytes
+from utils.pdf_router import cached_pdf_text
+
+
 class ResumeParser:
     def __init__(self):
         pass
         
     def extract_text_from_pdf(self, pdf_file):
         try:
-            # Handle different file input types
-            if hasattr(pdf_file, 'read'):
-                # If it's a file-like object
-                file_content = pdf_file.read()
-                pdf_file.seek(0)  # Reset file pointer
-            else:
-                # If it's already bytes
-                file_content = pdf_file
-                
-            pdf_reader = pypdf.PdfReader(BytesIO(file_content))
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-                else:
-                    # Handle empty page text
-                    text += "\n"
-            return text.strip()
+            return cached_pdf_text(read_bytes(pdf_file))
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return get_extraction_cache().extract(
+                read_bytes(docx_file), 'resume_parser.docx', DOCX_EXTRACTOR_VERSION, self._docx_text
+            )
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
+
+    def _docx_text(self, file_content):
+        doc = docx.Document(BytesIO(file_content))
+        # DOCX has no pages; the paragraph stream is capped by characters and time only
+        return join_pages(limit_pages((paragraph.text for paragraph in doc.paragraphs), max_pages=0))
             
     def extract_text(self, file):
         # Reset file pointer to beginning